@@ -1,7 +1,15 @@
 import json
+import logging
+import os
 import sys
-from dataclasses import dataclass, asdict, field
+import time
+from dataclasses import dataclass, asdict, field, fields
+from functools import cached_property
 from pathlib import Path
+from typing import Any
+
+from .metrics import metrics
+from .persistence import DebouncedWriter, atomic_write
 
 if getattr(sys, 'frozen', False):
     # EXE mode
@@ -12,15 +20,31 @@ else:
     BASE_DIR = Path(__file__).resolve().parent.parent
     CONFIG_DIR = BASE_DIR / 'config'
 
+# Другой каталог настроек и данных. Бенчмарки и тесты не трогают файлы пользователя
+CONFIG_DIR_ENV = 'EYE_REMINDER_CONFIG_DIR'
+if os.environ.get(CONFIG_DIR_ENV):
+    CONFIG_DIR = Path(os.environ[CONFIG_DIR_ENV])
+
 APP_NAME = 'EyeReminder'
-CONFIG_DIR.mkdir(exist_ok=True)
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
 class PersistentSettings:
     timer_seconds: int = 3000       # 50 минут
+    # Заголовок и текст - шаблоны с переменными {cycle}, {elapsed}, {interval}, {time}
     notification_title: str = 'ВНИМАНИЕ'
     notification_text: str = 'Время истекло'
+    # Способы уведомления: tray, dbus, log
+    notification_backends: list[str] = field(default_factory=lambda: ['tray'])
+    # Рабочие часы: {"days": {"mon": [["09:00", "18:00"]], ...}, "holidays": ["2026-01-01"], "max_cycles": 8}.
+    # Пустой словарь - отсчет идет круглосуточно
+    work_hours: dict = field(default_factory=dict)
+    # Действия по истечении интервала: [{"name", "kind": "command" | "lock" | "http", "command", "url", "timeout"}, ...]
+    expiry_hooks: list[dict] = field(default_factory=list)
+    # Дополнительные напоминания: [{"name", "interval", "title", "text"}, ...]
+    reminders: list[dict] = field(default_factory=list)
 
 
 @dataclass(frozen=True)
@@ -41,6 +65,7 @@ class Tooltips:
     timer_stop: str = 'Остановка и обнуление таймера'
     save: str = 'Сохранить текущие настройки'
     tray_default: str = APP_NAME
+    tray_suspended: str = 'Вне рабочего времени'
 
 
 @dataclass(frozen=True)
@@ -90,11 +115,12 @@ class Config:
     tray_title: str = APP_NAME
     config_window_size: tuple[int, int] = (400, 300)
 
-    persistent: PersistentSettings = field(default_factory=PersistentSettings)
-    icons: IconPaths | None = None
     tooltips: Tooltips = Tooltips()
     labels: Labels = Labels()
 
+    # Отметка (mtime_ns, size) последней прочитанной или записанной версии файла
+    _signature: tuple[int, int] | None = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def config_file(self) -> Path:
         return CONFIG_DIR / self.config_filename
@@ -103,21 +129,95 @@ class Config:
     def icons_dir(self) -> Path:
         return self.base_dir / 'icons'
 
+    @cached_property
+    def persistent(self) -> PersistentSettings:
+        """ Загружается из файла при первом обращении, а не при импорте """
+        self.load()
+        return self.persistent
+
+    @cached_property
+    def icons(self) -> IconPaths:
+        """ Пути к иконкам вычисляются при первом обращении """
+        return get_icon_paths(self.icons_dir)
+
+    @cached_property
+    def writer(self) -> DebouncedWriter[bytes]:
+        """ Фоновая запись файла конфигурации, создается при первом сохранении """
+        return DebouncedWriter(self.write, name='config-writer')
+
     def save(self) -> None:
-        """ Сохраняет текущую конфигурацию в файл """
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            json.dump(asdict(self.persistent), f, ensure_ascii=False, indent=4)
+        """
+        Сохраняет текущую конфигурацию в файл.
+        Запись выполняется в фоновом потоке, частые сохранения объединяются
+        """
+        data = json.dumps(asdict(self.persistent), ensure_ascii=False, indent=4)
+        self.writer.submit(data.encode('utf-8'))
+
+    def write(self, data: bytes) -> None:
+        """ Атомарно записывает сериализованную конфигурацию """
+        begin = time.perf_counter()
+        atomic_write(self.config_file, data)
+        self._signature = self.file_signature()
+        metrics.observe_config_save(time.perf_counter() - begin)
+
+    def flush(self, timeout: float | None = 5.0) -> None:
+        """ Дожидается записи отложенных сохранений. Вызывается при выходе """
+        if 'writer' in self.__dict__ and not self.writer.flush(timeout):
+            logger.warning('Конфигурация не записана за %s с', timeout)
+
+    def file_signature(self) -> tuple[int, int] | None:
+        """ Время модификации и размер файла конфигурации. ``None`` - файла нет """
+        try:
+            stat = self.config_file.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def read(self) -> PersistentSettings:
+        """ Читает настройки из файла и запоминает его отметку """
+        signature = self.file_signature()
+        with open(self.config_file, 'r', encoding='utf-8') as f:
+            settings = PersistentSettings(**json.load(f))
+        self._signature = signature
+        return settings
 
     def load(self) -> None:
-        """ Загружает конфигурацию из файла. Если файла нет - создает его и заполняет текущими значениями """
+        """
+        Загружает конфигурацию из файла. Если файла нет - создает его и заполняет текущими значениями.
+        Поврежденный файл не перезаписывается, используются значения по умолчанию
+        """
 
         if self.config_file.exists():
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                self.persistent = PersistentSettings(**json.load(f))
+            try:
+                self.persistent = self.read()
+            except (ValueError, TypeError):
+                logger.exception('Не удалось прочитать %s', self.config_file)
+                self.persistent = PersistentSettings()
         else:
+            self.persistent = PersistentSettings()
             self.save()
 
+    def reload(self) -> dict[str, Any]:
+        """
+        Перечитывает файл, только если изменились его время модификации или размер.
+        Применяет к ``persistent`` только изменившиеся поля и возвращает их
+        """
+        if self.file_signature() in (None, self._signature):
+            return {}
+
+        try:
+            settings = self.read()
+        except (OSError, ValueError, TypeError):
+            logger.exception('Не удалось перечитать %s', self.config_file)
+            return {}
+
+        changes = {}
+        for settings_field in fields(PersistentSettings):
+            value = getattr(settings, settings_field.name)
+            if value != getattr(self.persistent, settings_field.name):
+                setattr(self.persistent, settings_field.name, value)
+                changes[settings_field.name] = value
+        return changes
+
 
 config: Config = Config()
-config.load()
-config.icons = get_icon_paths(config.icons_dir)
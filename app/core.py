@@ -1,37 +1,128 @@
+import logging
+from functools import lru_cache
+from pathlib import Path
+
 from PySide6.QtCore import Slot
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
     QSystemTrayIcon,
 )
-from PySide6.QtGui import QIcon
 
 from .config import config
-from .ui import UIContainer
+from .metrics import metrics
+from .profiling import profiler
+from .tracing import tracer
+from .ui import UIContainer, icons
 from .schemas import TimeInterval
-from .services import Countdown, Tray
+from .services import (
+    Checkpoint,
+    ConfigWatcher,
+    ControlServer,
+    Countdown,
+    HistoryStore,
+    HookRunner,
+    NotificationQueue,
+    Notifier,
+    Reminder,
+    ReminderScheduler,
+    TickMode,
+    Tray,
+)
+from .services.calendar import WorkCalendar
+from .services.checkpoint import CHECKPOINT_FILE
+from .services.clock import Clock
+from .services.hooks import load_hooks
+from .services.notifications import Backend, TrayBackend, create_backends
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=64)
+def remains_tooltip(minutes: int) -> str:
+    """ Текст тултипа трея для оставшихся минут (без учета часов) """
+    if minutes > 0:
+        return f'Осталось {minutes} мин.'
+    return 'Осталось менее 1 минуты'
 
 
 class EyeReminder(QMainWindow):
-    def __init__(self) -> None:
+    """
+    Главное окно настроек и связующее звено сервисов.
+
+    При запуске создаются только трей и обратный отсчет. Виджеты окна
+    настроек строятся при первом показе окна, до этого ``ui`` равен ``None``.
+
+    ``clock`` - часы обратного отсчета и напоминаний, по умолчанию реальные.
+    ``checkpoint_path`` - файл контрольной точки, ``None`` отключает ее.
+    Отключать нужно для часов, не связанных с реальным временем: их
+    календарное время не годится для дедлайна
+    """
+
+    def __init__(self, clock: Clock | None = None, checkpoint_path: Path | None = CHECKPOINT_FILE) -> None:
         super().__init__()
 
-        self.configure()
+        self.ui: UIContainer | None = None
 
-        self.countdown = Countdown()
-        self.connect_countdown()
+        self.countdown = Countdown(clock)
+
+        self.history = HistoryStore()
+        self.connect_history()
 
         self.tray = Tray()
         self.connect_tray()
 
+        self.tray_notifications = TrayBackend(self.tray.icon, icons.get('tray_message'))
+        self.notifications = NotificationQueue(self.notification_backends())
+        # Счетчики уведомлений обновляются раньше, чем слоты окна показывают уведомление
+        self.notifier = Notifier(self.countdown, self.notifications)
+        self.connect_countdown()
+
+        self.scheduler = ReminderScheduler(clock)
+        self.connect_scheduler()
+
+        self.hooks = HookRunner(load_hooks(config.persistent.expiry_hooks))
+        self.connect_hooks()
+
+        self.config_watcher = ConfigWatcher()
+        self.config_watcher.changed.connect(self.apply_config_changes)
+
+        self.control = ControlServer(self.countdown)
+        self.connect_control()
+
+        self.update_timer_displayer(self.countdown.remaining_seconds)
+        self.update_tick_mode()
+
+        # После подключения слотов: восстановленное состояние сразу отражается в трее
+        self.checkpoint = Checkpoint(self.countdown, checkpoint_path)
+        self.checkpoint.restore()
+        # Трасса начинается с восстановленного состояния
+        tracer.watch_countdown(self.countdown)
+
+        metrics.watch_countdown(self.countdown)
+        metrics.start()
+
+    def setVisible(self, visible: bool) -> None:
+        if visible and self.ui is None:
+            self.build_ui()
+        super().setVisible(visible)
+
+    def build_ui(self) -> None:
+        """ Строит окно настроек и приводит его в соответствие с обратным отсчетом """
+        self.configure()
+
         self.ui = UIContainer()
         self.connect_ui()
 
-        self.update_timer_displayer(self.countdown.remaining_seconds)
+        self.ui.timer_displayer.set_seconds(self.countdown.remaining_seconds)
+        if self.countdown.state_name != 'stopped':
+            self.ui.timer_adjuster.disable()
+        if self.countdown.state_name in ('pending', 'refreshing'):
+            self.ui.timer_displayer.set_active(True)
 
     def configure(self) -> None:
         self.setWindowTitle(config.app_title)
-        self.setWindowIcon(QIcon(config.icons.settings))
+        self.setWindowIcon(icons.get('settings'))
         self.resize(*config.config_window_size)
         self.center_window()
 
@@ -49,69 +140,173 @@ class EyeReminder(QMainWindow):
         config.save()
 
     def connect_countdown(self) -> None:
-        self.countdown.started.connect(self.countdown_started)
-        self.countdown.expired.connect(self.countdown_expired)
-        self.countdown.updated.connect(self.countdown_updated)
-        self.countdown.paused.connect(self.countdown_paused)
-        self.countdown.stopped.connect(self.countdown_stopped)
+        self.countdown.started.connect(profiler.wrap(self.countdown_started))
+        self.countdown.expired.connect(profiler.wrap(self.countdown_expired))
+        self.countdown.updated.connect(profiler.wrap(self.countdown_updated))
+        self.countdown.paused.connect(profiler.wrap(self.countdown_paused))
+        self.countdown.stopped.connect(profiler.wrap(self.countdown_stopped))
+        self.countdown.restarted.connect(profiler.wrap(self.countdown_restarted))
+        self.countdown.suspended.connect(profiler.wrap(self.countdown_suspended))
+        profiler.watch_timer(self.countdown)
+
+    def connect_history(self) -> None:
+        """ Каждый переход обратного отсчета попадает в журнал перерывов """
+        self.history.watch_countdown(self.countdown)
 
     def connect_controller(self) -> None:
-        self.ui.timer_controller.start.connect(self.countdown.on_start)
-        self.ui.timer_controller.pause.connect(self.countdown.on_pause)
-        self.ui.timer_controller.stop.connect(self.countdown.on_stop)
+        tracer.watch_controller(self.ui.timer_controller)
+        self.ui.timer_controller.start.connect(profiler.wrap(self.countdown.on_start))
+        self.ui.timer_controller.pause.connect(profiler.wrap(self.countdown.on_pause))
+        self.ui.timer_controller.stop.connect(profiler.wrap(self.countdown.on_stop))
 
     def connect_adjuster(self) -> None:
         self.ui.timer_adjuster.set_initial_time(self.countdown.interval)
-        self.ui.timer_adjuster.seconds_updated.connect(self.countdown.set_interval)
-        self.ui.timer_adjuster.seconds_updated.connect(self.update_timer_displayer)
+        tracer.watch_adjuster(self.ui.timer_adjuster)
+        self.ui.timer_adjuster.seconds_updated.connect(profiler.wrap(self.countdown.set_interval))
+        self.ui.timer_adjuster.seconds_updated.connect(profiler.wrap(self.update_timer_displayer))
 
     def connect_tray(self) -> None:
-        self.tray.icon.activated.connect(self.tray_icon_activated)
-        self.tray.menu.settings_action.triggered.connect(self.show)
-        self.tray.menu.timer_controller.start.connect(self.countdown.on_start)
-        self.tray.menu.timer_controller.pause.connect(self.countdown.on_pause)
-        self.tray.menu.timer_controller.stop.connect(self.countdown.on_stop)
+        self.tray.icon.activated.connect(profiler.wrap(self.tray_icon_activated))
+        self.tray.menu.timer_displayer.visibility_changed.connect(profiler.wrap(self.update_tick_mode))
+        self.tray.menu.settings_action.triggered.connect(profiler.wrap(self.show))
+        tracer.watch_controller(self.tray.menu.timer_controller)
+        self.tray.menu.timer_controller.start.connect(profiler.wrap(self.countdown.on_start))
+        self.tray.menu.timer_controller.pause.connect(profiler.wrap(self.countdown.on_pause))
+        self.tray.menu.timer_controller.stop.connect(profiler.wrap(self.countdown.on_stop))
         self.tray.menu.exit_action.triggered.connect(self.exit_app)
 
+    def connect_scheduler(self) -> None:
+        self.load_reminders()
+        self.scheduler.fired.connect(self.reminder_fired)
+
+    def connect_hooks(self) -> None:
+        """ Действия по истечении выполняются в пуле, остановка отсчета их отменяет """
+        self.countdown.expired.connect(self.hooks.run_all)
+        self.countdown.stopped.connect(self.hooks.cancel)
+        self.hooks.finished.connect(self.hook_finished)
+
+    def notification_backends(self) -> list[Backend]:
+        return create_backends(config.persistent.notification_backends, self.tray_notifications)
+
+    def load_reminders(self) -> None:
+        self.scheduler.clear()
+        for settings in config.persistent.reminders:
+            try:
+                self.scheduler.add(**settings)
+            except (TypeError, ValueError) as e:
+                logger.warning('Напоминание пропущено: %r (%s)', settings, e)
+
+    def connect_control(self) -> None:
+        """ Команды от повторных запусков и скриптов """
+        self.control.add_handler('show', lambda _: self.show_settings())
+        if profiler.enabled:
+            self.control.add_handler('profile', lambda _: {'profile': profiler.report(), 'icons': icons.report()})
+        self.control.listen()
+
     def connect_ui(self) -> None:
         self.ui.save_button.clicked.connect(self.save_preferences)
+        self.ui.timer_displayer.visibility_changed.connect(self.update_tick_mode)
         self.connect_controller()
         self.connect_adjuster()
         self.setCentralWidget(self.ui)
 
+    @Slot(dict)
+    def apply_config_changes(self, changes: dict) -> None:
+        """ Применяет только изменившиеся поля конфигурации, отредактированной извне """
+        if 'timer_seconds' in changes:
+            self.countdown.update_interval(changes['timer_seconds'])
+            if self.countdown.state_name == 'stopped':
+                self.update_timer_displayer(self.countdown.remaining_seconds)
+            if self.ui is not None:
+                self.ui.timer_adjuster.set_initial_time(TimeInterval.from_seconds(changes['timer_seconds']))
+
+        if self.ui is not None:
+            if 'notification_title' in changes:
+                self.ui.title_editor.setText(changes['notification_title'])
+            if 'notification_text' in changes:
+                self.ui.text_editor.setPlainText(changes['notification_text'])
+
+        if 'reminders' in changes:
+            self.load_reminders()
+
+        if 'work_hours' in changes:
+            calendar = WorkCalendar.from_settings(changes['work_hours'])
+            # Циклы, пройденные сегодня, учитываются и новым лимитом
+            if calendar is not None and self.countdown.calendar is not None:
+                calendar.restore_cycles(*self.countdown.calendar.cycles_record())
+            self.countdown.calendar = calendar
+
+        if 'expiry_hooks' in changes:
+            self.hooks.hooks = load_hooks(changes['expiry_hooks'])
+
+        if 'notification_backends' in changes:
+            self.notifications.backends = self.notification_backends()
+
     @Slot()
     def countdown_started(self) -> None:
-        self.tray.icon.setIcon(QIcon(config.icons.tray_active))
-        self.ui.timer_adjuster.disable()
-        self.ui.timer_displayer.set_active(True)
+        self.tray.set_progress(self.countdown.remaining_seconds, self.countdown.interval.total_seconds)
+        if self.ui is not None:
+            self.ui.timer_adjuster.disable()
+            self.ui.timer_displayer.set_active(True)
 
     @Slot()
     def countdown_expired(self) -> None:
         self.notify()
 
+    @Slot(object)
+    def reminder_fired(self, reminder: Reminder) -> None:
+        self.notifier.notify(reminder.title, reminder.text)
+
+    @Slot(str, str, str)
+    def hook_finished(self, name: str, status: str, detail: str) -> None:
+        """ Об ошибках действий сообщается уведомлением, отмена и пропуск только пишутся в журнал """
+        if status in ('ok', 'cancelled', 'skipped'):
+            logger.info('Действие %s: %s %s', name, status, detail)
+        else:
+            logger.warning('Действие %s: %s %s', name, status, detail)
+            self.notifier.notify(f'Действие {name}', f'{status}: {detail}')
+
     @Slot(int)
     def countdown_updated(self, seconds_left: int) -> None:
         self.update_timer_displayer(seconds_left)
         self.update_tray_tooltip(seconds_left)
+        self.tray.set_progress(seconds_left, self.countdown.interval.total_seconds)
 
     @Slot()
     def countdown_paused(self) -> None:
-        self.tray.icon.setIcon(QIcon(config.icons.tray_message))
-        self.ui.timer_displayer.set_active(False)
+        self.tray.set_icon('tray_message')
+        if self.ui is not None:
+            self.ui.timer_displayer.set_active(False)
 
     @Slot()
     def countdown_stopped(self) -> None:
-        self.tray.icon.setIcon(QIcon(config.icons.tray_inactive))
+        self.tray.set_icon('tray_inactive')
         self.update_timer_displayer(self.countdown.interval.total_seconds)
         self.update_tray_tooltip(-1)
-        self.ui.timer_displayer.set_active(False)
-        self.ui.timer_adjuster.enable()
+        if self.ui is not None:
+            self.ui.timer_displayer.set_active(False)
+            self.ui.timer_adjuster.enable()
+
+    @Slot()
+    def countdown_restarted(self) -> None:
+        """ Новый цикл: иконки и доступность кнопок не меняются, обновляется только остаток """
+        self.countdown_updated(self.countdown.remaining_seconds)
+
+    @Slot()
+    def countdown_suspended(self) -> None:
+        """ Вне рабочих часов: отсчет ждет следующего окна с полным интервалом """
+        self.tray.set_icon('tray_inactive')
+        self.update_timer_displayer(self.countdown.interval.total_seconds)
+        self.tray.set_tooltip(config.tooltips.tray_suspended)
+        if self.ui is not None:
+            self.ui.timer_displayer.set_active(False)
 
     @Slot(int)
     def update_timer_displayer(self, seconds_left: int) -> None:
-        remains = TimeInterval.from_seconds(seconds_left)
-        self.ui.timer_displayer.display(remains.string)
-        self.tray.menu.timer_displayer.display(remains.string)
+        """ Скрытые дисплеи только запоминают значение и догоняют его при показе """
+        if self.ui is not None:
+            self.ui.timer_displayer.set_seconds(seconds_left)
+        self.tray.menu.timer_displayer.set_seconds(seconds_left)
 
     @Slot(int)
     def update_tray_tooltip(self, seconds_left: int) -> None:
@@ -120,24 +315,46 @@ class EyeReminder(QMainWindow):
         :param seconds_left: передать ``-1`` - вернуть тултип по умолчанию
         """
         if seconds_left < 0:
-            self.tray.icon.setToolTip(config.tooltips.tray_default)
+            self.tray.set_tooltip(config.tooltips.tray_default)
             return
 
-        remains = TimeInterval.from_seconds(seconds_left)
-        if remains.minutes > 0:
-            tooltip = f'Осталось {remains.minutes} мин.'
-        else:
-            tooltip = 'Осталось менее 1 минуты'
+        self.tray.set_tooltip(remains_tooltip((seconds_left % 3600) // 60))
+
+    @Slot()
+    def update_tick_mode(self) -> None:
+        """
+        Посекундные тики нужны, только пока виден хотя бы один дисплей.
+        Иначе достаточно тултипа трея, который показывает минуты
+        """
+        displayers = [self.tray.menu.timer_displayer]
+        if self.ui is not None:
+            displayers.append(self.ui.timer_displayer)
 
-        self.tray.icon.setToolTip(tooltip)
+        if any(displayer.is_shown for displayer in displayers):
+            self.countdown.set_tick_mode(TickMode.SECOND)
+        else:
+            self.countdown.set_tick_mode(TickMode.MINUTE)
+        tracer.record('input.tick_mode', self.countdown.tick_mode.value)
 
     def notify(self) -> None:
-        self.tray.icon.showMessage(
-            self.ui.title_editor.text(),
-            self.ui.text_editor.toPlainText(),
-            QIcon(config.icons.tray_message),
-            3000,
-        )
+        """
+        Текст уведомления берется из редакторов окна, если оно уже построено.
+        Показ не блокирует тик: уведомление доставляется из очереди в фоновом потоке
+        """
+        if self.ui is not None:
+            title = self.ui.title_editor.text()
+            text = self.ui.text_editor.toPlainText()
+        else:
+            title = config.persistent.notification_title
+            text = config.persistent.notification_text
+
+        self.notifier.notify(title, text)
+
+    @Slot()
+    def show_settings(self) -> None:
+        self.show()
+        self.raise_()
+        self.activateWindow()
 
     def tray_icon_activated(self, reason: str) -> None:
         if reason == QSystemTrayIcon.DoubleClick:
@@ -145,5 +362,14 @@ class EyeReminder(QMainWindow):
 
     @Slot()
     def exit_app(self):
+        self.hooks.shutdown()
+        self.notifications.close()
         self.tray.icon.hide()
+        self.control.close()
+        self.checkpoint.flush()
+        self.history.flush()
+        config.flush()
+        profiler.dump()
+        tracer.close()
+        metrics.close()
         QApplication.quit()
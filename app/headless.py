@@ -0,0 +1,108 @@
+import logging
+import signal
+import socket
+import sys
+
+from PySide6.QtCore import QCoreApplication, QSocketNotifier
+
+from app.config import config
+from app.metrics import metrics
+from app.services.checkpoint import Checkpoint
+from app.services.control import ControlServer
+from app.services.countdown import Countdown, TickMode
+from app.services.history import HistoryStore
+from app.services.hooks import HookRunner, load_hooks
+from app.services.notifications import LogBackend, NotificationQueue, Notifier, create_backends
+
+logger = logging.getLogger(__name__)
+
+
+class HeadlessReminder:
+    """
+    Обратный отсчет без виджетов и ``QApplication``.
+
+    Управляется через ``ControlServer``, уведомления пишутся в журнал
+    и доставляются настроенными способами, кроме трея.
+    Промежуточный остаток никто не видит, поэтому процесс просыпается
+    только в момент истечения, а ``status`` вычисляет остаток по дедлайну
+    """
+
+    def __init__(self) -> None:
+        self.countdown = Countdown()
+        self.countdown.set_tick_mode(TickMode.DEADLINE)
+
+        self.notifications = NotificationQueue([
+            LogBackend(),
+            *create_backends(config.persistent.notification_backends),
+        ])
+        self.notifier = Notifier(self.countdown, self.notifications)
+        self.countdown.expired.connect(self.notify)
+
+        self.history = HistoryStore()
+        self.history.watch_countdown(self.countdown)
+
+        self.hooks = HookRunner(load_hooks(config.persistent.expiry_hooks))
+        self.countdown.expired.connect(self.hooks.run_all)
+        self.countdown.stopped.connect(self.hooks.cancel)
+        self.hooks.finished.connect(
+            lambda name, status, detail: logger.info('Действие %s: %s %s', name, status, detail)
+        )
+
+        self.control = ControlServer(self.countdown)
+
+        self.checkpoint = Checkpoint(self.countdown)
+        self.checkpoint.restore()
+
+        metrics.watch_countdown(self.countdown)
+
+    def notify(self) -> None:
+        self.notifier.notify(config.persistent.notification_title, config.persistent.notification_text)
+
+
+def install_signal_handlers(app: QCoreApplication) -> None:
+    """
+    Ctrl+C и SIGTERM штатно завершают цикл событий.
+
+    Пока Qt ждет событий, обработчики Python не выполняются. Вместо
+    периодического таймера сигнал будит цикл через ``set_wakeup_fd``
+    """
+    read_socket, write_socket = socket.socketpair()
+    read_socket.setblocking(False)
+    write_socket.setblocking(False)
+    signal.set_wakeup_fd(write_socket.fileno())
+
+    notifier = QSocketNotifier(read_socket.fileno(), QSocketNotifier.Read, app)
+    notifier.activated.connect(lambda: read_socket.recv(64))
+    # Сокеты должны жить столько же, сколько приложение
+    app.signal_sockets = (read_socket, write_socket)
+
+    signal.signal(signal.SIGINT, lambda *_: app.quit())
+    signal.signal(signal.SIGTERM, lambda *_: app.quit())
+
+
+def run_headless(argv: list[str]) -> int:
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+
+    app = QCoreApplication(argv)
+    install_signal_handlers(app)
+
+    reminder = HeadlessReminder()
+    if not reminder.control.listen():
+        logger.error('Экземпляр уже запущен: %s', reminder.control.name)
+        return 1
+    logger.info('Управление через локальный сокет %s', reminder.control.name)
+    metrics.start()
+
+    code = app.exec()
+    reminder.hooks.shutdown()
+    reminder.notifications.close()
+    reminder.control.close()
+    reminder.checkpoint.flush()
+    reminder.history.flush()
+    config.flush()
+    metrics.close()
+    return code
+
+
+if __name__ == '__main__':
+    sys.exit(run_headless(sys.argv))
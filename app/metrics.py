@@ -0,0 +1,231 @@
+import logging
+import os
+import threading
+from bisect import bisect_left
+from pathlib import Path
+from typing import Callable
+
+from .persistence import atomic_write
+from .startup import peak_rss_bytes, rss_bytes
+
+# Номер порта - HTTP на 127.0.0.1, иначе путь к текстовому файлу для node-exporter
+METRICS_ENV = 'EYE_REMINDER_METRICS'
+
+# Период перезаписи текстового файла, сек
+TEXTFILE_INTERVAL = 15.0
+
+PREFIX = 'eye_reminder'
+
+STATES = ('stopped', 'pending', 'paused', 'refreshing', 'suspended')
+
+# События отсчета, которые считаются счетчиком ``countdown_events_total``
+COUNTED_EVENTS = ('started', 'expired', 'paused', 'stopped', 'restarted', 'suspended')
+
+logger = logging.getLogger(__name__)
+
+
+class Histogram:
+    """
+    Гистограмма Prometheus. ``observe`` только увеличивает число в корзине
+    и сумму, накопительные значения считаются при выдаче
+    """
+
+    __slots__ = ('bounds', 'buckets', 'sum')
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        # Последняя корзина - ``+Inf``
+        self.buckets = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    def render(self, name: str) -> list[str]:
+        buckets = list(self.buckets)
+        lines = []
+        total = 0
+        for bound, count in zip((*map(str, self.bounds), '+Inf'), buckets):
+            total += count
+            lines.append(f'{name}_bucket{{le="{bound}"}} {total}')
+        lines.append(f'{name}_sum {self.sum}')
+        lines.append(f'{name}_count {total}')
+        return lines
+
+
+class Metrics:
+    """
+    Счетчики и датчики в текстовом формате Prometheus.
+
+    Включается переменной окружения ``METRICS_ENV``. Выключенные метрики
+    ничего не подключают и не запускают потоков.
+
+    На пути тика метрики только увеличивают числа в атрибутах: у каждого
+    счетчика один пишущий поток, поэтому блокировки не нужны. Текст
+    собирается только при запросе - в потоке HTTP-сервера на ``127.0.0.1``
+    или в потоке, который раз в ``TEXTFILE_INTERVAL`` атомарно
+    перезаписывает файл для textfile collector node-exporter
+    """
+
+    def __init__(self, target: str | None = None) -> None:
+        self.enabled = bool(target)
+        self.target = target
+
+        self.ticks = 0
+        self.tick_lateness = Histogram((0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 60.0))
+        self.events = dict.fromkeys(COUNTED_EVENTS, 0)
+        self.config_save = Histogram((0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0))
+
+        self._countdown = None
+        self._server = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_env(cls) -> 'Metrics':
+        return cls(os.environ.get(METRICS_ENV))
+
+    def watch_countdown(self, countdown) -> None:
+        """ Тики и опоздания ``Countdown.timer``, переходы отсчета, состояние и остаток при выдаче """
+        if not self.enabled:
+            return
+
+        self._countdown = countdown
+        update = countdown.timer.callback
+
+        def on_timeout() -> None:
+            # Опоздание считается раньше обработки тика, которая планирует следующий
+            if countdown.tick_due is not None:
+                self.tick_lateness.observe(max(0.0, countdown.clock.now() - countdown.tick_due))
+            self.ticks += 1
+            update()
+
+        countdown.timer.callback = on_timeout
+        for event in COUNTED_EVENTS:
+            getattr(countdown, event).connect(self.counter(event))
+
+    def counter(self, event: str) -> Callable[[], None]:
+        def increment() -> None:
+            self.events[event] += 1
+        return increment
+
+    def observe_config_save(self, seconds: float) -> None:
+        """ Вызывается из потока записи конфигурации """
+        if self.enabled:
+            self.config_save.observe(seconds)
+
+    def render(self) -> str:
+        lines = []
+
+        def metric(name: str, kind: str, help_text: str, values: list[str]) -> None:
+            lines.append(f'# HELP {PREFIX}_{name} {help_text}')
+            lines.append(f'# TYPE {PREFIX}_{name} {kind}')
+            lines.extend(f'{PREFIX}_{value}' for value in values)
+
+        metric('ticks_total', 'counter', 'Обработанные тики обратного отсчета', [f'ticks_total {self.ticks}'])
+        metric(
+            'tick_lateness_seconds', 'histogram', 'Опоздание тика относительно планового момента',
+            self.tick_lateness.render('tick_lateness_seconds'),
+        )
+        metric('countdown_events_total', 'counter', 'Переходы обратного отсчета', [
+            f'countdown_events_total{{event="{event}"}} {count}' for event, count in self.events.items()
+        ])
+
+        countdown = self._countdown
+        if countdown is not None:
+            state = countdown.state_name
+            metric('countdown_state', 'gauge', 'Текущее состояние отсчета', [
+                f'countdown_state{{state="{name}"}} {int(name == state)}' for name in STATES
+            ])
+            metric('countdown_remaining_seconds', 'gauge', 'Оставшееся время', [
+                f'countdown_remaining_seconds {max(0.0, countdown.time_left())}'
+            ])
+
+        metric(
+            'config_save_seconds', 'histogram', 'Длительность записи конфигурации',
+            self.config_save.render('config_save_seconds'),
+        )
+
+        rss, peak = rss_bytes(), peak_rss_bytes()
+        if rss is not None:
+            lines += [
+                '# HELP process_resident_memory_bytes Резидентная память процесса',
+                '# TYPE process_resident_memory_bytes gauge',
+                f'process_resident_memory_bytes {rss}',
+            ]
+        if peak is not None:
+            metric('peak_resident_memory_bytes', 'gauge', 'Пиковая резидентная память процесса', [
+                f'peak_resident_memory_bytes {peak}'
+            ])
+        return '\n'.join(lines) + '\n'
+
+    def start(self) -> None:
+        """ Запускает HTTP-сервер или перезапись файла """
+        if not self.enabled or self._thread is not None:
+            return
+
+        if self.target.isdigit():
+            self._thread = self._serve(int(self.target))
+        else:
+            self._thread = threading.Thread(
+                target=self._write_loop, args=(Path(self.target),), name='metrics-textfile', daemon=True,
+            )
+            self._thread.start()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    def _serve(self, port: int) -> threading.Thread | None:
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                logger.debug(format, *args)
+
+        try:
+            self._server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        except OSError:
+            logger.exception('Не удалось открыть порт метрик %s', port)
+            return None
+
+        thread = threading.Thread(target=self._server.serve_forever, name='metrics-http', daemon=True)
+        thread.start()
+        logger.info('Метрики: http://127.0.0.1:%s/metrics', port)
+        return thread
+
+    def _write_loop(self, path: Path) -> None:
+        """ Выполняется в фоновом потоке. Последняя запись - при закрытии """
+        logger.info('Метрики: %s', path)
+        stopping = False
+        while True:
+            try:
+                atomic_write(path, self.render().encode('utf-8'))
+            except OSError:
+                logger.exception('Не удалось записать метрики в %s', path)
+            if stopping:
+                return
+            stopping = self._stop.wait(TEXTFILE_INTERVAL)
+
+
+metrics = Metrics.from_env()
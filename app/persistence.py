@@ -0,0 +1,120 @@
+import logging
+import os
+import stat
+import tempfile
+import threading
+import time
+from contextlib import suppress
+from pathlib import Path
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+# Маска прав процесса. Читается один раз при импорте: ``os.umask`` без смены значения не прочитать
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """
+    Записывает файл целиком или не записывает вовсе.
+
+    Данные пишутся во временный файл в том же каталоге и подменяют
+    исходный через ``os.replace``, поэтому падение посреди записи
+    не оставляет обрезанный файл. Права исходного файла сохраняются,
+    новый файл получает обычные права с учетом umask, а не 0600 от ``mkstemp``
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+class DebouncedWriter[T]:
+    """
+    Выполняет запись в фоновом потоке.
+
+    Запросы, пришедшие в течение ``delay`` секунд после первого,
+    объединяются: записывается только последнее значение.
+    Поток создается при первом запросе
+    """
+
+    def __init__(self, write: Callable[[T], None], delay: float = 0.5, name: str = 'writer') -> None:
+        self._write = write
+        self._delay = delay
+        self._name = name
+
+        self._condition = threading.Condition()
+        self._pending: T | None = None
+        self._has_pending = False
+        self._due = 0.0
+        self._flush_requested = False
+        self._busy = False
+        self._thread: threading.Thread | None = None
+
+    def submit(self, payload: T) -> None:
+        """ Ставит значение в очередь на запись, не блокируя вызывающий поток """
+        with self._condition:
+            if not self._has_pending:
+                self._due = time.monotonic() + self._delay
+            self._pending = payload
+            self._has_pending = True
+            self._ensure_thread()
+            self._condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Немедленно записывает отложенное значение и ждет окончания записи.
+        :return: ``False``, если запись не завершилась за ``timeout``
+        """
+        with self._condition:
+            if not self._has_pending and not self._busy:
+                return True
+            self._flush_requested = True
+            self._condition.notify_all()
+            return self._condition.wait_for(lambda: not self._has_pending and not self._busy, timeout)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    if self._has_pending:
+                        timeout = self._due - time.monotonic()
+                        if self._flush_requested or timeout <= 0:
+                            break
+                    else:
+                        timeout = None
+                    self._condition.wait(timeout)
+
+                payload = self._pending
+                self._pending = None
+                self._has_pending = False
+                self._flush_requested = False
+                self._busy = True
+
+            try:
+                self._write(payload)
+            except Exception:
+                logger.exception('Ошибка фоновой записи (%s)', self._name)
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
@@ -0,0 +1,147 @@
+import inspect
+import json
+import logging
+import os
+import time
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from typing import Any, Callable
+
+# ``memory`` - только кольцевой буфер в памяти, иначе путь к файлу отчетов (с ротацией)
+PROFILE_ENV = 'EYE_REMINDER_PROFILE'
+
+# Корзины гистограммы: степени двойки в микросекундах, последняя - все, что дольше
+BUCKETS = 24
+
+
+class LatencyStats:
+    """ Число вызовов и гистограмма длительностей одного слота """
+
+    __slots__ = ('count', 'total_ns', 'max_ns', 'buckets')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * BUCKETS
+
+    def add(self, duration_ns: int) -> None:
+        self.count += 1
+        self.total_ns += duration_ns
+        self.max_ns = max(self.max_ns, duration_ns)
+        self.buckets[min((duration_ns // 1000).bit_length(), BUCKETS - 1)] += 1
+
+    def to_json(self) -> dict[str, Any]:
+        # Ключ - верхняя граница корзины в мкс
+        histogram = {f'<{1 << index}us': count for index, count in enumerate(self.buckets) if count}
+        return {
+            'count': self.count,
+            'mean_us': self.total_ns / self.count / 1000 if self.count else 0.0,
+            'max_us': self.max_ns / 1000,
+            'histogram': histogram,
+        }
+
+
+def slot_arity(slot: Callable) -> int | None:
+    """
+    Число позиционных аргументов слота. ``None`` - принимает любое число.
+    Встроенные слоты Qt (``show``, ``hide``) сигнатуры не имеют и вызываются без аргументов
+    """
+    try:
+        parameters = inspect.signature(slot).parameters.values()
+    except ValueError:
+        return 0
+
+    if any(parameter.kind is inspect.Parameter.VAR_POSITIONAL for parameter in parameters):
+        return None
+    return sum(
+        parameter.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        for parameter in parameters
+    )
+
+
+class SlotProfiler:
+    """
+    Замер задержек слотов и дрожания тиков обратного отсчета.
+
+    Включается переменной окружения ``PROFILE_ENV``. Выключенный профайлер
+    возвращает слоты из ``wrap`` без изменений и не трогает таймер,
+    поэтому соединения работают так же, как без него.
+
+    Включенный считает вызовы и строит гистограмму длительностей по
+    каждому слоту, последние замеры хранит в кольцевом буфере, а ``dump``
+    дописывает сводку в файл с ротацией
+    """
+
+    def __init__(self, target: str | None = None, ring_size: int = 4096) -> None:
+        self.enabled = bool(target)
+        self.stats: dict[str, LatencyStats] = {}
+        # Последние замеры: (время perf_counter_ns, имя, длительность нс)
+        self.samples: deque[tuple[int, str, int]] = deque(maxlen=ring_size)
+        self._file_logger: logging.Logger | None = None
+
+        if target and target != 'memory':
+            self._file_logger = logging.getLogger(f'{__name__}.report')
+            self._file_logger.propagate = False
+            self._file_logger.setLevel(logging.INFO)
+            self._file_logger.addHandler(
+                RotatingFileHandler(target, maxBytes=1 << 20, backupCount=3, encoding='utf-8')
+            )
+
+    @classmethod
+    def from_env(cls) -> 'SlotProfiler':
+        return cls(os.environ.get(PROFILE_ENV))
+
+    def record(self, name: str, duration_ns: int) -> None:
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = LatencyStats()
+        stats.add(duration_ns)
+        self.samples.append((time.perf_counter_ns(), name, duration_ns))
+
+    def wrap(self, slot: Callable, name: str | None = None) -> Callable:
+        """
+        Оборачивает слот замером длительности.
+        Лишние аргументы сигнала отбрасываются так же, как это делает Qt для слотов
+        """
+        if not self.enabled:
+            return slot
+
+        name = name or getattr(slot, '__qualname__', repr(slot))
+        arity = slot_arity(slot)
+
+        def profiled(*args):
+            begin = time.perf_counter_ns()
+            try:
+                return slot(*args[:arity])
+            finally:
+                self.record(name, time.perf_counter_ns() - begin)
+
+        return profiled
+
+    def watch_timer(self, countdown) -> None:
+        """ Дрожание тиков: насколько сработавший ``Countdown.timer`` разошелся с плановым моментом """
+        if not self.enabled:
+            return
+
+        update = self.wrap(countdown.timer.callback, 'Countdown.on_update')
+
+        def on_timeout() -> None:
+            # Замер идет раньше обработки тика, которая планирует следующий
+            if countdown.tick_due is not None:
+                jitter = countdown.clock.now() - countdown.tick_due
+                self.record('Countdown.timer.jitter', abs(round(jitter * 1e9)))
+            update()
+
+        countdown.timer.callback = on_timeout
+
+    def report(self) -> dict[str, dict[str, Any]]:
+        return {name: stats.to_json() for name, stats in sorted(self.stats.items())}
+
+    def dump(self) -> None:
+        """ Дописывает сводку в файл отчетов. В режиме ``memory`` ничего не делает """
+        if self._file_logger is not None and self.stats:
+            self._file_logger.info(json.dumps({'timestamp': time.time(), 'slots': self.report()}))
+
+
+profiler = SlotProfiler.from_env()
@@ -1,2 +1,27 @@
-from .tray import Tray
-from .countdown import Countdown
+from importlib import import_module
+
+# Сервисы импортируются при первом обращении: режиму без интерфейса
+# не нужны QtWidgets, которые подтягивает трей
+_EXPORTS = {
+    'Tray': '.tray',
+    'Countdown': '.countdown',
+    'TickMode': '.countdown',
+    'Reminder': '.scheduler',
+    'ReminderScheduler': '.scheduler',
+    'ConfigWatcher': '.config_watcher',
+    'ControlServer': '.control',
+    'SingleInstance': '.instance',
+    'HistoryStore': '.history',
+    'Checkpoint': '.checkpoint',
+    'HookRunner': '.hooks',
+    'NotificationQueue': '.notifications',
+    'Notifier': '.notifications',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    return getattr(import_module(_EXPORTS[name], __name__), name)
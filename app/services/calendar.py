@@ -0,0 +1,143 @@
+import logging
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta
+from typing import Any, Iterable
+
+WEEKDAYS = ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun')
+
+DAY_SECONDS = 24 * 3600
+
+logger = logging.getLogger(__name__)
+
+# Дальше этого горизонта (например, за длинной цепочкой праздников) окно не ищется
+HORIZON_DAYS = 366
+
+
+def parse_clock_time(value: str) -> int:
+    """ ``'ЧЧ:ММ'`` -> секунды от полуночи. ``'24:00'`` - конец суток """
+    hours, minutes = value.split(':')
+    seconds = int(hours) * 3600 + int(minutes) * 60
+    if not 0 <= seconds <= DAY_SECONDS:
+        raise ValueError(f'Недопустимое время: {value}')
+    return seconds
+
+
+def merge_windows(windows: Iterable[tuple[int, int]]) -> tuple[tuple[int, int], ...]:
+    """ Сортирует окна и склеивает пересекающиеся и смежные """
+    merged: list[list[int]] = []
+    for start, end in sorted(windows):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return tuple((start, end) for start, end in merged)
+
+
+class WorkCalendar:
+    """
+    Рабочие часы по дням недели, праздники и лимит циклов в день.
+
+    Окна разбираются один раз в индекс: по каждому дню недели -
+    отсортированные начала и концы окон в секундах от полуночи. Поиск
+    ближайшего окна - бинарный поиск внутри дня и переход по дням, а не
+    перебор времени. Окно через полночь (``22:00-02:00``) делится на два дня
+    """
+
+    def __init__(
+            self,
+            days: dict[str, list[tuple[str, str]]],
+            holidays: Iterable[date] = (),
+            max_cycles: int = 0,
+    ) -> None:
+        windows: list[list[tuple[int, int]]] = [[] for _ in WEEKDAYS]
+        for day, day_windows in days.items():
+            weekday = WEEKDAYS.index(day)
+            for start, end in day_windows:
+                start, end = parse_clock_time(start), parse_clock_time(end)
+                if start < end:
+                    windows[weekday].append((start, end))
+                elif start > end:
+                    windows[weekday].append((start, DAY_SECONDS))
+                    windows[(weekday + 1) % 7].append((0, end))
+
+        # Индекс: по дню недели - начала и концы непересекающихся окон
+        self._starts: list[list[int]] = []
+        self._ends: list[list[int]] = []
+        for day_windows in windows:
+            merged = merge_windows(day_windows)
+            self._starts.append([start for start, _ in merged])
+            self._ends.append([end for _, end in merged])
+
+        self.holidays = frozenset(holidays)
+        self.max_cycles = max_cycles
+        # Число циклов за день ``_cycles_day``
+        self._cycles_day: date | None = None
+        self._cycles = 0
+
+    @classmethod
+    def from_settings(cls, settings: dict[str, Any]) -> 'WorkCalendar | None':
+        """
+        ``{"days": {"mon": [["09:00", "18:00"]], ...}, "holidays": ["2026-01-01"], "max_cycles": 8}``.
+        Пустые или ошибочные настройки - календаря нет, отсчет идет круглосуточно
+        """
+        if not settings:
+            return None
+        try:
+            return cls(
+                days=settings.get('days') or {day: [('00:00', '24:00')] for day in WEEKDAYS},
+                holidays=[date.fromisoformat(day) for day in settings.get('holidays', ())],
+                max_cycles=int(settings.get('max_cycles', 0)),
+            )
+        except (ValueError, TypeError, AttributeError):
+            logger.exception('Не удалось разобрать рабочие часы: %r', settings)
+            return None
+
+    def next_start(self, moment: datetime) -> datetime | None:
+        """ ``moment``, если он внутри рабочего окна, иначе начало ближайшего окна. ``None`` - окон нет """
+        day = moment.date()
+        seconds = (moment - datetime.combine(day, time())).total_seconds()
+
+        for offset in range(HORIZON_DAYS):
+            current = day + timedelta(days=offset)
+            if current in self.holidays:
+                continue
+
+            starts, ends = self._starts[current.weekday()], self._ends[current.weekday()]
+            index = 0
+            if offset == 0:
+                index = bisect_right(ends, seconds)
+                if index < len(starts) and starts[index] <= seconds:
+                    return moment
+            if index < len(starts):
+                return datetime.combine(current, time()) + timedelta(seconds=starts[index])
+        return None
+
+    def is_active(self, moment: datetime) -> bool:
+        return self.next_start(moment) == moment
+
+    def cycles(self, day: date) -> int:
+        return self._cycles if day == self._cycles_day else 0
+
+    def record_cycle(self, moment: datetime) -> None:
+        day = moment.date()
+        self._cycles = self.cycles(day) + 1
+        self._cycles_day = day
+
+    def cycles_record(self) -> tuple[date | None, int]:
+        """ День и число циклов за него - сохраняются между запусками """
+        return self._cycles_day, self._cycles
+
+    def restore_cycles(self, day: date | None, cycles: int) -> None:
+        if day is not None:
+            self._cycles_day, self._cycles = day, cycles
+
+    def next_cycle_start(self, moment: datetime) -> datetime | None:
+        """ Ближайший момент, когда цикл будет разрешен. ``None`` - окон нет """
+        if self.max_cycles and self.cycles(moment.date()) >= self.max_cycles:
+            # Лимит на сегодня исчерпан - следующее окно не раньше завтрашнего дня
+            moment = datetime.combine(moment.date() + timedelta(days=1), time())
+        return self.next_start(moment)
+
+    def allows_cycle(self, moment: datetime) -> bool:
+        """ Можно ли начать цикл: рабочее время и лимит циклов за день не исчерпан """
+        return self.next_cycle_start(moment) == moment
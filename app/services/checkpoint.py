@@ -0,0 +1,187 @@
+import logging
+import os
+import struct
+import zlib
+from datetime import date
+from pathlib import Path
+from typing import NamedTuple
+
+from app.config import CONFIG_DIR
+from app.persistence import DebouncedWriter
+from .countdown import Countdown
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'ERCP'
+VERSION = 2
+
+# Слот: метка, версия, состояние, номер записи, интервал (сек), остаток (сек),
+# дедлайн (unix, сек), день счетчика циклов (порядковый номер даты), число
+# циклов за этот день, CRC32 предыдущих полей - 44 байта
+SLOT = struct.Struct('<4sBBxxIIddIII')
+SLOTS = 2
+
+# Файл контрольной точки по умолчанию
+CHECKPOINT_FILE = CONFIG_DIR / 'countdown.checkpoint'
+
+STATE_CODES = {'stopped': 0, 'pending': 1, 'paused': 2, 'refreshing': 3, 'suspended': 4}
+STATE_NAMES = {code: name for name, code in STATE_CODES.items()}
+
+
+class Snapshot(NamedTuple):
+    state: str
+    interval: int
+    # Остаток для паузы и остановки, сек
+    remaining: float
+    # Дедлайн идущего отсчета по календарному времени. ``0`` - отсчет не идет
+    deadline: float
+    # Счетчик циклов рабочего календаря: ``date.toordinal()`` дня (``0`` - нет) и число циклов
+    cycles_day: int = 0
+    cycles: int = 0
+    sequence: int = 0
+
+
+def pack(snapshot: Snapshot) -> bytes:
+    head = SLOT.pack(
+        MAGIC, VERSION, STATE_CODES[snapshot.state], snapshot.sequence,
+        snapshot.interval, snapshot.remaining, snapshot.deadline,
+        snapshot.cycles_day, snapshot.cycles, 0,
+    )[:-4]
+    return head + struct.pack('<I', zlib.crc32(head))
+
+
+def unpack(data: bytes) -> Snapshot | None:
+    """ ``None`` - слот пустой, недописан или от другой версии """
+    if len(data) != SLOT.size:
+        return None
+    magic, version, state, sequence, interval, remaining, deadline, cycles_day, cycles, crc = SLOT.unpack(data)
+    if magic != MAGIC or version != VERSION or crc != zlib.crc32(data[:-4]) or state not in STATE_NAMES:
+        return None
+    return Snapshot(STATE_NAMES[state], interval, remaining, deadline, cycles_day, cycles, sequence)
+
+
+class Checkpoint:
+    """
+    Контрольная точка обратного отсчета: состояние и дедлайн в файле фиксированного размера.
+
+    Файл - два слота по 44 байта, записи идут в них по очереди и защищены
+    CRC. Недописанный при аварии слот отбрасывается при чтении, и
+    используется предыдущий. Дедлайн меняется только на переходах, поэтому
+    тики файл не трогают, а переходы записываются в фоновом потоке не чаще
+    раза в ``delay`` секунд.
+
+    ``restore`` при запуске продолжает отсчет с учетом времени, которое
+    приложение не работало: идущий отсчет - по календарному дедлайну,
+    пауза - с сохраненного остатка. Вместе с отсчетом сохраняется счетчик
+    циклов за день, чтобы перезапуск приложения не обнулял ``max_cycles``.
+
+    ``path=None`` отключает контрольную точку: она ничего не пишет и не
+    восстанавливает. Нужно для часов, не связанных с реальным временем,
+    например ``VirtualClock`` в бенчмарках и воспроизведении трасс
+    """
+
+    def __init__(self, countdown: Countdown, path: Path | None = CHECKPOINT_FILE, delay: float = 1.0) -> None:
+        self.countdown = countdown
+        self.path = path
+        self.enabled = path is not None
+        self._sequence = 0
+        self._writer: DebouncedWriter[Snapshot] = DebouncedWriter(self.write, delay=delay, name='checkpoint-writer')
+
+        if not self.enabled:
+            return
+        for signal in (
+                countdown.started, countdown.paused, countdown.stopped,
+                countdown.restarted, countdown.suspended,
+        ):
+            signal.connect(self.save)
+
+    def snapshot(self) -> Snapshot:
+        countdown = self.countdown
+        left = countdown.time_left()
+        deadline = countdown.clock.wall() + left if countdown.running else 0.0
+        cycles_day, cycles = None, 0
+        if countdown.calendar is not None:
+            cycles_day, cycles = countdown.calendar.cycles_record()
+        return Snapshot(
+            countdown.state_name, countdown.interval.total_seconds, max(0.0, left), deadline,
+            cycles_day.toordinal() if cycles_day else 0, cycles,
+        )
+
+    def save(self) -> None:
+        self._writer.submit(self.snapshot())
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        return self._writer.flush(timeout)
+
+    def read(self) -> Snapshot | None:
+        """ Последняя целая запись из двух слотов """
+        if not self.enabled:
+            return None
+        try:
+            data = self.path.read_bytes()
+        except OSError:
+            return None
+
+        snapshots = [
+            snapshot for offset in range(0, SLOTS * SLOT.size, SLOT.size)
+            if (snapshot := unpack(data[offset:offset + SLOT.size])) is not None
+        ]
+        return max(snapshots, key=lambda snapshot: snapshot.sequence, default=None)
+
+    def write(self, snapshot: Snapshot) -> None:
+        """ Выполняется в фоновом потоке """
+        self._sequence += 1
+        data = pack(snapshot._replace(sequence=self._sequence))
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            os.lseek(fd, (self._sequence % SLOTS) * SLOT.size, os.SEEK_SET)
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def restore(self) -> bool:
+        """
+        Восстанавливает отсчет из контрольной точки. Вызывается при запуске, пока отсчет остановлен.
+        Интервал остается из настроек, восстанавливается только остаток текущего цикла.
+        Если дедлайн прошел, пока приложение не работало, фаза циклов сохраняется:
+        отсчет продолжается так, будто перезапуски шли все это время. С рабочими
+        часами фаза не сохраняется - окно могло закрыться, и цикл начинается заново.
+        Вне рабочих часов идущий отсчет не продолжается, а засыпает
+        """
+        snapshot = self.read()
+        if snapshot is None:
+            return False
+        self._sequence = snapshot.sequence
+
+        countdown = self.countdown
+        # Раньше отсчета: сон после исчерпанного лимита рассчитывается по счетчику
+        if countdown.calendar is not None and snapshot.cycles_day:
+            countdown.calendar.restore_cycles(date.fromordinal(snapshot.cycles_day), snapshot.cycles)
+
+        if snapshot.state in ('pending', 'refreshing'):
+            if not countdown.cycle_allowed():
+                countdown.dispatch('suspend')
+            else:
+                interval = countdown.interval.total_seconds
+                left = snapshot.deadline - countdown.clock.wall()
+                if left <= 0 and countdown.calendar is not None:
+                    left = interval
+                elif left <= 0:
+                    # Каждый цикл - пауза перезапуска и интервал
+                    refresh = countdown.tick_msec / 1000
+                    left = interval - (-left - refresh) % (interval + refresh)
+                    if left <= 0:
+                        left = interval
+                countdown.resume_from(left, 'start')
+        elif snapshot.state == 'paused':
+            countdown.resume_from(snapshot.remaining, 'restore')
+        elif snapshot.state == 'suspended':
+            countdown.dispatch('suspend')
+        else:
+            return False
+
+        logger.info('Отсчет восстановлен: %s, осталось %s с', countdown.state_name, countdown.remaining_seconds)
+        return True
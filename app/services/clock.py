@@ -0,0 +1,248 @@
+import heapq
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class Timer(ABC):
+    """
+    Однократный таймер, созданный часами ``Clock``.
+    ``callback`` можно подменить после создания (например, для профилирования)
+    """
+
+    def __init__(self, callback: Callable[[], None]) -> None:
+        self.callback = callback
+        # Задержка последнего запуска, мс
+        self.interval = 0
+
+    @abstractmethod
+    def start(self, msec: int, precise: bool = True) -> None:
+        """ Перезапускает таймер: ``callback`` будет вызван через ``msec`` """
+
+    @abstractmethod
+    def stop(self) -> None:
+        pass
+
+    @property
+    @abstractmethod
+    def active(self) -> bool:
+        pass
+
+
+class Clock(ABC):
+    """ Источник монотонного времени (сек) и таймеров для обратного отсчета и планировщика """
+
+    @abstractmethod
+    def now(self) -> float:
+        pass
+
+    @abstractmethod
+    def wall(self) -> float:
+        """ Календарное время, unix-секунды. Нужно для рабочих часов """
+
+    @abstractmethod
+    def timer(self, callback: Callable[[], None]) -> Timer:
+        pass
+
+
+class QtTimer(Timer):
+    """ Таймер на ``QTimer``. Срабатывает в цикле событий Qt """
+
+    def __init__(self, callback: Callable[[], None]) -> None:
+        from PySide6.QtCore import QTimer
+
+        super().__init__(callback)
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.fire)
+
+    def fire(self) -> None:
+        self.callback()
+
+    def start(self, msec: int, precise: bool = True) -> None:
+        from PySide6.QtCore import Qt
+
+        self.interval = msec
+        self._timer.setTimerType(Qt.PreciseTimer if precise else Qt.CoarseTimer)
+        self._timer.start(msec)
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+    @property
+    def active(self) -> bool:
+        return self._timer.isActive()
+
+
+class QtClock(Clock):
+    """ Реальное время: ``time.monotonic`` и таймеры Qt. Используется по умолчанию """
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def wall(self) -> float:
+        return time.time()
+
+    def timer(self, callback: Callable[[], None]) -> Timer:
+        return QtTimer(callback)
+
+
+class AsyncioTimer(Timer):
+    """ Таймер на ``loop.call_later``. Срабатывает в цикле событий asyncio """
+
+    def __init__(self, callback: Callable[[], None], loop: 'asyncio.AbstractEventLoop | None' = None) -> None:
+        super().__init__(callback)
+        self.loop = loop
+        self._handle: 'asyncio.TimerHandle | None' = None
+
+    def fire(self) -> None:
+        self._handle = None
+        self.callback()
+
+    def start(self, msec: int, precise: bool = True) -> None:
+        import asyncio
+
+        self.stop()
+        self.interval = msec
+        loop = self.loop or asyncio.get_running_loop()
+        self._handle = loop.call_later(msec / 1000, self.fire)
+
+    def stop(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    @property
+    def active(self) -> bool:
+        return self._handle is not None
+
+
+class AsyncioClock(Clock):
+    """
+    Реальное время для asyncio. Таймеры привязаны к ``loop``,
+    по умолчанию - к циклу, в котором запускается таймер
+    """
+
+    def __init__(self, loop: 'asyncio.AbstractEventLoop | None' = None) -> None:
+        self.loop = loop
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def wall(self) -> float:
+        return time.time()
+
+    def timer(self, callback: Callable[[], None]) -> Timer:
+        return AsyncioTimer(callback, self.loop)
+
+
+class VirtualTimer(Timer):
+
+    def __init__(self, clock: 'VirtualClock', callback: Callable[[], None]) -> None:
+        super().__init__(callback)
+        self.clock = clock
+        # Момент срабатывания по часам. ``None`` - таймер не запущен
+        self.due: float | None = None
+        # Увеличивается при каждом запуске и остановке. Записи кучи со старым поколением пропускаются
+        self.generation = 0
+
+    def start(self, msec: int, precise: bool = True) -> None:
+        self.interval = msec
+        self.generation += 1
+        self.due = self.clock.now() + msec / 1000
+        self.clock.schedule(self)
+
+    def stop(self) -> None:
+        if self.due is not None:
+            self.generation += 1
+            self.due = None
+
+    @property
+    def active(self) -> bool:
+        return self.due is not None
+
+
+class VirtualClock(Clock):
+    """
+    Часы для моделирования: время двигается только вызовами ``advance`` и ``step``.
+
+    Таймеры срабатывают строго по порядку дедлайнов и ровно в свой момент,
+    поэтому многочасовая работа обратного отсчета воспроизводится за
+    миллисекунды и с одинаковым результатом. Опоздания тиков и сон
+    моделируются через ``step(lateness)`` и ``sleep``
+    """
+
+    def __init__(self, start: float = 0.0, wall_start: float = 0.0) -> None:
+        self.time = start
+        self._wall_offset = wall_start - start
+        self._heap: list[tuple[float, int, VirtualTimer, int]] = []
+        self._timers: list[VirtualTimer] = []
+        self._sequence = 0
+
+    def now(self) -> float:
+        return self.time
+
+    def wall(self) -> float:
+        return self.time + self._wall_offset
+
+    def timer(self, callback: Callable[[], None]) -> Timer:
+        timer = VirtualTimer(self, callback)
+        self._timers.append(timer)
+        return timer
+
+    def schedule(self, timer: VirtualTimer) -> None:
+        self._sequence += 1
+        heapq.heappush(self._heap, (timer.due, self._sequence, timer, timer.generation))
+        self._compact()
+
+    def next_due(self) -> float | None:
+        """ Ближайший момент срабатывания среди запущенных таймеров """
+        while self._heap:
+            due, _, timer, generation = self._heap[0]
+            if timer.generation == generation:
+                return due
+            heapq.heappop(self._heap)
+        return None
+
+    def step(self, lateness: float = 0.0) -> bool:
+        """
+        Переводит часы к ближайшему таймеру (плюс опоздание ``lateness``) и вызывает его.
+        :return: ``False``, если запущенных таймеров нет
+        """
+        due = self.next_due()
+        if due is None:
+            return False
+
+        _, _, timer, _ = heapq.heappop(self._heap)
+        self.time = max(self.time, due + lateness)
+        timer.due = None
+        timer.callback()
+        return True
+
+    def advance(self, seconds: float) -> int:
+        """
+        Переводит часы на ``seconds`` вперед, вызывая по пути все таймеры в их моменты.
+        :return: число срабатываний
+        """
+        target = self.time + seconds
+        fired = 0
+        while (due := self.next_due()) is not None and due <= target:
+            self.step()
+            fired += 1
+        self.time = target
+        return fired
+
+    def sleep(self, seconds: float) -> None:
+        """ Переводит часы без срабатываний, как при уходе системы в сон. Опоздавшие таймеры сработают следующими """
+        self.time += seconds
+
+    def _compact(self) -> None:
+        active = [timer for timer in self._timers if timer.due is not None]
+        if len(self._heap) <= 2 * len(active) + 16:
+            return
+        self._heap = [(timer.due, seq, timer, timer.generation) for seq, timer in enumerate(active)]
+        self._sequence = len(self._heap)
+        heapq.heapify(self._heap)
@@ -0,0 +1,44 @@
+from PySide6.QtCore import QFileSystemWatcher, QObject, QTimer, Signal, Slot
+
+from app.config import config
+
+
+class ConfigWatcher(QObject):
+    """
+    Отслеживает изменения ``config.json`` сторонними программами.
+
+    Наблюдает и за файлом, и за каталогом: атомарная замена файла
+    снимает наблюдение с него. Серия событий объединяется, а файл
+    перечитывается только при изменении времени модификации или размера
+    """
+
+    # Выдает словарь изменившихся полей ``PersistentSettings``
+    changed = Signal(dict)
+
+    def __init__(self, delay_msec: int = 300) -> None:
+        super().__init__()
+
+        self._check_timer = QTimer(self)
+        self._check_timer.setSingleShot(True)
+        self._check_timer.setInterval(delay_msec)
+        self._check_timer.timeout.connect(self.check)
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self._check_timer.start)
+        self.watcher.directoryChanged.connect(self._check_timer.start)
+
+        config.config_file.parent.mkdir(exist_ok=True)
+        self.watcher.addPath(config.config_file.parent.as_posix())
+        self._watch_file()
+
+    def _watch_file(self) -> None:
+        path = config.config_file.as_posix()
+        if path not in self.watcher.files() and config.config_file.exists():
+            self.watcher.addPath(path)
+
+    @Slot()
+    def check(self) -> None:
+        self._watch_file()
+        changes = config.reload()
+        if changes:
+            self.changed.emit(changes)
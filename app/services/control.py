@@ -0,0 +1,189 @@
+import getpass
+import json
+import logging
+import os
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, Slot
+from PySide6.QtNetwork import QLocalServer, QLocalSocket
+
+from app.config import APP_NAME
+from app.startup import PROBE_ENV
+from .countdown import Countdown
+
+type Handler = Callable[[dict[str, Any]], dict[str, Any] | None]
+
+logger = logging.getLogger(__name__)
+
+
+class ControlError(Exception):
+    """ Ошибка выполнения команды управления """
+
+
+def server_name() -> str:
+    """
+    Имя локального сокета. Свое для каждого пользователя терминального сервера.
+    Замер старта (``PROBE_ENV``) получает отдельное имя на процесс: он не должен
+    пересылать команды уже открытому приложению или занимать его сокет
+    """
+    name = f'{APP_NAME}-{getpass.getuser()}'
+    if os.environ.get(PROBE_ENV):
+        name += f'-probe-{os.getpid()}'
+    return name
+
+
+def encode(message: dict[str, Any]) -> bytes:
+    return json.dumps(message, ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+class ControlServer(QObject):
+    """
+    Сервер управления обратным отсчетом через локальный сокет.
+
+    Протокол - JSON-сообщения, по одному на строку. Запрос:
+    ``{"command": "interval", "seconds": 600}``, ответ:
+    ``{"ok": true, "status": {...}}`` или ``{"ok": false, "error": "..."}``.
+
+    Команды: ``start``, ``pause``, ``stop``, ``interval``, ``status``.
+    Дополнительные команды регистрируются через ``add_handler``
+    """
+
+    def __init__(self, countdown: Countdown, name: str | None = None) -> None:
+        super().__init__()
+
+        self.countdown = countdown
+        self.name = name or server_name()
+        self._buffers: dict[QLocalSocket, bytes] = {}
+        self.handlers: dict[str, Handler] = {
+            'start': lambda _: self.countdown.on_start(),
+            'pause': lambda _: self.countdown.on_pause(),
+            'stop': lambda _: self.countdown.on_stop(),
+            'interval': self.set_interval,
+            'status': lambda _: None,
+        }
+
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        self.server.newConnection.connect(self.accept)
+
+    def add_handler(self, command: str, handler: Handler) -> None:
+        self.handlers[command] = handler
+
+    def listen(self) -> bool:
+        """
+        Начинает прием подключений.
+        :return: ``False``, если сокет уже занят работающим экземпляром
+        """
+        if self.server.listen(self.name):
+            return True
+
+        if is_running(self.name):
+            return False
+
+        # Сокет остался от аварийно завершенного процесса
+        QLocalServer.removeServer(self.name)
+        return self.server.listen(self.name)
+
+    def close(self) -> None:
+        self.server.close()
+
+    def status(self) -> dict[str, Any]:
+        return {
+            'state': self.countdown.state_name,
+            'remaining_seconds': self.countdown.remaining_seconds,
+            'interval_seconds': self.countdown.interval.total_seconds,
+        }
+
+    def set_interval(self, request: dict[str, Any]) -> None:
+        seconds = request.get('seconds')
+        # ``bool`` - подкласс ``int``: ``true`` не должен становиться 1 секундой
+        if isinstance(seconds, bool) or not isinstance(seconds, int) or seconds <= 0:
+            raise ControlError('Параметр seconds должен быть положительным целым числом')
+        self.countdown.update_interval(seconds)
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """ Выполняет одну команду и формирует ответ. Ошибка обработчика тоже возвращается клиенту """
+        handler = self.handlers.get(request.get('command'))
+        if handler is None:
+            return {'ok': False, 'error': f'Неизвестная команда: {request.get("command")}'}
+
+        try:
+            result = handler(request)
+        except ControlError as e:
+            return {'ok': False, 'error': str(e)}
+        except Exception as e:
+            logger.exception('Ошибка команды управления %r', request)
+            return {'ok': False, 'error': f'Внутренняя ошибка: {e}'}
+
+        response = {'ok': True, 'status': self.status()}
+        if result:
+            response.update(result)
+        return response
+
+    @Slot()
+    def accept(self) -> None:
+        while (socket := self.server.nextPendingConnection()) is not None:
+            self._buffers[socket] = b''
+            socket.readyRead.connect(lambda s=socket: self.read(s))
+            socket.disconnected.connect(lambda s=socket: self.drop(s))
+
+    def read(self, socket: QLocalSocket) -> None:
+        data = self._buffers.get(socket, b'') + socket.readAll().data()
+        *lines, self._buffers[socket] = data.split(b'\n')
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError('Запрос должен быть JSON-объектом')
+            except ValueError as e:
+                response = {'ok': False, 'error': f'Некорректный запрос: {e}'}
+            else:
+                response = self.handle(request)
+            socket.write(encode(response))
+        socket.flush()
+
+    def drop(self, socket: QLocalSocket) -> None:
+        self._buffers.pop(socket, None)
+        socket.deleteLater()
+
+
+def send_command(
+        command: str,
+        name: str | None = None,
+        timeout_msec: int = 1000,
+        **params: Any,
+) -> dict[str, Any]:
+    """
+    Отправляет команду работающему экземпляру и возвращает ответ.
+    Работает без цикла событий и без ``QCoreApplication``
+    :raises ConnectionError: если экземпляр не запущен
+    :raises TimeoutError: если ответ не получен за ``timeout_msec``
+    """
+    socket = QLocalSocket()
+    socket.connectToServer(name or server_name())
+    if not socket.waitForConnected(timeout_msec):
+        raise ConnectionError(socket.errorString())
+
+    socket.write(encode({'command': command, **params}))
+    socket.waitForBytesWritten(timeout_msec)
+
+    data = b''
+    while b'\n' not in data:
+        if not socket.waitForReadyRead(timeout_msec):
+            socket.abort()
+            raise TimeoutError(f'Нет ответа на команду {command}')
+        data += socket.readAll().data()
+
+    socket.disconnectFromServer()
+    return json.loads(data.split(b'\n', 1)[0])
+
+
+def is_running(name: str | None = None, timeout_msec: int = 100) -> bool:
+    """ Проверяет, слушает ли кто-то локальный сокет """
+    socket = QLocalSocket()
+    socket.connectToServer(name or server_name())
+    connected = socket.waitForConnected(timeout_msec)
+    socket.abort()
+    return connected
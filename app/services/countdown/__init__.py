@@ -1 +1,19 @@
-from .context import Countdown
+from importlib import import_module
+
+# Ядро отсчета не зависит от Qt. ``Countdown`` (сигналы Qt) и ``AsyncCountdown``
+# (asyncio) импортируются при первом обращении, чтобы не тянуть лишний драйвер
+_EXPORTS = {
+    'CountdownCore': '.core',
+    'EVENTS': '.core',
+    'TickMode': '.ticks',
+    'Countdown': '.qt',
+    'AsyncCountdown': '.aio',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    return getattr(import_module(_EXPORTS[name], __name__), name)
@@ -0,0 +1,93 @@
+import asyncio
+from typing import AsyncIterator
+
+from ..calendar import WorkCalendar
+from ..clock import AsyncioClock, Clock
+from .core import EVENTS, CountdownCore
+from .states import STOPPED
+
+
+class TickStream:
+    """
+    Остатки отсчета для одного ``async for``. Хранится только последний
+    остаток: медленный потребитель пропускает промежуточные, а не копит очередь
+    """
+
+    def __init__(self) -> None:
+        self.latest: int | None = None
+        self.closed = False
+        self._ready = asyncio.Event()
+
+    def push(self, remaining: int) -> None:
+        self.latest = remaining
+        self._ready.set()
+
+    def close(self) -> None:
+        self.closed = True
+        self._ready.set()
+
+    def __aiter__(self) -> 'TickStream':
+        return self
+
+    async def __anext__(self) -> int:
+        while self.latest is None:
+            if self.closed:
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+
+        remaining, self.latest = self.latest, None
+        return remaining
+
+
+class AsyncCountdown(CountdownCore):
+    """
+    Обратный отсчет для asyncio: тики идут через ``loop.call_later``.
+
+    ``ticks()`` - асинхронный итератор остатков до остановки отсчета,
+    ``wait(event)`` - ожидание ближайшего события из ``EVENTS``::
+
+        countdown = AsyncCountdown(seconds=1200)
+        countdown.on_start()
+        async for remaining in countdown.ticks():
+            ...
+    """
+
+    def __init__(self, seconds: int, clock: Clock | None = None, calendar: WorkCalendar | None = None) -> None:
+        super().__init__(clock or AsyncioClock(), seconds, calendar)
+        self._streams: set[TickStream] = set()
+        self._waiters: dict[str, list[asyncio.Future]] = {event: [] for event in EVENTS}
+
+    def publish(self, event: str, *args: int) -> None:
+        if event == 'updated':
+            for stream in self._streams:
+                stream.push(*args)
+        elif event == 'stopped':
+            for stream in self._streams:
+                stream.close()
+
+        waiters, self._waiters[event] = self._waiters[event], []
+        for future in waiters:
+            if not future.done():
+                future.set_result(args[0] if args else None)
+        super().publish(event, *args)
+
+    async def ticks(self) -> AsyncIterator[int]:
+        """ Остаток на каждом тике. Итерация заканчивается остановкой отсчета """
+        if self._state is STOPPED:
+            return
+        stream = TickStream()
+        self._streams.add(stream)
+        try:
+            async for remaining in stream:
+                yield remaining
+        finally:
+            self._streams.discard(stream)
+
+    async def wait(self, event: str) -> int | None:
+        """ Ждет события. Для ``updated`` возвращает остаток """
+        if event not in EVENTS:
+            raise ValueError(f'Неизвестное событие: {event}')
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[event].append(future)
+        return await future
@@ -0,0 +1,210 @@
+import math
+from collections import defaultdict
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable
+
+from app.schemas import TimeInterval
+from .states import STOPPED, SUSPENDED, TRANSITIONS, State
+from .ticks import TickMode, next_tick_delay
+
+if TYPE_CHECKING:
+    from ..calendar import WorkCalendar
+    from ..clock import Clock
+
+# События отсчета. Аргумент есть только у ``updated`` - остаток в секундах
+EVENTS = ('started', 'expired', 'updated', 'paused', 'stopped', 'restarted', 'suspended')
+
+
+class CountdownCore:
+    """ Обратный отсчет без Qt по абсолютному дедлайну, паттерн State """
+
+    # Длительность перезапуска после истечения, мс
+    tick_msec: int = 1000
+
+    # Предел одного сна вне рабочих часов, сек. После пробуждения календарь проверяется заново
+    max_sleep: int = 6 * 3600
+
+    # Текущее состояние. Тики делегируются ему, команды - таблице переходов
+    _state: State = STOPPED
+
+    def __init__(self, clock: 'Clock', seconds: int, calendar: 'WorkCalendar | None' = None) -> None:
+        # Источник монотонного времени (сек) и таймера тиков
+        self.clock = clock
+        self.timer = self.clock.timer(self.on_update)
+        self.tick_mode = TickMode.SECOND
+
+        # Момент истечения по ``clock``. ``None`` - отсчет не идет
+        self._deadline: float | None = None
+        # Остаток времени, пока отсчет не идет (стоп / пауза)
+        self._remaining: float = 0.0
+        # Плановый момент срабатывания ``timer`` по ``clock``
+        self.tick_due: float | None = None
+
+        self.calendar = calendar
+        # Отсчет запущен в рабочие часы: истечение вне их не засчитывается
+        self._in_hours = False
+
+        self.interval = TimeInterval.from_seconds(seconds)
+        self.set_interval()
+
+        self._listeners: defaultdict[str, list[Callable[..., None]]] = defaultdict(list)
+
+    def subscribe(self, event: str, callback: Callable[..., None]) -> None:
+        if event not in EVENTS:
+            raise ValueError(f'Неизвестное событие: {event}')
+        self._listeners[event].append(callback)
+
+    def publish(self, event: str, *args: int) -> None:
+        """ Сообщает о событии подписчикам. Вызывается состояниями и действиями переходов """
+        for callback in self._listeners.get(event, ()):
+            callback(*args)
+
+    @property
+    def remaining_seconds(self) -> int:
+        """ Оставшееся время в целых секундах, округленное вверх """
+        if self._deadline is None:
+            return math.ceil(self._remaining)
+        return max(0, math.ceil(self.time_left()))
+
+    def time_left(self) -> float:
+        """ Время до дедлайна с точностью до миллисекунды (точность ``QTimer``) """
+        if self._deadline is None:
+            return self._remaining
+        return round(self._deadline - self.clock.now(), 3)
+
+    @property
+    def state_name(self) -> str:
+        return self._state.name
+
+    @property
+    def running(self) -> bool:
+        """ Идет ли отсчет до дедлайна (в том числе перезапуск после истечения) """
+        return self._deadline is not None
+
+    def dispatch(self, command: str) -> bool:
+        """
+        Выполняет переход по таблице ``TRANSITIONS``.
+        Состояние меняется до действия, чтобы обработчики сигналов видели новое.
+        :return: ``False``, если команда в текущем состоянии не определена
+        """
+        transition = TRANSITIONS.get((self._state, command))
+        if transition is None:
+            return False
+
+        state, action = transition
+        self._state = state
+        action(self)
+        return True
+
+    def resume_from(self, remaining: float, command: str) -> bool:
+        """ Переход из остановленного состояния с заданным остатком (восстановление после перезапуска приложения) """
+        if self._state is not STOPPED:
+            return False
+        self._remaining = max(0.0, remaining)
+        return self.dispatch(command)
+
+    def run(self) -> None:
+        """ Фиксирует дедлайн от текущего остатка и запускает тики """
+        self._deadline = self.clock.now() + self._remaining
+        self._in_hours = self.calendar is not None and self.calendar.is_active(self.wall_time())
+        self.schedule_tick()
+
+    def halt(self) -> None:
+        """ Останавливает тики, сохраняя остаток до дедлайна """
+        if self._deadline is not None:
+            self._remaining = max(0.0, self._deadline - self.clock.now())
+            self._deadline = None
+        self.tick_due = None
+        self.timer.stop()
+
+    def schedule_tick(self) -> None:
+        """
+        Планирует следующий тик согласно ``tick_mode``.
+        После истечения дедлайна тик перезапуска идет через ``tick_msec``.
+
+        Точный таймер нужен только для тиков, которые видны посекундно
+        или приходятся на дедлайн. Остальные тики допускают погрешность
+        """
+        if self._deadline is None:
+            return
+
+        left = self.time_left()
+        if left > 0:
+            delay = next_tick_delay(left, self.tick_mode)
+            precise = delay >= left or self.tick_mode is TickMode.SECOND
+        else:
+            delay = self.tick_msec / 1000
+            precise = True
+
+        msec = math.ceil(delay * 1000)
+        self.tick_due = self.clock.now() + msec / 1000
+        self.timer.start(msec, precise)
+
+    def wall_time(self) -> datetime:
+        return datetime.fromtimestamp(self.clock.wall())
+
+    def cycle_allowed(self) -> bool:
+        return self.calendar is None or self.calendar.allows_cycle(self.wall_time())
+
+    def expiry_allowed(self) -> bool:
+        """ Истечение вне рабочих часов засчитывается только циклу, запущенному вне их """
+        if not self._in_hours or self.calendar is None:
+            return True
+        # Дедлайн ровно в момент закрытия окна еще рабочий: тик приходит чуть позже
+        moment = datetime.fromtimestamp(self.clock.wall() - self.tick_msec / 1000)
+        return self.calendar.is_active(moment)
+
+    def record_cycle(self) -> None:
+        if self.calendar is not None:
+            self.calendar.record_cycle(self.wall_time())
+
+    def schedule_wake(self) -> None:
+        """ Планирует пробуждение к началу следующего рабочего окна, но не позже ``max_sleep`` """
+        delay = self.max_sleep
+        if self.calendar is not None:
+            start = self.calendar.next_cycle_start(self.wall_time())
+            if start is not None:
+                delay = min(delay, max(0.0, start.timestamp() - self.clock.wall()))
+
+        msec = math.ceil(delay * 1000)
+        self.tick_due = self.clock.now() + msec / 1000
+        self.timer.start(msec, False)
+
+    def set_tick_mode(self, mode: TickMode) -> None:
+        """
+        Меняет частоту тиков. Если отсчет идет - сразу выдает
+        актуальный остаток и перепланирует следующий тик
+        """
+        if mode is self.tick_mode:
+            return
+
+        self.tick_mode = mode
+        if self._deadline is not None and self.time_left() > 0:
+            self.publish('updated', self.remaining_seconds)
+            self.schedule_tick()
+
+    def set_interval(self, seconds: int | None = None) -> None:
+        if seconds is not None:
+            self.interval = TimeInterval.from_seconds(seconds)
+        self._remaining = float(self.interval.total_seconds)
+        if self._deadline is not None:
+            self._deadline = self.clock.now() + self._remaining
+
+    def update_interval(self, seconds: int) -> None:
+        """ Меняет интервал. Если отсчет идет или на паузе, новый интервал применяется со следующего цикла """
+        if self._state in (STOPPED, SUSPENDED):
+            self.set_interval(seconds)
+        else:
+            self.interval = TimeInterval.from_seconds(seconds)
+
+    def on_start(self) -> None:
+        self.dispatch('start')
+
+    def on_pause(self) -> None:
+        self.dispatch('pause')
+
+    def on_stop(self) -> None:
+        self.dispatch('stop')
+
+    def on_update(self) -> None:
+        self._state.on_update(self)
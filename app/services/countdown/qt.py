@@ -0,0 +1,50 @@
+from PySide6.QtCore import QObject, Signal, Slot
+
+from app.config import config
+from ..calendar import WorkCalendar
+from ..clock import Clock, QtClock
+from .core import EVENTS, CountdownCore
+
+
+class Countdown(CountdownCore, QObject):
+    """
+    Обратный отсчет для приложения: события ``CountdownCore`` выдаются сигналами Qt.
+    Интервал и рабочие часы берутся из настроек
+    """
+
+    started = Signal()
+    expired = Signal()
+    updated = Signal(int)
+    paused = Signal()
+    stopped = Signal()
+    restarted = Signal()
+    suspended = Signal()
+
+    def __init__(self, clock: Clock | None = None) -> None:
+        QObject.__init__(self)
+        CountdownCore.__init__(
+            self, clock or QtClock(),
+            seconds=config.persistent.timer_seconds,
+            calendar=WorkCalendar.from_settings(config.persistent.work_hours),
+        )
+        self._signals = {event: getattr(self, event) for event in EVENTS}
+
+    def publish(self, event: str, *args: int) -> None:
+        self._signals[event].emit(*args)
+        super().publish(event, *args)
+
+    @Slot()
+    def on_start(self) -> None:
+        super().on_start()
+
+    @Slot()
+    def on_pause(self) -> None:
+        super().on_pause()
+
+    @Slot()
+    def on_stop(self) -> None:
+        super().on_stop()
+
+    @Slot(int)
+    def set_interval(self, seconds: int | None = None) -> None:
+        super().set_interval(seconds)
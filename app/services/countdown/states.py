@@ -1,107 +1,150 @@
 from abc import ABC
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
-    from .context import Countdown
+    from .core import CountdownCore
 
 
 class State(ABC):
     """
     Реализация паттерна State.
     Без ``@abstractmethod``, чтобы не нарушать принцип разделения интерфейсов.
-    """
-
-    def __init__(self) -> None:
-        self._context = None
-
-    @property
-    def context(self) -> 'Countdown':
-        return self._context
 
-    @context.setter
-    def context(self, context: 'Countdown'):
-        self._context = context
-
-    def on_start(self) -> None:
-        """ По умолчанию не делает ничего """
-        pass
+    Состояния не хранят данных и существуют в единственном экземпляре
+    (Flyweight): контекст передается в обработчики. Команды ``start``,
+    ``pause`` и ``stop`` обрабатываются таблицей ``TRANSITIONS``
+    """
 
-    def on_pause(self) -> None:
-        """ По умолчанию не делает ничего """
-        pass
+    # Имя состояния для внешних потребителей (статус, отчеты)
+    name: str = ''
 
-    def on_stop(self) -> None:
+    def on_update(self, context: 'CountdownCore') -> None:
         """ По умолчанию не делает ничего """
         pass
 
-    def on_update(self) -> None:
-        """ По умолчанию не делает ничего """
-        pass
+    def __repr__(self) -> str:
+        return f'<State {self.name}>'
 
 
 class Stopped(State):
     """ Таймер не запущен. Состояние по умолчанию """
 
-    def on_start(self) -> None:
-        """ Запускает таймер, меняет состояние на Pending """
-        self.context.timer.start(1000)
-        self.context.set_state(Pending())
-        self.context.started.emit()
+    name = 'stopped'
 
 
 class Pending(State):
-    """ Таймер запущен и обновляется каждую секунду """
-
-    def on_pause(self) -> None:
-        """ Ставит таймер на паузу, меняет состояние на Paused """
-        self.context.timer.stop()
-        self.context.set_state(Paused())
-        self.context.paused.emit()
-
-    def on_stop(self) -> None:
-        """ Обнуляет и останавливает таймер, меняет состояние на Stopped """
-        self.context.timer.stop()
-        self.context.set_interval()
-        self.context.set_state(Stopped())
-        self.context.stopped.emit()
-
-    def on_update(self) -> None:
-        """ Обновляет обратный отсчет """
-        self.context.remaining_seconds -= 1
-        self.context.updated.emit(self.context.remaining_seconds)
-        if self.context.remaining_seconds <= 0:
-            self.context.expired.emit()
-            self.context.set_state(Refreshing())
+    """ Таймер запущен и обновляется по тикам согласно ``CountdownCore.tick_mode`` """
+
+    name = 'pending'
+
+    def on_update(self, context: 'CountdownCore') -> None:
+        """
+        Обновляет обратный отсчет. Остаток вычисляется от дедлайна.
+        Цикл, рабочее окно которого закрылось до дедлайна, не истекает, а засыпает
+        """
+        remaining_seconds = context.remaining_seconds
+        context.publish('updated', remaining_seconds)
+        if remaining_seconds <= 0:
+            context.dispatch('expire' if context.expiry_allowed() else 'suspend')
+        else:
+            context.schedule_tick()
 
 
 class Paused(State):
     """ Таймер не обновляется """
 
-    def on_start(self) -> None:
-        """ Продолжает обратный отсчет с места остановки """
-        self.context.timer.start(1000)
-        self.context.set_state(Pending())
-        self.context.started.emit()
-
-    def on_stop(self) -> None:
-        """ Обнуляет и останавливает таймер """
-        self.context.timer.stop()
-        self.context.set_interval()
-        self.context.set_state(Stopped())
-        self.context.stopped.emit()
+    name = 'paused'
 
 
 class Refreshing(State):
-    """ Таймер в процессе перезапуска. Состояние длится 1 интервал обновления (1 секунду) """
-
-    def on_stop(self) -> None:
-        """ Обнуляет и останавливает таймер """
-        self.context.timer.stop()
-        self.context.set_interval()
-        self.context.set_state(Stopped())
-        self.context.stopped.emit()
-
-    def on_update(self) -> None:
-        """ Останавливает таймер и запускает снова """
-        self.context.on_stop()
-        self.context.on_start()
+    """ Таймер в процессе перезапуска. Состояние длится ``CountdownCore.tick_msec`` """
+
+    name = 'refreshing'
+
+    def on_update(self, context: 'CountdownCore') -> None:
+        """ Запускает следующий цикл, если его разрешают рабочие часы """
+        context.dispatch('restart' if context.cycle_allowed() else 'suspend')
+
+
+class Suspended(State):
+    """ Вне рабочих часов или исчерпан лимит циклов. Таймер спит до открытия рабочего окна """
+
+    name = 'suspended'
+
+    def on_update(self, context: 'CountdownCore') -> None:
+        if context.cycle_allowed():
+            context.dispatch('wake')
+        else:
+            context.schedule_wake()
+
+
+STOPPED = Stopped()
+PENDING = Pending()
+PAUSED = Paused()
+REFRESHING = Refreshing()
+SUSPENDED = Suspended()
+
+
+def start(context: 'CountdownCore') -> None:
+    """ Запускает или продолжает отсчет с текущего остатка """
+    context.run()
+    context.publish('started')
+
+
+def pause(context: 'CountdownCore') -> None:
+    """ Останавливает отсчет с сохранением остатка """
+    context.halt()
+    context.publish('paused')
+
+
+def stop(context: 'CountdownCore') -> None:
+    """ Обнуляет и останавливает отсчет """
+    context.halt()
+    context.set_interval()
+    context.publish('stopped')
+
+
+def expire(context: 'CountdownCore') -> None:
+    """ Сообщает об истечении и планирует тик перезапуска """
+    context.record_cycle()
+    context.publish('expired')
+    context.schedule_tick()
+
+
+def restart(context: 'CountdownCore') -> None:
+    """ Начинает новый цикл одним переходом, без промежуточных ``stopped`` / ``started`` """
+    context.halt()
+    context.set_interval()
+    context.run()
+    context.publish('restarted')
+
+
+def suspend(context: 'CountdownCore') -> None:
+    """ Обнуляет отсчет и спит до начала следующего рабочего окна """
+    context.halt()
+    context.set_interval()
+    context.schedule_wake()
+    context.publish('suspended')
+
+
+# (состояние, команда) -> (новое состояние, действие). Отсутствующие пары игнорируются
+TRANSITIONS: dict[tuple[State, str], tuple[State, Callable[['CountdownCore'], None]]] = {
+    (STOPPED, 'start'): (PENDING, start),
+    # Восстановление паузы и сна вне рабочих часов из контрольной точки
+    (STOPPED, 'restore'): (PAUSED, pause),
+    (STOPPED, 'suspend'): (SUSPENDED, suspend),
+    (PENDING, 'pause'): (PAUSED, pause),
+    (PENDING, 'stop'): (STOPPED, stop),
+    (PENDING, 'expire'): (REFRESHING, expire),
+    # Дедлайн пришелся на время после закрытия рабочего окна
+    (PENDING, 'suspend'): (SUSPENDED, suspend),
+    (PAUSED, 'start'): (PENDING, start),
+    (PAUSED, 'stop'): (STOPPED, stop),
+    (REFRESHING, 'stop'): (STOPPED, stop),
+    (REFRESHING, 'restart'): (PENDING, restart),
+    (REFRESHING, 'suspend'): (SUSPENDED, suspend),
+    (SUSPENDED, 'wake'): (PENDING, start),
+    # Ручной запуск вне рабочих часов
+    (SUSPENDED, 'start'): (PENDING, start),
+    (SUSPENDED, 'stop'): (STOPPED, stop),
+}
@@ -0,0 +1,29 @@
+from enum import Enum
+
+
+class TickMode(Enum):
+    """
+    Частота пробуждений обратного отсчета.
+
+    Значение - период смены видимого остатка в секундах.
+    ``0`` - промежуточных тиков нет, только пробуждение в момент истечения
+    """
+
+    SECOND = 1      # Виден хотя бы один ``TimerDisplayer``
+    MINUTE = 60     # Виден только тултип трея с точностью до минуты
+    DEADLINE = 0    # Промежуточный остаток никому не нужен
+
+
+def next_tick_delay(time_left: float, mode: TickMode) -> float:
+    """
+    Возвращает задержку до следующего тика в секундах.
+
+    Тик приходится на момент, когда целый остаток (округленный вверх)
+    переходит через кратное периоду значение, но не позже дедлайна.
+    :param time_left: время до дедлайна, должно быть больше нуля
+    """
+    period = mode.value
+    if not period:
+        return time_left
+    delay = (time_left % period + 1) % period or period
+    return min(delay, time_left)
@@ -0,0 +1,181 @@
+import json
+import struct
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta
+from enum import IntEnum
+from pathlib import Path
+
+from app.config import CONFIG_DIR
+from app.persistence import DebouncedWriter, atomic_write
+
+
+class Event(IntEnum):
+    """ Переходы обратного отсчета, которые попадают в журнал """
+    STARTED = 1
+    PAUSED = 2
+    STOPPED = 3
+    EXPIRED = 4
+    RESTARTED = 5
+    SUSPENDED = 6
+
+
+# Запись журнала: время (unix, сек) и код события - 9 байт
+RECORD = struct.Struct('<dB')
+
+
+def day_key(moment: date) -> str:
+    return moment.isoformat()
+
+
+def week_key(moment: date) -> str:
+    year, week, _ = moment.isocalendar()
+    return f'{year}-W{week:02d}'
+
+
+class Rollups:
+    """ Счетчики событий по дням и ISO-неделям """
+
+    def __init__(self, daily: dict | None = None, weekly: dict | None = None, log_size: int = 0) -> None:
+        self.daily: dict[str, Counter] = {key: Counter(row) for key, row in (daily or {}).items()}
+        self.weekly: dict[str, Counter] = {key: Counter(row) for key, row in (weekly or {}).items()}
+        # Размер журнала, учтенного в счетчиках, байт
+        self.log_size = log_size
+
+    def add(self, timestamp: float, event: Event) -> None:
+        moment = datetime.fromtimestamp(timestamp).date()
+        self.daily.setdefault(day_key(moment), Counter())[event.name.lower()] += 1
+        self.weekly.setdefault(week_key(moment), Counter())[event.name.lower()] += 1
+
+    def to_json(self) -> bytes:
+        return json.dumps({
+            'log_size': self.log_size,
+            'daily': self.daily,
+            'weekly': self.weekly,
+        }).encode('utf-8')
+
+
+class HistoryStore:
+    """
+    Журнал перерывов: только дозапись, пакетная и в фоновом потоке.
+
+    ``record`` лишь кладет событие в буфер и обновляет счетчики в памяти.
+    Фоновый поток дописывает накопленные записи в журнал и атомарно
+    сохраняет агрегаты по дням и неделям вместе с размером учтенного
+    журнала. При загрузке агрегаты догоняются по хвосту журнала, поэтому
+    запросы читают несколько строк агрегатов, а не весь журнал
+    """
+
+    def __init__(self, directory: Path = CONFIG_DIR, flush_delay: float = 5.0) -> None:
+        self.log_file = directory / 'history.log'
+        self.rollups_file = directory / 'history_rollups.json'
+
+        self._lock = threading.Lock()
+        self._buffer: list[tuple[float, Event]] = []
+        # Счетчики с учетом буфера - для запросов
+        self._live: Rollups | None = None
+        # Счетчики, соответствующие записанному журналу - для сохранения
+        self._durable: Rollups | None = None
+        self._writer: DebouncedWriter[None] = DebouncedWriter(
+            lambda _: self.write_batch(), delay=flush_delay, name='history-writer',
+        )
+
+    def record(self, event: Event, timestamp: float | None = None) -> None:
+        """ Регистрирует событие. Не обращается к диску """
+        timestamp = time.time() if timestamp is None else timestamp
+        self._ensure_loaded()
+        with self._lock:
+            self._buffer.append((timestamp, event))
+            self._live.add(timestamp, event)
+        self._writer.submit(None)
+
+    def watch_countdown(self, countdown) -> None:
+        """
+        Записывает каждый переход ``countdown``. Время берется из его часов,
+        поэтому прогон на ``VirtualClock`` не попадает в реальные дни
+        """
+        def recorder(event: Event):
+            return lambda: self.record(event, countdown.clock.wall())
+
+        countdown.started.connect(recorder(Event.STARTED))
+        countdown.paused.connect(recorder(Event.PAUSED))
+        countdown.stopped.connect(recorder(Event.STOPPED))
+        countdown.expired.connect(recorder(Event.EXPIRED))
+        countdown.restarted.connect(recorder(Event.RESTARTED))
+        countdown.suspended.connect(recorder(Event.SUSPENDED))
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        return self._writer.flush(timeout)
+
+    def daily(self, days: int = 30, today: date | None = None) -> dict[str, dict[str, int]]:
+        """ Счетчики событий за последние ``days`` дней, включая сегодняшний """
+        today = today or date.today()
+        keys = [day_key(today - timedelta(days=offset)) for offset in range(days)]
+        return self._select('daily', keys)
+
+    def weekly(self, weeks: int = 4, today: date | None = None) -> dict[str, dict[str, int]]:
+        """ Счетчики событий за последние ``weeks`` ISO-недель, включая текущую """
+        today = today or date.today()
+        keys = [week_key(today - timedelta(weeks=offset)) for offset in range(weeks)]
+        return self._select('weekly', keys)
+
+    def breaks(self, days: int = 30, today: date | None = None) -> int:
+        """ Число истекших интервалов (напоминаний о перерыве) за последние ``days`` дней """
+        return sum(row.get('expired', 0) for row in self.daily(days, today).values())
+
+    def _select(self, period: str, keys: list[str]) -> dict[str, dict[str, int]]:
+        self._ensure_loaded()
+        with self._lock:
+            rows = getattr(self._live, period)
+            return {key: dict(rows[key]) for key in keys if key in rows}
+
+    def _ensure_loaded(self) -> None:
+        if self._durable is None:
+            durable = self._load_rollups()
+            with self._lock:
+                if self._durable is None:
+                    self._durable = durable
+                    self._live = Rollups(durable.daily, durable.weekly, durable.log_size)
+
+    def _load_rollups(self) -> Rollups:
+        """ Читает агрегаты и догоняет их по записям журнала, которые в них не учтены """
+        try:
+            rollups = Rollups(**json.loads(self.rollups_file.read_text(encoding='utf-8')))
+        except (OSError, ValueError, TypeError):
+            rollups = Rollups()
+
+        log_size = self.log_file.stat().st_size if self.log_file.exists() else 0
+        if log_size < rollups.log_size:
+            # Журнал заменен или обрезан - агрегаты пересчитываются целиком
+            rollups = Rollups()
+
+        if log_size > rollups.log_size:
+            with open(self.log_file, 'rb') as f:
+                f.seek(rollups.log_size)
+                tail = f.read()
+            complete = len(tail) - len(tail) % RECORD.size
+            for timestamp, code in RECORD.iter_unpack(tail[:complete]):
+                rollups.add(timestamp, Event(code))
+            rollups.log_size += complete
+        return rollups
+
+    def write_batch(self) -> None:
+        """ Дописывает буфер в журнал и сохраняет агрегаты. Выполняется в фоновом потоке """
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+        if not batch:
+            return
+
+        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_file, 'ab') as f:
+            # Недописанная при аварии запись отбрасывается
+            f.truncate(self._durable.log_size)
+            f.write(b''.join(RECORD.pack(timestamp, event) for timestamp, event in batch))
+
+        with self._lock:
+            for timestamp, event in batch:
+                self._durable.add(timestamp, event)
+            self._durable.log_size += len(batch) * RECORD.size
+            data = self._durable.to_json()
+        atomic_write(self.rollups_file, data)
@@ -0,0 +1,184 @@
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from PySide6.QtCore import QObject, Signal
+
+logger = logging.getLogger(__name__)
+
+KINDS = ('command', 'lock', 'http')
+
+
+def lock_command() -> list[str]:
+    """ Команда блокировки сеанса для текущей платформы """
+    if sys.platform == 'win32':
+        return ['rundll32.exe', 'user32.dll,LockWorkStation']
+    if sys.platform == 'darwin':
+        return ['pmset', 'displaysleepnow']
+    return ['loginctl', 'lock-session']
+
+
+@dataclass(slots=True)
+class Hook:
+    """ Действие по истечении интервала """
+    name: str
+    kind: str                   # command | lock | http
+    command: list[str] = field(default_factory=list)
+    url: str = ''
+    timeout: float = 10.0       # сек
+    # Сколько запусков этого действия может идти одновременно. Лишние пропускаются
+    max_concurrent: int = 1
+
+    @classmethod
+    def from_settings(cls, settings: dict[str, Any]) -> 'Hook':
+        hook = cls(**settings)
+        if hook.kind not in KINDS:
+            raise ValueError(f'Неизвестный тип действия: {hook.kind}')
+        if hook.kind == 'lock' and not hook.command:
+            hook.command = lock_command()
+        return hook
+
+
+def load_hooks(settings: list[dict[str, Any]]) -> list[Hook]:
+    hooks = []
+    for item in settings:
+        try:
+            hooks.append(Hook.from_settings(item))
+        except (TypeError, ValueError) as e:
+            logger.warning('Действие пропущено: %r (%s)', item, e)
+    return hooks
+
+
+class HookRunner(QObject):
+    """
+    Выполняет действия по истечении интервала в ограниченном пуле потоков.
+
+    Команды запускаются отдельными процессами, поток пула только ждет их
+    с тайм-аутом. Для каждого действия ограничено число одновременных
+    запусков, для пула - число потоков. ``cancel`` снимает ожидающие
+    запуски и завершает запущенные процессы. Итог каждого запуска
+    приходит в сигнал ``finished`` в потоке, где создан ``HookRunner``:
+    имя действия, статус (``ok``, ``failed``, ``timeout``, ``cancelled``,
+    ``skipped``) и подробности
+    """
+
+    finished = Signal(str, str, str)
+
+    def __init__(self, hooks: list[Hook] | None = None, max_workers: int = 4) -> None:
+        super().__init__()
+        self.hooks = hooks or []
+        self.max_workers = max_workers
+
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._running: Counter[str] = Counter()
+        self._futures: set[Future] = set()
+        self._processes: set[subprocess.Popen] = set()
+        # Увеличивается при отмене. Запуски старого поколения считаются отмененными
+        self._generation = 0
+
+    def run_all(self) -> None:
+        for hook in list(self.hooks):
+            self.submit(hook)
+
+    def submit(self, hook: Hook) -> None:
+        with self._lock:
+            if self._running[hook.name] >= hook.max_concurrent:
+                future = None
+            else:
+                self._running[hook.name] += 1
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix='hook')
+                future = self._executor.submit(self._execute, hook, self._generation, time.time())
+                self._futures.add(future)
+
+        if future is None:
+            self.finished.emit(hook.name, 'skipped', 'предыдущий запуск еще выполняется')
+            return
+        # Вне блокировки: для уже завершенного запуска обработчик вызывается сразу
+        future.add_done_callback(lambda done, name=hook.name: self._done(done, name))
+
+    def cancel(self) -> None:
+        """ Отменяет ожидающие запуски и завершает процессы запущенных """
+        with self._lock:
+            self._generation += 1
+            futures = list(self._futures)
+            processes = list(self._processes)
+
+        for future in futures:
+            future.cancel()
+        for process in processes:
+            process.kill()
+
+    def shutdown(self) -> None:
+        self.cancel()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _done(self, future: Future, name: str) -> None:
+        with self._lock:
+            self._futures.discard(future)
+            self._running[name] -= 1
+        if future.cancelled():
+            self.finished.emit(name, 'cancelled', 'отсчет остановлен')
+
+    def _execute(self, hook: Hook, generation: int, fired_at: float) -> None:
+        """ Выполняется в потоке пула """
+        try:
+            if hook.kind == 'http':
+                status, detail = 'ok', self._post(hook, fired_at)
+            else:
+                status, detail = 'ok', self._run_command(hook, generation, fired_at)
+        except subprocess.TimeoutExpired:
+            status, detail = 'timeout', f'дольше {hook.timeout} с'
+        except Exception as e:
+            status, detail = 'failed', str(e)
+
+        if generation != self._generation:
+            status, detail = 'cancelled', 'отсчет остановлен'
+        self.finished.emit(hook.name, status, detail)
+
+    def _run_command(self, hook: Hook, generation: int, fired_at: float) -> str:
+        env = dict(os.environ, EYE_REMINDER_EVENT='expired', EYE_REMINDER_FIRED_AT=str(fired_at))
+        process = subprocess.Popen(
+            hook.command, env=env,
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        )
+        with self._lock:
+            self._processes.add(process)
+            if generation != self._generation:
+                # Отмена пришла, пока процесс запускался
+                process.kill()
+        try:
+            _, stderr = process.communicate(timeout=hook.timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise
+        finally:
+            with self._lock:
+                self._processes.discard(process)
+
+        if process.returncode != 0:
+            raise RuntimeError(f'код {process.returncode}: {stderr.decode(errors="replace").strip()}')
+        return ''
+
+    @staticmethod
+    def _post(hook: Hook, fired_at: float) -> str:
+        data = json.dumps({'event': 'expired', 'fired_at': fired_at}).encode('utf-8')
+        request = urllib.request.Request(
+            hook.url, data=data, method='POST', headers={'Content-Type': 'application/json'},
+        )
+        with urllib.request.urlopen(request, timeout=hook.timeout) as response:
+            return f'HTTP {response.status}'
@@ -0,0 +1,51 @@
+import sys
+import time
+from pathlib import Path
+
+from PySide6.QtCore import QDir, QLockFile
+
+from .control import send_command, server_name
+
+
+class SingleInstance:
+    """
+    Гарантирует единственный экземпляр приложения на пользователя.
+
+    Первый процесс захватывает файл блокировки и держит его до выхода.
+    Повторный запуск обнаруживает блокировку, пересылает свое намерение
+    работающему экземпляру через сокет управления и завершается,
+    не создавая ``QApplication``
+    """
+
+    def __init__(self, name: str | None = None) -> None:
+        self.name = name or server_name()
+        self.lock = QLockFile((Path(QDir.tempPath()) / f'{self.name}.lock').as_posix())
+
+    def acquire(self) -> bool:
+        """ Захватывает блокировку без ожидания. Блокировка умершего процесса снимается автоматически """
+        return self.lock.tryLock(0)
+
+    def forward(self, command: str, timeout: float = 5.0) -> int:
+        """
+        Передает команду работающему экземпляру.
+        Ждет до ``timeout`` секунд, если тот еще не начал слушать сокет
+        :return: код завершения для повторного запуска
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                response = send_command(command, name=self.name, timeout_msec=200)
+            except (ConnectionError, TimeoutError) as e:
+                if time.monotonic() >= deadline:
+                    print(f'Экземпляр запущен, но не отвечает: {e}', file=sys.stderr)
+                    return 1
+                time.sleep(0.05)
+                continue
+
+            if not response['ok']:
+                print(response['error'], file=sys.stderr)
+                return 1
+            return 0
+
+    def release(self) -> None:
+        self.lock.unlock()
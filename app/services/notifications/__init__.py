@@ -0,0 +1,4 @@
+from .backends import Backend, DBusBackend, LogBackend, TrayBackend, create_backends
+from .notifier import Notifier
+from .queue import Notification, NotificationQueue
+from .template import Template, compile_template
@@ -0,0 +1,157 @@
+import logging
+import shutil
+import subprocess
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from app.config import APP_NAME, CONFIG_DIR
+
+if TYPE_CHECKING:
+    from PySide6.QtGui import QIcon
+    from PySide6.QtWidgets import QSystemTrayIcon
+
+    from .queue import Notification
+
+logger = logging.getLogger(__name__)
+
+
+class Backend(ABC):
+    """ Способ показа уведомления. ``deliver`` вызывается в потоке очереди уведомлений """
+
+    name: str = ''
+
+    @abstractmethod
+    def deliver(self, notification: 'Notification') -> None:
+        pass
+
+
+class TrayMessenger(QObject):
+    """ Показывает сообщение трея в потоке, где создан. Вызовы из других потоков идут через очередь событий """
+
+    requested = Signal(str, str, int)
+
+    def __init__(self, icon: 'QSystemTrayIcon', message_icon: 'QIcon') -> None:
+        super().__init__()
+        self.icon = icon
+        self.message_icon = message_icon
+        self.requested.connect(self.show)
+
+    @Slot(str, str, int)
+    def show(self, title: str, text: str, timeout_msec: int) -> None:
+        self.icon.showMessage(title, text, self.message_icon, timeout_msec)
+
+
+class TrayBackend(Backend):
+    """
+    Всплывающее сообщение иконки трея.
+    Виджеты доступны только из главного потока, поэтому показ передается туда сигналом
+    """
+
+    name = 'tray'
+
+    def __init__(self, icon: 'QSystemTrayIcon', message_icon: 'QIcon') -> None:
+        # Создается в главном потоке вместе с треем
+        self.messenger = TrayMessenger(icon, message_icon)
+
+    def deliver(self, notification: 'Notification') -> None:
+        self.messenger.requested.emit(notification.title, notification.text, notification.timeout_msec)
+
+
+def gvariant_string(value: str) -> str:
+    """ Строковый литерал в текстовом формате GVariant """
+    escaped = value.replace('\\', '\\\\').replace("'", "\\'").replace('\n', '\\n')
+    return f"'{escaped}'"
+
+
+class DBusBackend(Backend):
+    """
+    Уведомление по спецификации freedesktop (``org.freedesktop.Notifications.Notify``).
+
+    Вызов выполняется через ``gdbus`` из GLib: QtDBus не умеет передавать
+    ``uint32``, которого требует сигнатура метода. ``address`` позволяет
+    направить вызов на отдельную шину, например с тестовой заглушкой сервиса
+    """
+
+    name = 'dbus'
+
+    INTERFACE = 'org.freedesktop.Notifications'
+
+    def __init__(
+            self,
+            service: str = INTERFACE,
+            object_path: str = '/org/freedesktop/Notifications',
+            address: str | None = None,
+            timeout: float = 2.0,
+    ) -> None:
+        self.service = service
+        self.object_path = object_path
+        self.address = address
+        self.timeout = timeout
+        self.executable = shutil.which('gdbus')
+
+    def command(self, notification: 'Notification') -> list[str]:
+        bus = ['--address', self.address] if self.address else ['--session']
+        return [
+            self.executable or 'gdbus', 'call', *bus,
+            '--dest', self.service,
+            '--object-path', self.object_path,
+            '--method', f'{self.INTERFACE}.Notify',
+            gvariant_string(APP_NAME),
+            'uint32 0',                             # replaces_id
+            gvariant_string(''),                    # app_icon
+            gvariant_string(notification.title),
+            gvariant_string(notification.text),
+            '@as []',                               # actions
+            '@a{sv} {}',                            # hints
+            f'int32 {notification.timeout_msec}',
+        ]
+
+    def deliver(self, notification: 'Notification') -> None:
+        if self.executable is None:
+            raise RuntimeError('gdbus не найден')
+        subprocess.run(
+            self.command(notification),
+            check=True,
+            timeout=self.timeout,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+
+
+class LogBackend(Backend):
+    """ Запись уведомлений в файл. Без файла - в журнал приложения """
+
+    name = 'log'
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+
+    def deliver(self, notification: 'Notification') -> None:
+        if self.path is None:
+            logger.warning('%s: %s', notification.title, notification.text)
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        text = notification.text.replace('\n', ' ')
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(f'{time.strftime("%Y-%m-%d %H:%M:%S")}\t{notification.title}\t{text}\n')
+
+
+def create_backends(names: list[str], tray: TrayBackend | None = None) -> list[Backend]:
+    """ Бэкенды по именам из настроек. ``tray`` доступен только при наличии иконки трея """
+    backends = []
+    for name in names:
+        if name == 'tray':
+            if tray is not None:
+                backends.append(tray)
+        elif name == 'dbus':
+            backends.append(DBusBackend())
+        elif name == 'log':
+            backends.append(LogBackend(CONFIG_DIR / 'notifications.log'))
+        else:
+            logger.warning('Неизвестный способ уведомления: %s', name)
+    return backends
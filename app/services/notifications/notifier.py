@@ -0,0 +1,57 @@
+import time
+
+from ..countdown import Countdown
+from .queue import Notification, NotificationQueue
+from .template import compile_template, format_duration
+
+
+class Notifier:
+    """
+    Формирует уведомления по шаблонам и ставит их в очередь доставки.
+
+    Следит за обратным отсчетом, чтобы заполнить переменные шаблонов:
+    номер истекшего интервала и время с момента запуска. Остановка
+    отсчета и выход за рабочие часы сбрасывают оба значения
+    """
+
+    def __init__(self, countdown: Countdown, queue: NotificationQueue) -> None:
+        self.countdown = countdown
+        self.queue = queue
+        self.cycle = 0
+        self._started_at: float | None = None
+
+        countdown.started.connect(self.on_started)
+        countdown.expired.connect(self.on_expired)
+        countdown.stopped.connect(self.on_stopped)
+        countdown.suspended.connect(self.on_stopped)
+
+    def on_started(self) -> None:
+        # Продолжение после паузы не начинает отсчет заново
+        if self._started_at is None:
+            self._started_at = self.countdown.clock.now()
+
+    def on_expired(self) -> None:
+        self.cycle += 1
+
+    def on_stopped(self) -> None:
+        self.cycle = 0
+        self._started_at = None
+
+    def variables(self) -> dict[str, str | int]:
+        started_at = self._started_at
+        elapsed = 0.0 if started_at is None else self.countdown.clock.now() - started_at
+        return {
+            'cycle': self.cycle,
+            'elapsed': format_duration(elapsed),
+            'interval': format_duration(self.countdown.interval.total_seconds),
+            'time': time.strftime('%H:%M'),
+        }
+
+    def notify(self, title: str, text: str, timeout_msec: int = 3000) -> bool:
+        """ Не блокирует: доставка идет в потоке очереди. ``False`` - очередь переполнена """
+        variables = self.variables()
+        return self.queue.submit(Notification(
+            title=compile_template(title).render(variables),
+            text=compile_template(text).render(variables),
+            timeout_msec=timeout_msec,
+        ))
@@ -0,0 +1,122 @@
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Sequence
+
+from .backends import Backend
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class Notification:
+    title: str
+    text: str
+    timeout_msec: int = 3000
+    # Сколько уведомлений объединено в это
+    count: int = 1
+
+
+def coalesce(batch: list[Notification]) -> Notification:
+    """ Объединяет одновременные уведомления в одно. Одинаковые заголовки и тексты не повторяются """
+    if len(batch) == 1:
+        return batch[0]
+
+    titles = list(dict.fromkeys(notification.title for notification in batch))
+    texts = list(dict.fromkeys(notification.text for notification in batch))
+    return Notification(
+        title=' / '.join(titles),
+        text='\n'.join(texts),
+        timeout_msec=max(notification.timeout_msec for notification in batch),
+        count=sum(notification.count for notification in batch),
+    )
+
+
+class NotificationQueue:
+    """
+    Доставка уведомлений в фоновом потоке.
+
+    ``submit`` не блокирует: при переполнении очереди уведомление
+    отбрасывается. Поток забирает уведомление, ждет еще ``coalesce_delay``
+    секунд и объединяет все, что пришло за это время, после чего отдает
+    результат каждому бэкенду. Ошибка одного бэкенда не мешает остальным.
+    Поток создается при первом уведомлении
+    """
+
+    def __init__(
+            self,
+            backends: Sequence[Backend] = (),
+            maxsize: int = 32,
+            coalesce_delay: float = 0.2,
+    ) -> None:
+        self.backends = list(backends)
+        self.coalesce_delay = coalesce_delay
+        self.dropped = 0
+
+        self._queue: queue.Queue[Notification | None] = queue.Queue(maxsize)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, notification: Notification) -> bool:
+        """ :return: ``False``, если очередь переполнена и уведомление отброшено """
+        try:
+            self._queue.put_nowait(notification)
+        except queue.Full:
+            self.dropped += 1
+            logger.warning('Очередь уведомлений переполнена, отброшено: %s', notification.title)
+            return False
+
+        self._ensure_thread()
+        return True
+
+    def close(self, timeout: float | None = 5.0) -> bool:
+        """
+        Доставляет уже принятые уведомления и останавливает поток.
+        :return: ``False``, если поток не завершился за ``timeout``
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return True
+
+        self._queue.put(None)
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='notifications', daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            notification = self._queue.get()
+            if notification is None:
+                return
+
+            batch = [notification]
+            stop = False
+            deadline = time.monotonic() + self.coalesce_delay
+            while (timeout := deadline - time.monotonic()) > 0:
+                try:
+                    notification = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if notification is None:
+                    stop = True
+                    break
+                batch.append(notification)
+
+            self.deliver(coalesce(batch))
+            if stop:
+                return
+
+    def deliver(self, notification: Notification) -> None:
+        for backend in list(self.backends):
+            try:
+                backend.deliver(notification)
+            except Exception:
+                logger.exception('Уведомление не доставлено (%s)', backend.name)
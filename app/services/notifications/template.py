@@ -0,0 +1,88 @@
+import logging
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Mapping
+
+logger = logging.getLogger(__name__)
+
+# Переменные, доступные в заголовке и тексте уведомления
+VARIABLES = {
+    'cycle': 'номер истекшего интервала с момента запуска',
+    'elapsed': 'время с момента запуска, Ч:ММ:СС',
+    'interval': 'длительность интервала, Ч:ММ:СС',
+    'time': 'текущее время, ЧЧ:ММ',
+}
+
+# Значения переменных того же типа, что при показе: на них проверяются форматы при разборе
+SAMPLES = {
+    'cycle': 1,
+    'elapsed': '0:00:00',
+    'interval': '0:00:00',
+    'time': '00:00',
+}
+
+
+def format_duration(seconds: float) -> str:
+    seconds = max(0, int(seconds))
+    return f'{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}'
+
+
+class Template:
+    """
+    Шаблон уведомления вида ``'Перерыв №{cycle}, работа {elapsed}'``.
+
+    Разбирается один раз при создании, ``render`` только склеивает готовые
+    части. Шаблон с ошибкой, неизвестной переменной или неподходящим
+    форматом (``{elapsed:d}``, вложенный ``{cycle:>{width}}``) выводится как есть
+    """
+
+    __slots__ = ('source', '_parts')
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        # (текст, переменная или ``None``, формат)
+        self._parts: tuple[tuple[str, str | None, str], ...] = ((source, None, ''),)
+
+        try:
+            parts = tuple(
+                (literal, field, spec or '')
+                for literal, field, spec, _ in Formatter().parse(source)
+            )
+        except ValueError as e:
+            logger.warning('Шаблон уведомления %r не разобран: %s', source, e)
+            return
+
+        unknown = {field for _, field, _ in parts if field is not None} - VARIABLES.keys()
+        if unknown:
+            logger.warning('Неизвестные переменные в шаблоне уведомления %r: %s', source, ', '.join(sorted(unknown)))
+            return
+
+        try:
+            for _, field, spec in parts:
+                if field is not None:
+                    format(SAMPLES[field], spec)
+        except ValueError as e:
+            logger.warning('Неверный формат в шаблоне уведомления %r: %s', source, e)
+            return
+        self._parts = parts
+
+    @property
+    def fields(self) -> set[str]:
+        return {field for _, field, _ in self._parts if field is not None}
+
+    def render(self, variables: Mapping[str, Any]) -> str:
+        """ Уведомление не теряется: если подстановка не удалась, выводится исходный текст """
+        try:
+            return ''.join(
+                literal if field is None else literal + format(variables[field], spec)
+                for literal, field, spec in self._parts
+            )
+        except (KeyError, ValueError, TypeError) as e:
+            logger.warning('Шаблон уведомления %r не подставлен: %r', self.source, e)
+            return self.source
+
+
+@lru_cache(maxsize=32)
+def compile_template(source: str) -> Template:
+    """ Шаблоны кэшируются по исходному тексту: повторные уведомления не разбирают его заново """
+    return Template(source)
@@ -0,0 +1,2 @@
+from .queue import Reminder, ReminderQueue
+from .service import ReminderScheduler
@@ -0,0 +1,110 @@
+import heapq
+import math
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class Reminder:
+    """ Запись об именованном напоминании. Без Qt-объектов и собственных таймеров """
+    name: str
+    interval: int       # Период, сек
+    title: str
+    text: str
+    deadline: float = 0.0
+    # Номер последнего планирования, уникальный в пределах очереди. Записи
+    # кучи со старым номером считаются удаленными и пропускаются
+    generation: int = 0
+
+
+class ReminderQueue:
+    """
+    Очередь напоминаний с приоритетом по ближайшему дедлайну.
+
+    Построена на двоичной куче с ленивым удалением: добавление
+    и перепланирование - O(log n), удаление - O(1) амортизированно.
+    Устаревшие записи вычищаются, когда их становится больше половины
+    """
+
+    def __init__(self) -> None:
+        # (дедлайн, поколение, имя). Поколение уникально и разрешает равные дедлайны
+        self._heap: list[tuple[float, int, str]] = []
+        self._reminders: dict[str, Reminder] = {}
+        # Счетчик поколений на всю очередь: одноименное напоминание, удаленное
+        # и добавленное заново, не совпадет ни с одной старой записью кучи
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._reminders)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._reminders
+
+    def __iter__(self):
+        return iter(self._reminders.values())
+
+    def get(self, name: str) -> Reminder | None:
+        return self._reminders.get(name)
+
+    def add(self, reminder: Reminder, now: float) -> None:
+        """ Добавляет напоминание (или заменяет одноименное) с дедлайном через один период """
+        if reminder.interval <= 0:
+            raise ValueError(f'Период напоминания должен быть положительным: {reminder.interval}')
+
+        self._reminders[reminder.name] = reminder
+        self._push(reminder, now + reminder.interval)
+
+    def remove(self, name: str) -> Reminder | None:
+        reminder = self._reminders.pop(name, None)
+        if reminder is not None:
+            self._compact()
+        return reminder
+
+    def reschedule(self, name: str, now: float, interval: int | None = None) -> Reminder:
+        """ Отсчитывает период заново от ``now``. Можно сменить период """
+        reminder = self._reminders[name]
+        if interval is not None:
+            if interval <= 0:
+                raise ValueError(f'Период напоминания должен быть положительным: {interval}')
+            reminder.interval = interval
+        self._push(reminder, now + reminder.interval)
+        return reminder
+
+    def peek(self) -> Reminder | None:
+        """ Напоминание с ближайшим дедлайном """
+        while self._heap:
+            _, generation, name = self._heap[0]
+            reminder = self._reminders.get(name)
+            if reminder is not None and reminder.generation == generation:
+                return reminder
+            heapq.heappop(self._heap)
+        return None
+
+    def pop_due(self, now: float) -> list[Reminder]:
+        """
+        Возвращает напоминания с наступившим дедлайном и планирует их
+        следующее срабатывание. Пропущенные периоды (например, во время сна)
+        не накапливаются - каждое напоминание срабатывает один раз
+        """
+        due = []
+        while (reminder := self.peek()) is not None and reminder.deadline <= now:
+            heapq.heappop(self._heap)
+            missed = math.floor((now - reminder.deadline) / reminder.interval)
+            self._push(reminder, reminder.deadline + (missed + 1) * reminder.interval)
+            due.append(reminder)
+        return due
+
+    def _push(self, reminder: Reminder, deadline: float) -> None:
+        reminder.deadline = deadline
+        self._sequence += 1
+        reminder.generation = self._sequence
+        heapq.heappush(self._heap, (deadline, reminder.generation, reminder.name))
+        self._compact()
+
+    def _compact(self) -> None:
+        if len(self._heap) <= 2 * len(self._reminders) + 16:
+            return
+        self._heap = [
+            (reminder.deadline, reminder.generation, reminder.name)
+            for reminder in self._reminders.values()
+        ]
+        heapq.heapify(self._heap)
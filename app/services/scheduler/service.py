@@ -0,0 +1,61 @@
+import math
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from ..clock import Clock, QtClock
+from .queue import Reminder, ReminderQueue
+
+
+class ReminderScheduler(QObject):
+    """
+    Планировщик произвольного числа именованных напоминаний.
+
+    Все напоминания обслуживает один таймер часов ``clock``, который
+    всегда спит до ближайшего дедлайна в очереди
+    """
+
+    # Выдает сработавший ``Reminder``
+    fired = Signal(object)
+
+    def __init__(self, clock: Clock | None = None) -> None:
+        super().__init__()
+
+        self.clock = clock or QtClock()
+        self.timer = self.clock.timer(self.on_timeout)
+        self.queue = ReminderQueue()
+
+    def add(self, name: str, interval: int, title: str, text: str) -> Reminder:
+        reminder = Reminder(name=name, interval=interval, title=title, text=text)
+        self.queue.add(reminder, self.clock.now())
+        self.arm()
+        return reminder
+
+    def remove(self, name: str) -> None:
+        if self.queue.remove(name) is not None:
+            self.arm()
+
+    def reschedule(self, name: str, interval: int | None = None) -> Reminder:
+        reminder = self.queue.reschedule(name, self.clock.now(), interval)
+        self.arm()
+        return reminder
+
+    def clear(self) -> None:
+        for reminder in list(self.queue):
+            self.queue.remove(reminder.name)
+        self.timer.stop()
+
+    def arm(self) -> None:
+        """ Планирует пробуждение на ближайший дедлайн """
+        reminder = self.queue.peek()
+        if reminder is None:
+            self.timer.stop()
+            return
+
+        delay = max(0.0, reminder.deadline - self.clock.now())
+        self.timer.start(math.ceil(delay * 1000))
+
+    @Slot()
+    def on_timeout(self) -> None:
+        for reminder in self.queue.pop_due(self.clock.now()):
+            self.fired.emit(reminder)
+        self.arm()
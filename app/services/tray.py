@@ -1,17 +1,50 @@
 from PySide6.QtCore import QObject
 from PySide6.QtWidgets import QSystemTrayIcon
-from PySide6.QtGui import QIcon
 
 from app.config import config
-from app.ui import TrayMenu
+from app.ui import ProgressAtlas, TrayMenu, frame_index, icons
 
 
 class Tray(QObject):
+    """
+    Иконка трея. Пока идет отсчет, показывает кольцо оставшегося времени:
+    иконка меняется, только когда меняется кадр прогресса
+    """
+
     def __init__(self) -> None:
         super().__init__()
 
-        self.icon = QSystemTrayIcon(QIcon(config.icons.tray_inactive), self)
-        self.icon.setToolTip(config.tray_title)
+        # Иконки состояний отсчета читаются с диска при запуске, а не на первом переходе
+        icons.preload(('tray_active', 'tray_inactive', 'tray_message'))
+        self.progress = ProgressAtlas()
+        # Текущая иконка: имя из ``config.icons`` или номер кадра прогресса
+        self._current: str | int = 'tray_inactive'
+
+        self.icon = QSystemTrayIcon(icons.get('tray_inactive'), self)
+        self._tooltip = config.tray_title
+        self.icon.setToolTip(self._tooltip)
         self.menu = TrayMenu()
         self.icon.setContextMenu(self.menu)
         self.icon.show()
+
+    def set_tooltip(self, text: str) -> None:
+        """ Обновляет тултип иконки, только если текст изменился """
+        if text == self._tooltip:
+            return
+        self._tooltip = text
+        self.icon.setToolTip(text)
+
+    def set_icon(self, name: str) -> None:
+        """ Статичная иконка по имени из ``config.icons`` """
+        if name == self._current:
+            return
+        self._current = name
+        self.icon.setIcon(icons.get(name))
+
+    def set_progress(self, remaining: int, total: int) -> None:
+        """ Кадр прогресса для остатка. Большинство тиков не меняют кадр и ничего не делают """
+        frame = frame_index(remaining, total, self.progress.frames)
+        if frame == self._current:
+            return
+        self._current = frame
+        self.icon.setIcon(self.progress.icon(frame))
@@ -0,0 +1,123 @@
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+# Путь к файлу отчета. Если задан - приложение завершается сразу после старта
+PROBE_ENV = 'EYE_REMINDER_PROBE'
+# Если задан - длительности фаз старта выводятся в stderr
+REPORT_ENV = 'EYE_REMINDER_STARTUP_REPORT'
+
+
+def peak_rss_bytes() -> int | None:
+    """ Пиковый объем резидентной памяти процесса в байтах. ``None`` - не удалось определить """
+    try:
+        import resource
+    except ImportError:
+        return _windows_peak_rss_bytes()
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux отдает килобайты, macOS - байты
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def rss_bytes() -> int | None:
+    """ Текущий объем резидентной памяти процесса в байтах. Где он недоступен (macOS) - пиковый """
+    if sys.platform == 'win32':
+        counters = _windows_memory_counters()
+        return counters.WorkingSetSize if counters is not None else None
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return peak_rss_bytes()
+
+
+def _windows_peak_rss_bytes() -> int | None:
+    counters = _windows_memory_counters()
+    return counters.PeakWorkingSetSize if counters is not None else None
+
+
+def _windows_memory_counters():
+    """ ``PROCESS_MEMORY_COUNTERS`` текущего процесса. ``None`` - не Windows или вызов не удался """
+    try:
+        import ctypes
+        from ctypes import wintypes
+    except ImportError:
+        return None
+
+    class ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [
+            ('cb', wintypes.DWORD),
+            ('PageFaultCount', wintypes.DWORD),
+            ('PeakWorkingSetSize', ctypes.c_size_t),
+            ('WorkingSetSize', ctypes.c_size_t),
+            ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+            ('PagefileUsage', ctypes.c_size_t),
+            ('PeakPagefileUsage', ctypes.c_size_t),
+        ]
+
+    counters = ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    process = ctypes.windll.kernel32.GetCurrentProcess()
+    if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+        return None
+    return counters
+
+
+class StartupProbe:
+    """
+    Замер холодного старта по фазам.
+
+    Создается как можно раньше в ``main.py``, фазы отмечаются через ``mark``.
+    Когда иконка трея показана и цикл событий запущен, ``ready`` выводит
+    отчет в stderr (``REPORT_ENV``) и / или пишет его в файл из ``PROBE_ENV``,
+    после чего завершает приложение. Без переменных окружения только
+    запоминает отметки времени
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.path = os.environ.get(PROBE_ENV)
+        self.phases: dict[str, float] = {}
+        self._last_mark = self.started
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    def mark(self, phase: str) -> None:
+        """ Завершает фазу старта, длительность отсчитывается от предыдущей отметки """
+        now = time.perf_counter()
+        self.phases[phase] = now - self._last_mark
+        self._last_mark = now
+
+    def report(self) -> dict:
+        return {
+            'ready_seconds': self._last_mark - self.started,
+            'phases': self.phases,
+            'peak_rss_bytes': peak_rss_bytes(),
+        }
+
+    def ready(self) -> None:
+        self.mark('event_loop')
+
+        if os.environ.get(REPORT_ENV):
+            for phase, duration in self.phases.items():
+                print(f'{phase:<16}{duration * 1000:>10.1f} ms', file=sys.stderr)
+            print(f'{"total":<16}{(self._last_mark - self.started) * 1000:>10.1f} ms', file=sys.stderr)
+
+        if not self.enabled:
+            return
+
+        from PySide6.QtWidgets import QApplication
+
+        Path(self.path).write_text(json.dumps(self.report()), encoding='utf-8')
+        QApplication.quit()
+
+
+startup = StartupProbe()
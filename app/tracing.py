@@ -0,0 +1,138 @@
+import logging
+import os
+import struct
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+
+# Путь к файлу трассы. Без переменной окружения запись не ведется
+TRACE_ENV = 'EYE_REMINDER_TRACE'
+
+MAGIC = b'ERTR'
+VERSION = 1
+
+# Заголовок: метка, версия, состояние отсчета, режим тиков, интервал (сек),
+# остаток (сек), календарное время начала записи (unix, сек)
+HEADER = struct.Struct('<4sBBBxIdd')
+# Запись: время от начала трассы по монотонным часам (мкс), код события, аргумент
+RECORD = struct.Struct('<QBi')
+
+# Код события - индекс в кортеже. Сигналы ``Countdown`` и ввод пользователя
+KINDS = (
+    'started', 'expired', 'updated', 'paused', 'stopped', 'restarted', 'suspended',
+    'input.start', 'input.pause', 'input.stop', 'input.seconds', 'input.tick_mode',
+)
+CODES = {kind: code for code, kind in enumerate(KINDS)}
+
+STATES = ('stopped', 'pending', 'paused', 'refreshing', 'suspended')
+
+logger = logging.getLogger(__name__)
+
+
+class Header(NamedTuple):
+    state: str
+    tick_mode: int
+    interval: int
+    remaining: float
+    wall_start: float
+
+
+class Record(NamedTuple):
+    time: float     # сек от начала трассы
+    kind: str
+    value: int
+
+
+def read_trace(path: Path) -> tuple[Header, list[Record]]:
+    """ Читает трассу целиком. Недописанная последняя запись отбрасывается """
+    data = Path(path).read_bytes()
+    magic, version, state, tick_mode, interval, remaining, wall_start = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f'{path}: не трасса EyeReminder версии {VERSION}')
+
+    header = Header(STATES[state], tick_mode, interval, remaining, wall_start)
+    body = memoryview(data)[HEADER.size:]
+    body = body[:len(body) - len(body) % RECORD.size]
+    records = [
+        Record(time_us / 1e6, KINDS[code], value)
+        for time_us, code, value in RECORD.iter_unpack(body)
+    ]
+    return header, records
+
+
+class TraceRecorder:
+    """
+    Запись сигналов обратного отсчета и ввода пользователя в двоичную трассу.
+
+    Включается переменной окружения ``TRACE_ENV``. Выключенный рекордер ничего
+    не подключает. Включенный пишет заголовок с состоянием отсчета на момент
+    подключения и по записи в 13 байт на событие через буфер файла, поэтому
+    тик дописывает в память несколько байт. Переходы и ввод сбрасывают буфер
+    на диск: при аварии теряются только тики после последнего перехода.
+    Время - монотонные часы отсчета.
+
+    Трасса воспроизводится ``python -m benchmarks --trace``
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        self.enabled = bool(path)
+        self.path = Path(path) if path else None
+        self._file: BinaryIO | None = None
+        self._clock = None
+        self._origin = 0.0
+
+    @classmethod
+    def from_env(cls) -> 'TraceRecorder':
+        return cls(os.environ.get(TRACE_ENV))
+
+    def watch_countdown(self, countdown) -> None:
+        """ Начинает трассу с текущего состояния ``countdown`` и подключается к его сигналам """
+        if not self.enabled:
+            return
+
+        self.close()
+        self._file = open(self.path, 'wb')
+        self._clock = countdown.clock
+        self._origin = countdown.clock.now()
+        self._file.write(HEADER.pack(
+            MAGIC, VERSION, STATES.index(countdown.state_name), countdown.tick_mode.value,
+            countdown.interval.total_seconds, max(0.0, countdown.time_left()), countdown.clock.wall(),
+        ))
+        self._file.flush()
+        logger.info('Запись трассы в %s', self.path)
+
+        countdown.started.connect(lambda: self.record('started'))
+        countdown.expired.connect(lambda: self.record('expired'))
+        countdown.updated.connect(lambda seconds: self.record('updated', seconds))
+        countdown.paused.connect(lambda: self.record('paused'))
+        countdown.stopped.connect(lambda: self.record('stopped'))
+        countdown.restarted.connect(lambda: self.record('restarted'))
+        countdown.suspended.connect(lambda: self.record('suspended'))
+
+    def watch_controller(self, controller) -> None:
+        """ Кнопки ``TimerController``. Подключать раньше обработчиков, чтобы ввод шел в трассе перед реакцией """
+        if not self.enabled:
+            return
+        controller.start.connect(lambda: self.record('input.start'))
+        controller.pause.connect(lambda: self.record('input.pause'))
+        controller.stop.connect(lambda: self.record('input.stop'))
+
+    def watch_adjuster(self, adjuster) -> None:
+        if not self.enabled:
+            return
+        adjuster.seconds_updated.connect(lambda seconds: self.record('input.seconds', seconds))
+
+    def record(self, kind: str, value: int = 0) -> None:
+        if self._file is None:
+            return
+        elapsed_us = round((self._clock.now() - self._origin) * 1e6)
+        self._file.write(RECORD.pack(elapsed_us, CODES[kind], value))
+        if kind != 'updated':
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+tracer = TraceRecorder.from_env()
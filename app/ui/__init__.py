@@ -1,3 +1,5 @@
+from .icons import IconRegistry, icons
+from .progress import ProgressAtlas, frame_index
 from .display import TimerDisplayer
 from .controls import TimerAdjuster, TimerController
 from .core import UIContainer
@@ -2,32 +2,58 @@ from PySide6.QtWidgets import (
     QWidget,
     QPushButton,
 )
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QTimer, Signal
 
 
 class HoldableButton(QPushButton):
     """
     Кнопка с поддержкой удержания.
 
-    При удержании каждые ``delay`` мс выдает сигнал ``clicked``.
+    Каждый шаг - обычное нажатие или повтор при удержании - выдает
+    ``stepped``. Повторы ускоряются со временем: интервал сокращается
+    от ``delay`` до ``min_delay`` мс. Число повторов с начала удержания
+    доступно в ``hold_count``. Щелчок, которым Qt завершает удержание
+    после ``released``, шага не добавляет.
     """
+
+    stepped = Signal()
+
     def __init__(
             self,
             label: str = '',
             delay: int = 100,
+            min_delay: int = 60,
+            acceleration: float = 0.9,
             parent: QWidget | None = None,
     ) -> None:
         super().__init__(label, parent=parent)
 
+        self.hold_count = 0
+        self._delay = delay
+        self._min_delay = min_delay
+        self._acceleration = acceleration
+
         self._timer = QTimer(self)
         self._timer.setInterval(delay)
-        self._timer.timeout.connect(self.clicked)
+        self._timer.timeout.connect(self.repeat)
 
         self.pressed.connect(self.start_holding)
         self.released.connect(self.stop_holding)
+        self.clicked.connect(self.click)
 
     def start_holding(self) -> None:
+        self.hold_count = 0
+        self._timer.setInterval(self._delay)
         self._timer.start()
 
     def stop_holding(self) -> None:
         self._timer.stop()
+
+    def click(self) -> None:
+        if self.hold_count == 0:
+            self.stepped.emit()
+
+    def repeat(self) -> None:
+        self.hold_count += 1
+        self._timer.setInterval(max(self._min_delay, int(self._timer.interval() * self._acceleration)))
+        self.stepped.emit()
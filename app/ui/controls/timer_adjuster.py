@@ -1,18 +1,45 @@
 from PySide6.QtWidgets import QHBoxLayout, QLabel, QWidget
-from PySide6.QtCore import Signal, Slot
-from PySide6.QtGui import QIcon, Qt
+from PySide6.QtCore import QTimer, Signal, Slot
+from PySide6.QtGui import Qt
 
 from app.schemas import TimeInterval
-from app.config import config
+from app.ui.icons import icons
 from app.ui.controls import HoldableButton
 
 
+# Шаги изменения при удержании: (число повторов, шаг). Чем дольше удержание, тем крупнее шаг
+HOURS_STEPS = ((0, 1),)
+MINUTES_STEPS = ((0, 1), (15, 5))
+SECONDS_STEPS = ((0, 1), (15, 5))
+
+# Не чаще одного пересчета интервала за кадр (~60 Гц), мс
+FRAME_MSEC = 16
+
+
+def step_value(value: int, delta: int, modulo: int) -> int:
+    """
+    Изменяет значение на ``delta`` по модулю ``modulo``.
+    При шаге больше единицы значение выравнивается на кратное шагу
+    """
+    step = abs(delta)
+    if step == 1:
+        return (value + delta) % modulo
+    if delta > 0:
+        return (value // step + 1) * step % modulo
+    return ((value + step - 1) // step - 1) * step % modulo
+
+
 class TimePartialAdjuster(QWidget):
     changed = Signal(int)
+    # Кнопка отпущена - серия изменений завершена. Для обычного нажатия
+    # выдается и после его шага: Qt выдает ``clicked`` после ``released``
+    committed = Signal()
 
-    def __init__(self, label_text: str):
+    def __init__(self, label_text: str, steps: tuple[tuple[int, int], ...] = HOURS_STEPS):
         super().__init__()
 
+        self.steps = steps
+
         layout = QHBoxLayout()
 
         self.label = QLabel(label_text)
@@ -21,32 +48,45 @@ class TimePartialAdjuster(QWidget):
         layout.addWidget(self.label)
 
         self.decrement_btn = HoldableButton()
-        self.decrement_btn.setIcon(QIcon(config.icons.minus))
+        self.decrement_btn.setIcon(icons.get('minus'))
         self.decrement_btn.setMaximumWidth(35)
-        self.decrement_btn.clicked.connect(self.decrement)
+        self.decrement_btn.stepped.connect(self.decrement)
+        self.decrement_btn.released.connect(self.committed)
+        self.decrement_btn.clicked.connect(self.committed)
         layout.addWidget(self.decrement_btn)
 
         self.increment_btn = HoldableButton()
-        self.increment_btn.setIcon(QIcon(config.icons.plus))
+        self.increment_btn.setIcon(icons.get('plus'))
         self.increment_btn.setMaximumWidth(35)
-        self.increment_btn.clicked.connect(self.increment)
+        self.increment_btn.stepped.connect(self.increment)
+        self.increment_btn.released.connect(self.committed)
+        self.increment_btn.clicked.connect(self.committed)
         layout.addWidget(self.increment_btn)
 
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
         self.setLayout(layout)
 
+    def step(self, button: HoldableButton) -> int:
+        """ Шаг изменения с учетом длительности удержания кнопки """
+        return next(step for repeats, step in reversed(self.steps) if button.hold_count >= repeats)
+
     @Slot()
     def decrement(self) -> None:
-        self.changed.emit(-1)
+        self.changed.emit(-self.step(self.decrement_btn))
 
     @Slot()
     def increment(self) -> None:
-        self.changed.emit(1)
+        self.changed.emit(self.step(self.increment_btn))
 
 
 class TimerAdjuster(QWidget):
-    """ Виджет для настройки интервала таймера """
+    """
+    Виджет для настройки интервала таймера.
+
+    Изменения при удержании кнопок объединяются: ``seconds_updated``
+    выдается не чаще раза за кадр и сразу при отпускании кнопки
+    """
 
     seconds_updated = Signal(int)
 
@@ -57,18 +97,26 @@ class TimerAdjuster(QWidget):
 
         layout = QHBoxLayout()
 
-        self.hours_adjuster = TimePartialAdjuster('ЧЧ:')
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(FRAME_MSEC)
+        self._emit_timer.timeout.connect(self.emit_time)
+
+        self.hours_adjuster = TimePartialAdjuster('ЧЧ:', HOURS_STEPS)
         self.hours_adjuster.changed.connect(self.update_hours)
         layout.addWidget(self.hours_adjuster)
 
-        self.minutes_adjuster = TimePartialAdjuster('ММ:')
+        self.minutes_adjuster = TimePartialAdjuster('ММ:', MINUTES_STEPS)
         self.minutes_adjuster.changed.connect(self.update_minutes)
         layout.addWidget(self.minutes_adjuster)
 
-        self.seconds_adjuster = TimePartialAdjuster('СС:')
+        self.seconds_adjuster = TimePartialAdjuster('СС:', SECONDS_STEPS)
         self.seconds_adjuster.changed.connect(self.update_seconds)
         layout.addWidget(self.seconds_adjuster)
 
+        for t_adj in (self.hours_adjuster, self.minutes_adjuster, self.seconds_adjuster):
+            t_adj.committed.connect(self.commit)
+
         layout.setContentsMargins(0, 0, 0, 0)
         self.setLayout(layout)
 
@@ -77,6 +125,7 @@ class TimerAdjuster(QWidget):
 
     def disable(self) -> None:
         """ Блокирует кнопки контроля таймера """
+        self.commit()
         for t_adj in (self.hours_adjuster, self.minutes_adjuster, self.seconds_adjuster):
             t_adj.decrement_btn.setEnabled(False)
             t_adj.increment_btn.setEnabled(False)
@@ -89,18 +138,31 @@ class TimerAdjuster(QWidget):
 
     @Slot(int)
     def update_hours(self, delta: int) -> None:
-        self.interval.hours = (self.interval.hours + delta) % 100
-        self.emit_time()
+        self.interval.hours = step_value(self.interval.hours, delta, 100)
+        self.schedule_emit()
 
     @Slot(int)
     def update_minutes(self, delta: int) -> None:
-        self.interval.minutes = (self.interval.minutes + delta) % 60
-        self.emit_time()
+        self.interval.minutes = step_value(self.interval.minutes, delta, 60)
+        self.schedule_emit()
 
     @Slot(int)
     def update_seconds(self, delta: int) -> None:
-        self.interval.seconds = (self.interval.seconds + delta) % 60
-        self.emit_time()
+        self.interval.seconds = step_value(self.interval.seconds, delta, 60)
+        self.schedule_emit()
+
+    def schedule_emit(self) -> None:
+        """ Откладывает выдачу до конца кадра, объединяя частые изменения """
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
 
+    @Slot()
+    def commit(self) -> None:
+        """ Немедленно выдает отложенное значение """
+        if self._emit_timer.isActive():
+            self._emit_timer.stop()
+            self.emit_time()
+
+    @Slot()
     def emit_time(self) -> None:
         self.seconds_updated.emit(self.interval.total_seconds)
@@ -2,9 +2,10 @@ from typing import Literal, Type
 
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QPushButton, QMenu
 from PySide6.QtCore import Signal, QObject
-from PySide6.QtGui import QIcon, QAction
+from PySide6.QtGui import QAction
 
 from app.config import config
+from app.ui.icons import icons
 
 
 class TimerController(QObject):
@@ -33,7 +34,7 @@ class TimerController(QObject):
 
         config_field = f'timer_{action_key}'
         btn = action_class(getattr(config.labels, config_field))
-        btn.setIcon(QIcon(getattr(config.icons, config_field)))
+        btn.setIcon(icons.get(config_field))
         btn.setToolTip(getattr(config.tooltips, config_field))
         self.__get_signal(btn).connect(getattr(self, action_key))
         return btn
@@ -6,9 +6,9 @@ from PySide6.QtWidgets import (
     QPlainTextEdit,
     QPushButton,
 )
-from PySide6.QtGui import QIcon
 
 from app.config import config
+from app.ui.icons import icons
 from app.ui import TimerDisplayer, TimerAdjuster, TimerController
 
 
@@ -40,7 +40,7 @@ class UIContainer(QWidget):
         layout.addWidget(self.text_editor)
 
         self.save_button = QPushButton('Сохранить')
-        self.save_button.setIcon(QIcon(config.icons.save))
+        self.save_button.setIcon(icons.get('save'))
         self.save_button.setToolTip(config.tooltips.save)
         layout.addWidget(self.save_button)
 
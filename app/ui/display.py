@@ -1,22 +1,78 @@
 from PySide6.QtWidgets import QWidget, QLCDNumber
-from PySide6.QtGui import QPalette, QColor
+from PySide6.QtCore import Signal
+from PySide6.QtGui import QPalette, QColor, QShowEvent, QHideEvent
 
 from app.schemas import TimeInterval
 
 
+def format_seconds(seconds: int) -> str:
+    """ Форматирует секунды в ``ЧЧ:ММ:СС`` """
+    return TimeInterval.from_seconds(seconds).string
+
+
 class TimerDisplayer(QLCDNumber):
-    """ Виджет для отображения оставшегося времени """
+    """
+    Виджет для отображения оставшегося времени.
+
+    Перерисовывается только при изменении значения и только пока виден.
+    Пропущенное значение отображается при следующем показе
+    """
+
+    # Выдается при показе и скрытии виджета (в т.ч. вместе с родителем)
+    visibility_changed = Signal(bool)
+
+    # Палитры активного и неактивного состояния, общие для всех экземпляров
+    _palettes: dict[bool, QPalette] = {}
 
     def __init__(self, parent: QWidget | None = None, min_height: int = 100) -> None:
         super().__init__(parent)
+        self.is_shown = False
+        self._is_active: bool | None = None
+        self._seconds = 0
+        self._displayed_seconds: int | None = None
+
         self.setSegmentStyle(QLCDNumber.Filled)
         self.set_active(False)
         self.setDigitCount(8)
         self.setMinimumHeight(min_height)
-        self.display(TimeInterval.from_seconds(0).string)
+        self._refresh()
+
+    @classmethod
+    def palette_for(cls, is_active: bool) -> QPalette:
+        palette = cls._palettes.get(is_active)
+        if palette is None:
+            color = QColor(0, 0, 0) if is_active else QColor(100, 100, 100)
+            palette = QPalette()
+            palette.setColor(QPalette.Active, QPalette.WindowText, color)
+            cls._palettes[is_active] = palette
+        return palette
 
     def set_active(self, is_active: bool) -> None:
-        color = QColor(0, 0, 0) if is_active else QColor(100, 100, 100)
-        palette = QPalette()
-        palette.setColor(QPalette.Active, QPalette.WindowText, color)
-        self.setPalette(palette)
+        if is_active == self._is_active:
+            return
+        self._is_active = is_active
+        self.setPalette(self.palette_for(is_active))
+
+    def set_seconds(self, seconds: int) -> None:
+        """ Запоминает значение. Виджет перерисовывается, только если он виден """
+        self._seconds = seconds
+        if self.is_shown:
+            self._refresh()
+
+    def _refresh(self) -> None:
+        """ Отображает последнее значение, если оно еще не отображено """
+        if self._seconds == self._displayed_seconds:
+            return
+        self._displayed_seconds = self._seconds
+        self.display(format_seconds(self._seconds))
+
+    def showEvent(self, event: QShowEvent) -> None:
+        super().showEvent(event)
+        self.is_shown = True
+        self._refresh()
+        self.visibility_changed.emit(True)
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        super().hideEvent(event)
+        self.is_shown = False
+        self.visibility_changed.emit(False)
@@ -0,0 +1,78 @@
+from dataclasses import asdict, dataclass, fields
+from typing import Iterable
+
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QIcon, QPixmap
+
+from app.config import config
+
+
+@dataclass
+class CacheStats:
+    """ Счетчики обращений к кэшу. Промах - декодирование файла или растеризация """
+    hits: int = 0
+    misses: int = 0
+
+
+class IconRegistry:
+    """
+    Общий реестр иконок приложения.
+
+    Каждый файл из ``config.icons`` декодируется один раз, а все потребители
+    получают один и тот же экземпляр ``QIcon``. Растровые изображения
+    кэшируются отдельно для каждой пары размер / device pixel ratio.
+    """
+
+    def __init__(self) -> None:
+        self._icons: dict[str, QIcon] = {}
+        self._pixmaps: dict[tuple[str, int, float], QPixmap] = {}
+        self.icon_stats = CacheStats()
+        self.pixmap_stats = CacheStats()
+
+    def get(self, name: str) -> QIcon:
+        """
+        Возвращает иконку по имени поля ``IconPaths``
+        :param name: например, ``'tray_active'``
+        """
+        icon = self._icons.get(name)
+        if icon is not None:
+            self.icon_stats.hits += 1
+            return icon
+
+        self.icon_stats.misses += 1
+        icon = QIcon(QPixmap(getattr(config.icons, name)))
+        self._icons[name] = icon
+        return icon
+
+    def pixmap(self, name: str, size: int, device_pixel_ratio: float = 1.0) -> QPixmap:
+        """ Возвращает растровое изображение иконки для заданного размера и DPR """
+        key = (name, size, device_pixel_ratio)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmap_stats.hits += 1
+            return pixmap
+
+        self.pixmap_stats.misses += 1
+        pixmap = self.get(name).pixmap(QSize(size, size), device_pixel_ratio)
+        self._pixmaps[key] = pixmap
+        return pixmap
+
+    def preload(self, names: Iterable[str] | None = None) -> None:
+        """ Декодирует иконки заранее, чтобы они не читались с диска во время работы. По умолчанию - все """
+        if names is None:
+            names = [icon_field.name for icon_field in fields(config.icons)]
+        for name in names:
+            self.get(name)
+
+    def clear(self) -> None:
+        """ Сбрасывает кэши и счетчики. Для замеров, которые должны начинаться с холодного кэша """
+        self._icons.clear()
+        self._pixmaps.clear()
+        self.icon_stats = CacheStats()
+        self.pixmap_stats = CacheStats()
+
+    def report(self) -> dict[str, dict[str, int]]:
+        """ Обращения к кэшам: промах иконки - чтение файла, промах растра - растеризация """
+        return {'icons': asdict(self.icon_stats), 'pixmaps': asdict(self.pixmap_stats)}
+
+icons = IconRegistry()
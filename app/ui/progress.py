@@ -0,0 +1,93 @@
+import math
+
+from PySide6.QtCore import QRect, QRectF, Qt
+from PySide6.QtGui import QColor, QGuiApplication, QIcon, QPainter, QPen, QPixmap
+
+from .icons import icons
+
+# Число кадров прогресса: кадр 0 - время вышло, последний - полный интервал
+FRAMES = 32
+
+# Логические размеры иконки трея на разных платформах
+TRAY_SIZES = (16, 22, 24, 32)
+
+
+def frame_index(remaining: int, total: int, frames: int = FRAMES) -> int:
+    """ Кадр для остатка: округление вверх, чтобы последний кадр пустел только при истечении """
+    if total <= 0 or remaining <= 0:
+        return 0
+    return min(frames - 1, math.ceil(remaining / total * (frames - 1)))
+
+
+class ProgressAtlas:
+    """
+    Кадры иконки трея с кольцом оставшегося времени.
+
+    Для каждой пары размер / device pixel ratio все кадры рисуются один раз
+    в одну полосу (атлас). ``QIcon`` кадра собирается из вырезок атласов
+    всех размеров и кэшируется, поэтому повторный показ кадра ничего не рисует
+    """
+
+    def __init__(self, base: str = 'tray_active', frames: int = FRAMES) -> None:
+        self.base = base
+        self.frames = frames
+        self.ring_color = QColor(76, 175, 80)
+        self.track_color = QColor(0, 0, 0, 70)
+        self._atlases: dict[tuple[int, float], QPixmap] = {}
+        self._icons: dict[int, QIcon] = {}
+
+    @staticmethod
+    def device_pixel_ratios() -> list[float]:
+        ratios = {screen.devicePixelRatio() for screen in QGuiApplication.screens()}
+        return sorted(ratios or {1.0})
+
+    def atlas(self, size: int, device_pixel_ratio: float) -> QPixmap:
+        """ Полоса из ``frames`` кадров, рисуется при первом обращении """
+        key = (size, device_pixel_ratio)
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            atlas = self._atlases[key] = self.render(size, device_pixel_ratio)
+        return atlas
+
+    def render(self, size: int, device_pixel_ratio: float) -> QPixmap:
+        side = round(size * device_pixel_ratio)
+        base = icons.pixmap(self.base, size, device_pixel_ratio)
+
+        atlas = QPixmap(side * self.frames, side)
+        atlas.fill(Qt.transparent)
+        pen_width = max(1.0, side / 8)
+        inset = pen_width / 2
+
+        track_pen = QPen(self.track_color, pen_width)
+        ring_pen = QPen(self.ring_color, pen_width, Qt.SolidLine, Qt.FlatCap)
+
+        painter = QPainter(atlas)
+        painter.setRenderHint(QPainter.Antialiasing)
+        for frame in range(self.frames):
+            cell = QRectF(frame * side, 0, side, side)
+            painter.drawPixmap(cell.toRect(), base)
+            ring = cell.adjusted(inset, inset, -inset, -inset)
+
+            painter.setPen(track_pen)
+            painter.drawEllipse(ring)
+            if frame:
+                painter.setPen(ring_pen)
+                # От 12 часов по часовой стрелке, углы в 1/16 градуса
+                painter.drawArc(ring, 90 * 16, -round(frame / (self.frames - 1) * 360 * 16))
+        painter.end()
+        return atlas
+
+    def icon(self, frame: int) -> QIcon:
+        icon = self._icons.get(frame)
+        if icon is not None:
+            return icon
+
+        icon = QIcon()
+        for device_pixel_ratio in self.device_pixel_ratios():
+            for size in TRAY_SIZES:
+                side = round(size * device_pixel_ratio)
+                pixmap = self.atlas(size, device_pixel_ratio).copy(QRect(frame * side, 0, side, side))
+                pixmap.setDevicePixelRatio(device_pixel_ratio)
+                icon.addPixmap(pixmap)
+        self._icons[frame] = icon
+        return icon
@@ -1,8 +1,7 @@
 from PySide6.QtWidgets import QMenu, QWidgetAction
-from PySide6.QtGui import QIcon
 
 from app.ui import TimerDisplayer, TimerController
-from app.config import config
+from app.ui.icons import icons
 
 
 class TrayMenu(QMenu):
@@ -17,7 +16,7 @@ class TrayMenu(QMenu):
         self.addSeparator()
 
         self.settings_action = self.addAction('НАСТРОЙКИ')
-        self.settings_action.setIcon(QIcon(config.icons.settings))
+        self.settings_action.setIcon(icons.get('settings'))
 
         self.addSeparator()
 
@@ -27,7 +26,7 @@ class TrayMenu(QMenu):
         self.addSeparator()
 
         self.exit_action = self.addAction('ВЫХОД')
-        self.exit_action.setIcon(QIcon(config.icons.shutdown))
+        self.exit_action.setIcon(icons.get('shutdown'))
 
     def __init_timer_controller_ui(self) -> None:
         for idx, action in enumerate(self.timer_controller.tray_ui, start=1):
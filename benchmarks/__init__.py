@@ -0,0 +1,6 @@
+"""
+Бенчмарки горячих путей обратного отсчета и UI.
+
+Запуск из корня репозитория: ``python -m benchmarks``.
+Работают на платформе Qt ``offscreen`` и не требуют дисплея
+"""
@@ -0,0 +1,96 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+# Настройки, журнал, контрольная точка - во временном каталоге, а не в каталоге пользователя.
+# Переменная задается до импорта ``app`` и наследуется процессами замера старта
+CONFIG_DIR = tempfile.TemporaryDirectory(prefix='eye-reminder-bench-', ignore_cleanup_errors=True)
+os.environ.setdefault('EYE_REMINDER_CONFIG_DIR', CONFIG_DIR.name)
+
+# Информационные метрики, которые не сравниваются с baseline
+NOT_COMPARED = {'drift.cycles', 'day.cycles', 'day.wakeups'}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Бенчмарки EyeReminder')
+    parser.add_argument('cases', nargs='*', help='сценарии для запуска (по умолчанию все)')
+    parser.add_argument('-o', '--output', type=Path, help='файл для JSON-результатов')
+    parser.add_argument('-b', '--baseline', type=Path, help='JSON предыдущего прогона для сравнения')
+    parser.add_argument(
+        '--trace', type=Path,
+        help='воспроизвести трассу EYE_REMINDER_TRACE (без сценариев, если они не указаны явно)',
+    )
+    parser.add_argument(
+        '-t', '--tolerance', type=float, default=0.2,
+        help='допустимый относительный рост метрики относительно baseline',
+    )
+    return parser.parse_args()
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], tolerance: float) -> list[str]:
+    """ Для сравниваемых метрик чем меньше, тем лучше. Возвращает описания регрессий """
+    regressions = []
+    for name, value in results.items():
+        # Счетчики событий описывают нагрузку, а не стоимость
+        if name in NOT_COMPARED or name.endswith('.count'):
+            continue
+        previous = baseline.get(name)
+        if not previous or previous <= 0:
+            continue
+        if value > previous * (1 + tolerance):
+            regressions.append(f'{name}: {previous:.6g} -> {value:.6g}')
+    return regressions
+
+
+def main() -> int:
+    args = parse_args()
+
+    from PySide6 import __version__ as pyside_version
+    from benchmarks.cases import CASES
+
+    unknown = set(args.cases) - CASES.keys()
+    if unknown:
+        print(f'Неизвестные сценарии: {", ".join(sorted(unknown))}', file=sys.stderr)
+        return 2
+
+    results = {}
+    if args.trace:
+        from benchmarks.replay import replay
+
+        results.update(replay(args.trace))
+    for name, case in CASES.items():
+        if name in args.cases or not (args.cases or args.trace):
+            results.update(case())
+
+    report = {
+        'meta': {
+            'timestamp': time.time(),
+            'python': platform.python_version(),
+            'pyside': pyside_version,
+            'platform': platform.platform(),
+        },
+        'results': results,
+    }
+    payload = json.dumps(report, indent=4)
+    if args.output:
+        args.output.write_text(payload, encoding='utf-8')
+    print(payload)
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding='utf-8'))['results']
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f'РЕГРЕССИЯ {regression}', file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
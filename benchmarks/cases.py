@@ -0,0 +1,235 @@
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from PySide6.QtWidgets import QApplication
+
+from app.services.clock import VirtualClock
+from app.startup import PROBE_ENV, peak_rss_bytes
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+def application() -> QApplication:
+    return QApplication.instance() or QApplication([])
+
+
+def create_window():
+    """
+    Создает ``EyeReminder`` на виртуальных часах.
+    Действия по истечении и доставка уведомлений отключены: замеряется только постановка в очередь.
+    Контрольная точка отключена: календарное время виртуальных часов начинается с 1970 года
+    """
+    from app.core import EyeReminder
+
+    application()
+    clock = VirtualClock()
+    window = EyeReminder(clock, checkpoint_path=None)
+    window.hooks.hooks = []
+    window.notifications.backends = []
+    return window, clock
+
+
+def bench_tick(ticks: int = 20_000) -> dict[str, float]:
+    """
+    Стоимость одного тика: ``Countdown.on_update`` и цепочка слотов ``EyeReminder``.
+    Замеряется при скрытом окне и при открытом окне настроек
+    """
+    app = application()
+    window, clock = create_window()
+    countdown = window.countdown
+    countdown.set_interval(99 * 3600)
+    countdown.on_start()
+
+    results = {}
+    for case, visible in (('hidden', False), ('visible', True)):
+        window.setVisible(visible)
+        app.processEvents()
+
+        durations = []
+        for _ in range(ticks):
+            clock.sleep(1.0)
+            begin = time.perf_counter_ns()
+            countdown.on_update()
+            durations.append(time.perf_counter_ns() - begin)
+
+        results[f'tick.{case}.mean_us'] = statistics.fmean(durations) / 1000
+        results[f'tick.{case}.p99_us'] = statistics.quantiles(durations, n=100)[98] / 1000
+
+    countdown.on_stop()
+    window.hide()
+    return results
+
+
+def bench_drift(hours: float = 8.0, interval: int = 3000, seed: int = 1) -> dict[str, float]:
+    """
+    Имитирует многочасовую работу с опаздывающими тиками и уходами в сон.
+    Погрешность - разница между фактическим истечением и дедлайном цикла
+    """
+    window, clock = create_window()
+    countdown = window.countdown
+    countdown.set_interval(interval)
+
+    rnd = random.Random(seed)
+    cycle_started = 0.0
+    errors = []
+
+    def on_started() -> None:
+        nonlocal cycle_started
+        cycle_started = clock.now()
+
+    def on_expired() -> None:
+        errors.append(clock.now() - (cycle_started + interval))
+
+    countdown.started.connect(on_started)
+    countdown.restarted.connect(on_started)
+    countdown.expired.connect(on_expired)
+    countdown.on_start()
+
+    wakeups = 0
+    end = hours * 3600
+    while clock.now() < end:
+        lateness = rnd.uniform(0.0, 0.05)
+        if rnd.random() < 0.001:
+            lateness += rnd.uniform(10.0, 600.0)    # сон / зависание цикла событий
+        clock.step(lateness)
+        wakeups += 1
+
+    countdown.on_stop()
+    countdown.started.disconnect(on_started)
+    countdown.restarted.disconnect(on_started)
+    countdown.expired.disconnect(on_expired)
+
+    return {
+        'drift.cycles': len(errors),
+        'drift.wakeups_per_hour': wakeups / hours,
+        'drift.accumulated_s': sum(errors),
+        'drift.max_expiry_error_s': max(errors, default=0.0),
+    }
+
+
+def bench_day(hours: float = 8.0, interval: int = 3000) -> dict[str, float]:
+    """
+    Рабочий день циклов Pending -> Refreshing -> Pending на виртуальных часах без опозданий.
+    Каждое истечение должно прийтись точно на дедлайн цикла
+    """
+    window, clock = create_window()
+    countdown = window.countdown
+    countdown.set_interval(interval)
+
+    expirations = []
+    countdown.expired.connect(lambda: expirations.append(clock.now()))
+
+    begin = time.perf_counter()
+    countdown.on_start()
+    fired = clock.advance(hours * 3600)
+    wall = time.perf_counter() - begin
+    countdown.on_stop()
+
+    # Цикл - интервал плюс пауза перезапуска ``Countdown.tick_msec``
+    period = interval + countdown.tick_msec / 1000
+    errors = [moment - (index * period + interval) for index, moment in enumerate(expirations)]
+    return {
+        'day.cycles': len(expirations),
+        'day.wakeups': fired,
+        'day.wall_ms': wall * 1000,
+        'day.max_expiry_error_s': max(map(abs, errors), default=0.0),
+    }
+
+
+def bench_icons(hours: float = 8.0, interval: int = 600) -> dict[str, float]:
+    """
+    Обращения к диску за иконками после старта: рабочий день циклов с паузами
+    и остановками при закрытом окне настроек. Ожидается ``0`` чтений файлов.
+    Кэш иконок общий для процесса, поэтому сценарий начинается с пустого:
+    растеризации - по одной на размер атласа прогресса при первом запуске
+    отсчета, независимо от сценариев, выполненных раньше
+    """
+    from app.ui import icons
+
+    icons.clear()
+    window, clock = create_window()
+    countdown = window.countdown
+    countdown.set_interval(interval)
+    before = icons.report()
+
+    countdown.on_start()
+    end = hours * 3600
+    while clock.now() < end:
+        clock.advance(interval / 2)
+        countdown.on_pause()
+        countdown.on_start()
+    countdown.on_stop()
+
+    after = icons.report()
+    return {
+        'icons.runtime_file_reads': after['icons']['misses'] - before['icons']['misses'],
+        'icons.runtime_rasterizations': after['pixmaps']['misses'] - before['pixmaps']['misses'],
+    }
+
+
+def bench_startup(runs: int = 5, timeout: float = 60.0) -> dict[str, float]:
+    """
+    Холодный старт: от запуска ``main.py`` до показа иконки в трее.
+    Также возвращает пиковый RSS процесса приложения
+    """
+    wall, ready, rss = [], [], []
+    phases: dict[str, list[float]] = {}
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        report_path = Path(tmp_dir) / 'probe.json'
+        env[PROBE_ENV] = str(report_path)
+
+        for _ in range(runs):
+            report_path.unlink(missing_ok=True)
+            begin = time.perf_counter()
+            subprocess.run(
+                [sys.executable, str(ROOT_DIR / 'main.py')],
+                cwd=ROOT_DIR,
+                env=env,
+                timeout=timeout,
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            wall.append(time.perf_counter() - begin)
+
+            report = json.loads(report_path.read_text(encoding='utf-8'))
+            ready.append(report['ready_seconds'])
+            for phase, duration in report['phases'].items():
+                phases.setdefault(phase, []).append(duration)
+            if report['peak_rss_bytes'] is not None:
+                rss.append(report['peak_rss_bytes'])
+
+    results = {
+        'startup.process_wall_s': statistics.median(wall),
+        'startup.main_to_tray_s': statistics.median(ready),
+    }
+    for phase, durations in phases.items():
+        results[f'startup.phase.{phase}_s'] = statistics.median(durations)
+    if rss:
+        results['startup.peak_rss_mb'] = max(rss) / 2 ** 20
+    return results
+
+
+def bench_memory() -> dict[str, float]:
+    """ Пиковый RSS процесса бенчмарков после прогона остальных сценариев """
+    peak = peak_rss_bytes()
+    return {} if peak is None else {'memory.bench_peak_rss_mb': peak / 2 ** 20}
+
+
+CASES = {
+    'tick': bench_tick,
+    'drift': bench_drift,
+    'day': bench_day,
+    'icons': bench_icons,
+    'startup': bench_startup,
+    'memory': bench_memory,
+}
@@ -0,0 +1,88 @@
+import statistics
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from app.services.countdown import EVENTS, TickMode
+from app.tracing import Header, read_trace
+from benchmarks.cases import create_window
+
+
+def restore(countdown, header: Header) -> None:
+    """ Приводит отсчет к состоянию из заголовка трассы """
+    countdown.on_stop()
+    countdown.set_interval(header.interval)
+    countdown.set_tick_mode(TickMode(header.tick_mode))
+    if header.state in ('pending', 'refreshing'):
+        countdown.resume_from(header.remaining, 'start')
+    elif header.state == 'paused':
+        countdown.resume_from(header.remaining, 'restore')
+    elif header.state == 'suspended':
+        countdown.dispatch('suspend')
+
+
+def replay(path: Path) -> dict[str, float]:
+    """
+    Воспроизводит трассу в ``EyeReminder`` на виртуальных часах без ожидания.
+
+    Ввод из трассы подается в те же сигналы ``TimerController`` и
+    ``TimerAdjuster``, сигналы отсчета порождаются заново его тиками.
+    Стоимость замеряется для каждого ввода и каждого срабатывания таймера
+    и группируется по виду: ``input.<команда>`` или ``timer.<сигналы тика>``.
+    ``replay.diverged.count`` - насколько число сигналов разошлось с записанным
+    """
+    header, records = read_trace(path)
+
+    window, clock = create_window()
+    window.build_ui()
+    countdown = window.countdown
+    restore(countdown, header)
+
+    emitted: list[str] = []
+    for event in EVENTS:
+        getattr(countdown, event).connect(lambda *_, name=event: emitted.append(name))
+
+    controller = window.tray.menu.timer_controller
+    inputs = {
+        'input.start': lambda _: controller.start.emit(),
+        'input.pause': lambda _: controller.pause.emit(),
+        'input.stop': lambda _: controller.stop.emit(),
+        'input.seconds': lambda value: window.ui.timer_adjuster.seconds_updated.emit(value),
+        'input.tick_mode': lambda value: countdown.set_tick_mode(TickMode(value)),
+    }
+
+    durations: defaultdict[str, list[int]] = defaultdict(list)
+    replayed: Counter[str] = Counter()
+
+    def measure(kind: str | None, action) -> None:
+        emitted.clear()
+        begin = time.perf_counter_ns()
+        action()
+        duration = time.perf_counter_ns() - begin
+        durations[kind or 'timer.' + ('+'.join(emitted) or 'idle')].append(duration)
+        replayed.update(emitted)
+
+    begin = time.perf_counter()
+    for record in records:
+        while (due := clock.next_due()) is not None and due <= record.time:
+            measure(None, clock.step)
+        if record.time > clock.now():
+            clock.sleep(record.time - clock.now())
+
+        handler = inputs.get(record.kind)
+        if handler is not None:
+            measure(record.kind, lambda: handler(record.value))
+    wall = time.perf_counter() - begin
+    countdown.on_stop()
+
+    recorded = Counter(record.kind for record in records if record.kind in EVENTS)
+    results = {
+        'replay.events.count': len(records),
+        'replay.wall_ms': wall * 1000,
+        'replay.diverged.count': sum(((recorded - replayed) + (replayed - recorded)).values()),
+    }
+    for kind, values in sorted(durations.items()):
+        results[f'replay.{kind}.count'] = len(values)
+        results[f'replay.{kind}.mean_us'] = statistics.fmean(values) / 1000
+        results[f'replay.{kind}.max_us'] = max(values) / 1000
+    return results
@@ -1,21 +1,176 @@
-import PyInstaller.__main__
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
 from pathlib import Path
 
+import PyInstaller.__main__
+
 
 MAIN_DIR = Path(__file__).parent.absolute()
 MAIN_SCRIPT = MAIN_DIR / 'main.py'
+DIST_DIR = MAIN_DIR / 'dist'
+BUILD_DIR = MAIN_DIR / 'build'
+APP_NAME = 'EyeReminder'
 
+# Переменная окружения ``app.startup.PROBE_ENV``: приложение пишет отчет о старте и завершается
+PROBE_ENV = 'EYE_REMINDER_PROBE'
 
-def install() -> None:
-    PyInstaller.__main__.run([
+# Приложение использует только QtCore, QtGui, QtWidgets и QtNetwork (локальный сокет управления)
+EXCLUDED_MODULES = (
+    'PySide6.Qt3DAnimation', 'PySide6.Qt3DCore', 'PySide6.Qt3DExtras', 'PySide6.Qt3DInput',
+    'PySide6.Qt3DLogic', 'PySide6.Qt3DRender', 'PySide6.QtBluetooth', 'PySide6.QtCharts',
+    'PySide6.QtConcurrent', 'PySide6.QtDataVisualization', 'PySide6.QtDesigner',
+    'PySide6.QtGraphs', 'PySide6.QtHelp', 'PySide6.QtHttpServer', 'PySide6.QtLocation',
+    'PySide6.QtMultimedia', 'PySide6.QtMultimediaWidgets',
+    'PySide6.QtNetworkAuth', 'PySide6.QtNfc', 'PySide6.QtOpenGL', 'PySide6.QtOpenGLWidgets',
+    'PySide6.QtPdf', 'PySide6.QtPdfWidgets', 'PySide6.QtPositioning', 'PySide6.QtPrintSupport',
+    'PySide6.QtQml', 'PySide6.QtQuick', 'PySide6.QtQuick3D', 'PySide6.QtQuickControls2',
+    'PySide6.QtQuickWidgets', 'PySide6.QtRemoteObjects', 'PySide6.QtScxml', 'PySide6.QtSensors',
+    'PySide6.QtSerialBus', 'PySide6.QtSerialPort', 'PySide6.QtSpatialAudio', 'PySide6.QtSql',
+    'PySide6.QtStateMachine', 'PySide6.QtSvg', 'PySide6.QtSvgWidgets', 'PySide6.QtTest',
+    'PySide6.QtTextToSpeech', 'PySide6.QtUiTools', 'PySide6.QtWebChannel', 'PySide6.QtWebEngineCore',
+    'PySide6.QtWebEngineQuick', 'PySide6.QtWebEngineWidgets', 'PySide6.QtWebSockets', 'PySide6.QtXml',
+    'tkinter', 'unittest', 'pydoc',
+)
+
+# Каталоги плагинов Qt, которые не нужны приложению (иконки - PNG, встроенные в QtGui)
+EXCLUDED_PLUGINS = (
+    'generic', 'iconengines', 'imageformats', 'networkinformation', 'qmltooling', 'tls',
+)
+
+# Файлы, которые подтягивают хуки PySide6, но приложение не использует
+EXCLUDED_FILES = (
+    'opengl32sw.dll',       # программный OpenGL для Qt Quick
+    'd3dcompiler_47.dll',
+)
+
+
+def base_args(distpath: Path, workpath: Path) -> list[str]:
+    return [
         str(MAIN_SCRIPT),
-        '--onefile',
-        '--name=EyeReminder',
+        f'--name={APP_NAME}',
         '--noconsole',
+        '--noconfirm',
         f'--icon={MAIN_DIR / "icons" / "er_desktop.ico"}',
-        '--add-data=icons:icons',
+        f'--add-data={MAIN_DIR / "icons"}{os.pathsep}icons',
+        f'--distpath={distpath}',
+        f'--workpath={workpath}',
+        f'--specpath={workpath}',
+    ]
+
+
+def build_onefile(distpath: Path, workpath: Path) -> Path:
+    """ Исходный вариант: один exe, распаковывающий рантайм во временный каталог при каждом запуске """
+    PyInstaller.__main__.run([*base_args(distpath, workpath), '--onefile'])
+    return distpath / executable_name()
+
+
+def build_onedir(distpath: Path, workpath: Path) -> Path:
+    """ Каталог без распаковки при запуске, без неиспользуемых модулей и плагинов Qt """
+    PyInstaller.__main__.run([
+        *base_args(distpath, workpath),
+        '--onedir',
+        *(f'--exclude-module={module}' for module in EXCLUDED_MODULES),
     ])
+    bundle_dir = distpath / APP_NAME
+    prune_bundle(bundle_dir)
+    return bundle_dir / executable_name()
+
+
+PROFILES = {
+    'onefile': build_onefile,
+    'onedir': build_onedir,
+}
+
+
+def executable_name() -> str:
+    return f'{APP_NAME}.exe' if sys.platform == 'win32' else APP_NAME
+
+
+def prune_bundle(bundle_dir: Path) -> None:
+    """ Удаляет из собранного каталога плагины Qt, переводы и лишние библиотеки """
+    for plugins_dir in bundle_dir.rglob('plugins'):
+        for name in EXCLUDED_PLUGINS:
+            shutil.rmtree(plugins_dir / name, ignore_errors=True)
+
+    for translations_dir in bundle_dir.rglob('translations'):
+        if translations_dir.parent.name == 'PySide6':
+            shutil.rmtree(translations_dir, ignore_errors=True)
+
+    for name in EXCLUDED_FILES:
+        for path in bundle_dir.rglob(name):
+            path.unlink()
+
+
+def bundle_size(executable: Path, profile: str) -> int:
+    """ Размер дистрибутива в байтах: exe для ``onefile``, весь каталог для ``onedir`` """
+    if profile == 'onefile':
+        return executable.stat().st_size
+    return sum(path.stat().st_size for path in executable.parent.rglob('*') if path.is_file())
+
+
+def measure_launch(executable: Path, runs: int, timeout: float = 60.0) -> dict[str, float]:
+    """ Время от запуска exe до показа иконки в трее (медиана по ``runs`` запускам) """
+    wall, ready = [], []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        report_path = Path(tmp_dir) / 'probe.json'
+        env = dict(os.environ, **{PROBE_ENV: str(report_path)})
+
+        for _ in range(runs):
+            report_path.unlink(missing_ok=True)
+            begin = time.perf_counter()
+            subprocess.run([str(executable)], env=env, timeout=timeout, check=True)
+            wall.append(time.perf_counter() - begin)
+            ready.append(json.loads(report_path.read_text(encoding='utf-8'))['ready_seconds'])
+
+    return {
+        'launch_to_exit_s': statistics.median(wall),
+        'main_to_tray_s': statistics.median(ready),
+    }
+
+
+def install(profiles: list[str], runs: int = 0) -> dict[str, dict]:
+    """
+    Собирает выбранные профили в ``dist/<профиль>``.
+    При ``runs > 0`` замеряет размер и скорость запуска каждого профиля
+    """
+    report = {}
+    for profile in profiles:
+        executable = PROFILES[profile](DIST_DIR / profile, BUILD_DIR / profile)
+        if runs <= 0:
+            continue
+        report[profile] = {
+            'bundle_mb': bundle_size(executable, profile) / 2 ** 20,
+            **measure_launch(executable, runs),
+        }
+
+    if report:
+        (DIST_DIR / 'profiles.json').write_text(json.dumps(report, indent=4), encoding='utf-8')
+        print(json.dumps(report, indent=4))
+    return report
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=f'Сборка {APP_NAME} через PyInstaller')
+    parser.add_argument(
+        '-p', '--profile',
+        choices=(*PROFILES, 'all'),
+        default='onefile',
+        help='onefile - один exe; onedir - быстрый запуск без распаковки; all - оба',
+    )
+    parser.add_argument(
+        '-r', '--runs', type=int, default=0,
+        help='число запусков для замера времени до показа трея (0 - без замера)',
+    )
+    return parser.parse_args()
 
 
 if __name__ == '__main__':
-    install()
+    args = parse_args()
+    install(list(PROFILES) if args.profile == 'all' else [args.profile], args.runs)
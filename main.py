@@ -1,10 +1,57 @@
+import argparse
+import json
 import sys
-from PySide6.QtWidgets import QApplication
 
-from app.core import EyeReminder
+# Импортируется первым, чтобы замер старта включал импорт Qt
+from app.startup import startup
 
 
-if __name__ == "__main__":
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='EyeReminder')
+    parser.add_argument(
+        '--headless', action='store_true',
+        help='обратный отсчет без интерфейса, управление через локальный сокет',
+    )
+    parser.add_argument(
+        '--command', choices=('start', 'pause', 'stop', 'interval', 'status', 'profile'),
+        help='отправить команду запущенному экземпляру и вывести ответ',
+    )
+    parser.add_argument('--seconds', type=int, help='интервал для команды interval')
+    parser.add_argument(
+        '--settings', action='store_true',
+        help='открыть окно настроек (если приложение уже запущено - в нем)',
+    )
+    parser.add_argument(
+        '--start', action='store_true',
+        help='запустить таймер (если приложение уже запущено - в нем)',
+    )
+    # Остальные аргументы (например, -platform) предназначены для Qt
+    args, _ = parser.parse_known_args()
+    return args
+
+
+def send(command: str, seconds: int | None) -> int:
+    from app.services.control import send_command
+
+    params = {} if seconds is None else {'seconds': seconds}
+    try:
+        response = send_command(command, **params)
+    except (ConnectionError, TimeoutError) as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    print(json.dumps(response, ensure_ascii=False))
+    return 0 if response['ok'] else 1
+
+
+def run_gui(args: argparse.Namespace) -> int:
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QApplication
+
+    from app.core import EyeReminder
+
+    startup.mark('imports')
+
     try:
         from ctypes import windll
         myappid = 'mycustomwindowsapps.eyereminder'
@@ -14,8 +61,39 @@ if __name__ == "__main__":
 
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
+    startup.mark('qapplication')
 
     window = EyeReminder()
+    startup.mark('main_window')
     window.tray.icon.show()
+    startup.mark('tray_shown')
+
+    if args.start:
+        window.countdown.on_start()
+    if args.settings:
+        window.show_settings()
+    QTimer.singleShot(0, startup.ready)
+
+    return app.exec()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    if args.command:
+        sys.exit(send(args.command, args.seconds))
+
+    # Повторный запуск передает намерение работающему экземпляру
+    # и завершается до создания QApplication
+    from app.services.instance import SingleInstance
+    instance = SingleInstance()
+    if not instance.acquire():
+        if args.start:
+            sys.exit(instance.forward('start'))
+        sys.exit(instance.forward('status' if args.headless else 'show'))
+
+    if args.headless:
+        from app.headless import run_headless
+        sys.exit(run_headless(sys.argv))
 
-    sys.exit(app.exec())
+    sys.exit(run_gui(args))
@@ -0,0 +1,62 @@
+import os
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Тесты запускаются из любого каталога и без дисплея
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+# Настройки и журналы - не в каталоге пользователя. Задается до импорта ``app``
+os.environ.setdefault('EYE_REMINDER_CONFIG_DIR', tempfile.mkdtemp(prefix='eye-reminder-tests-'))
+
+
+@pytest.fixture(scope='session')
+def qt_app():
+    """ Одно приложение Qt на все тесты: виджетам нужен ``QApplication``, а не ``QCoreApplication`` """
+    from PySide6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def monday() -> datetime:
+    """ Понедельник, 00:00 - от него отсчитываются моменты в тестах рабочих часов """
+    return datetime(2026, 10, 19)
+
+
+@pytest.fixture
+def work_hours() -> dict[str, list[tuple[str, str]]]:
+    """ Каждый день с 09:00 до 18:00 """
+    from app.services.calendar import WEEKDAYS
+
+    return {day: [('09:00', '18:00')] for day in WEEKDAYS}
+
+
+@pytest.fixture
+def create_countdown():
+    """
+    Фабрика отсчета на ``VirtualClock``, календарное время которого начинается с ``at``.
+    ``qt=True`` - ``Countdown`` с сигналами Qt, иначе ``CountdownCore``.
+    Переходы и их календарное время собираются в ``countdown.events``
+    """
+    from app.services.clock import VirtualClock
+    from app.services.countdown import Countdown, CountdownCore
+
+    def create(seconds: int, at: datetime, calendar=None, qt: bool = False):
+        clock = VirtualClock(wall_start=at.timestamp())
+        if qt:
+            countdown = Countdown(clock)
+            countdown.set_interval(seconds)
+            countdown.calendar = calendar
+        else:
+            countdown = CountdownCore(clock, seconds, calendar)
+
+        countdown.events = []
+        for event in ('started', 'expired', 'restarted', 'suspended', 'stopped'):
+            countdown.subscribe(event, lambda event=event: countdown.events.append((event, countdown.wall_time())))
+        return countdown
+
+    return create
@@ -0,0 +1,42 @@
+"""
+Заглушка сервиса ``org.freedesktop.Notifications`` для тестов ``DBusBackend``.
+
+Запуск: ``python notification_service.py <адрес шины>``. Печатает ``ready``
+после регистрации, затем по строке JSON на каждый вызов ``Notify``
+"""
+import json
+import sys
+
+from PySide6.QtCore import ClassInfo, QCoreApplication, QObject, Slot
+from PySide6.QtDBus import QDBusConnection
+
+
+@ClassInfo({'D-Bus Interface': 'org.freedesktop.Notifications'})
+class NotificationService(QObject):
+    @Slot(str, 'uint', str, str, str, 'QStringList', 'QVariantMap', int, result='uint')
+    def Notify(self, app_name, replaces_id, app_icon, title, text, actions, hints, timeout):
+        print(json.dumps({
+            'app_name': app_name,
+            'replaces_id': replaces_id,
+            'title': title,
+            'text': text,
+            'timeout': timeout,
+        }), flush=True)
+        return 1
+
+
+def main() -> int:
+    app = QCoreApplication(sys.argv)
+    bus = QDBusConnection.connectToBus(sys.argv[1], 'notification-service')
+    service = NotificationService()
+    if not (
+            bus.registerObject('/org/freedesktop/Notifications', service, QDBusConnection.ExportAllSlots)
+            and bus.registerService('org.freedesktop.Notifications')
+    ):
+        return 1
+    print('ready', flush=True)
+    return app.exec()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
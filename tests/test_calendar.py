@@ -0,0 +1,72 @@
+from datetime import timedelta
+
+import pytest
+
+from app.services.calendar import WorkCalendar
+
+
+def at(days: int = 0, hours: int = 0, minutes: int = 0) -> timedelta:
+    """ Смещение от понедельника ``monday`` """
+    return timedelta(days=days, hours=hours, minutes=minutes)
+
+
+@pytest.fixture
+def calendar(monday):
+    return WorkCalendar(
+        days={
+            'mon': [('09:00', '13:00'), ('14:00', '18:00')],
+            'tue': [('09:00', '18:00')],
+            'fri': [('22:00', '02:00')],
+        },
+        holidays=[monday.date() + timedelta(days=1)],
+    )
+
+
+@pytest.mark.parametrize('moment, expected', [
+    # Внутри окна - сам момент
+    (at(hours=10, minutes=30), at(hours=10, minutes=30)),
+    (at(hours=9), at(hours=9)),
+    # До первого окна и в перерыве между окнами
+    (at(hours=7), at(hours=9)),
+    (at(hours=13, minutes=30), at(hours=14)),
+    # Конец окна не входит в него. Вторник - праздник
+    (at(hours=18), at(days=4, hours=22)),
+    # Окно через полночь делится на два дня
+    (at(days=4, hours=23), at(days=4, hours=23)),
+    (at(days=5, hours=1), at(days=5, hours=1)),
+    (at(days=5, hours=3), at(days=7, hours=9)),
+])
+def test_next_start(calendar, monday, moment, expected):
+    assert calendar.next_start(monday + moment) == monday + expected
+
+
+def test_merges_overlapping_windows(monday):
+    calendar = WorkCalendar({'mon': [('09:00', '12:00'), ('11:00', '13:00'), ('13:00', '14:00')]})
+
+    assert calendar.is_active(monday.replace(hour=13, minute=30))
+    assert calendar.next_start(monday.replace(hour=14)) == monday + at(days=7, hours=9)
+
+
+def test_without_windows_there_is_no_start(monday):
+    assert WorkCalendar({}).next_start(monday) is None
+
+
+def test_cycle_limit_moves_start_to_next_day(calendar, monday):
+    calendar.max_cycles = 1
+    moment = monday.replace(hour=10)
+    assert calendar.allows_cycle(moment)
+
+    calendar.record_cycle(moment)
+    assert not calendar.allows_cycle(moment)
+    # Вторник - праздник, ближайшее окно - в пятницу
+    assert calendar.next_cycle_start(moment) == monday + at(days=4, hours=22)
+
+
+@pytest.mark.parametrize('settings', [
+    {},
+    {'days': {'monday': [['09:00', '18:00']]}},
+    {'days': {'mon': [['09:00', '25:00']]}},
+    {'holidays': ['tomorrow']},
+])
+def test_invalid_settings_disable_calendar(settings):
+    assert WorkCalendar.from_settings(settings) is None
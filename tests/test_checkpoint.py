@@ -0,0 +1,151 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services.calendar import WorkCalendar
+from app.services.checkpoint import SLOT, Checkpoint, Snapshot, pack, unpack
+
+
+@pytest.fixture
+def morning(monday) -> datetime:
+    return monday.replace(hour=10)
+
+
+@pytest.fixture
+def create_countdown(create_countdown, work_hours):
+    """ ``Countdown`` с сигналами Qt: контрольная точка подключается к ним. Интервал в настройках - 600 с """
+    def create(at: datetime, max_cycles: int = 0):
+        return create_countdown(600, at, WorkCalendar(work_hours, max_cycles=max_cycles), qt=True)
+    return create
+
+
+def test_pack_round_trip():
+    snapshot = Snapshot('pending', 600, 120.5, 1_800_000_000.25, 739_900, 3, sequence=7)
+    data = pack(snapshot)
+
+    assert len(data) == SLOT.size
+    assert unpack(data) == snapshot
+
+
+@pytest.mark.parametrize('damage', [
+    lambda data: data[:-1],
+    lambda data: data[:10] + bytes([data[10] ^ 1]) + data[11:],
+    lambda data: b'XXXX' + data[4:],
+    lambda data: bytes(len(data)),
+])
+def test_unpack_rejects_damaged_slot(damage):
+    assert unpack(damage(pack(Snapshot('paused', 600, 30.0, 0.0)))) is None
+
+
+def test_read_falls_back_to_previous_slot(tmp_path, create_countdown, morning):
+    path = tmp_path / 'countdown.checkpoint'
+    checkpoint = Checkpoint(create_countdown(morning), path)
+    checkpoint.write(Snapshot('paused', 600, 100.0, 0.0))
+    checkpoint.write(Snapshot('paused', 600, 50.0, 0.0))
+    assert checkpoint.read().remaining == 50.0
+
+    # Последняя запись оборвана на середине слота
+    data = bytearray(path.read_bytes())
+    offset = (checkpoint._sequence % 2) * SLOT.size
+    data[offset + 20:offset + SLOT.size] = bytes(SLOT.size - 20)
+    path.write_bytes(bytes(data))
+    assert checkpoint.read().remaining == 100.0
+
+
+def test_restore_pending_by_wall_deadline(tmp_path, create_countdown, morning):
+    path = tmp_path / 'countdown.checkpoint'
+    countdown = create_countdown(morning)
+    Checkpoint(countdown, path).write(Snapshot('pending', 600, 0.0, morning.timestamp() + 250))
+
+    assert Checkpoint(countdown, path).restore()
+    assert countdown.state_name == 'pending'
+    assert countdown.remaining_seconds == 250
+
+
+def test_restore_keeps_cycle_phase_after_missed_deadline(tmp_path, create_countdown, morning):
+    path = tmp_path / 'countdown.checkpoint'
+    countdown = create_countdown(morning)
+    countdown.calendar = None
+    # Дедлайн прошел 100 с назад: 1 с перезапуска и 99 с нового цикла
+    Checkpoint(countdown, path).write(Snapshot('pending', 600, 0.0, morning.timestamp() - 100))
+
+    assert Checkpoint(countdown, path).restore()
+    assert countdown.remaining_seconds == 501
+
+
+def test_restore_missed_deadline_with_calendar_starts_new_cycle(tmp_path, create_countdown, morning):
+    path = tmp_path / 'countdown.checkpoint'
+    countdown = create_countdown(morning)
+    Checkpoint(countdown, path).write(Snapshot('pending', 600, 0.0, morning.timestamp() - 100))
+
+    assert Checkpoint(countdown, path).restore()
+    assert countdown.remaining_seconds == 600
+
+
+@pytest.mark.parametrize('hour', [18, 22])
+def test_restore_outside_work_hours_suspends(tmp_path, hour, create_countdown, morning):
+    path = tmp_path / 'countdown.checkpoint'
+    evening = morning.replace(hour=hour, minute=30)
+    countdown = create_countdown(evening)
+    expired = []
+    countdown.expired.connect(lambda: expired.append(datetime.fromtimestamp(countdown.clock.wall())))
+    Checkpoint(countdown, path).write(Snapshot('pending', 600, 0.0, evening.timestamp() + 300))
+
+    assert Checkpoint(countdown, path).restore()
+    assert countdown.state_name == 'suspended'
+
+    countdown.clock.advance(24 * 3600)
+    # Первое истечение - первый цикл следующего рабочего окна
+    assert expired[0] == morning.replace(hour=9, minute=10) + timedelta(days=1)
+
+
+def test_restore_paused(tmp_path, create_countdown, morning):
+    path = tmp_path / 'countdown.checkpoint'
+    countdown = create_countdown(morning)
+    Checkpoint(countdown, path).write(Snapshot('paused', 900, 42.0, 0.0))
+
+    assert Checkpoint(countdown, path).restore()
+    assert countdown.state_name == 'paused'
+    assert countdown.remaining_seconds == 42
+    # Интервал - из настроек, а не из контрольной точки
+    assert countdown.interval.total_seconds == 600
+
+
+def test_restore_keeps_configured_interval_for_next_cycles(tmp_path, create_countdown, morning):
+    path = tmp_path / 'countdown.checkpoint'
+    countdown = create_countdown(morning)
+    Checkpoint(countdown, path).write(Snapshot('pending', 3000, 0.0, morning.timestamp() + 120))
+
+    assert Checkpoint(countdown, path).restore()
+    assert countdown.remaining_seconds == 120
+    assert countdown.interval.total_seconds == 600
+
+    countdown.clock.advance(121)
+    assert countdown.remaining_seconds == 600
+
+
+def test_disabled_checkpoint_does_nothing(tmp_path, create_countdown, morning):
+    countdown = create_countdown(morning)
+    checkpoint = Checkpoint(countdown, None)
+    countdown.on_start()
+
+    assert checkpoint.flush()
+    assert not checkpoint.restore()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cycle_limit_survives_restart(tmp_path, create_countdown, morning):
+    path = tmp_path / 'countdown.checkpoint'
+    countdown = create_countdown(morning, max_cycles=2)
+    checkpoint = Checkpoint(countdown, path, delay=0)
+    countdown.on_start()
+    countdown.clock.advance(2 * 601)
+    checkpoint.flush()
+
+    assert countdown.state_name == 'suspended'
+
+    restored = create_countdown(datetime.fromtimestamp(countdown.clock.wall()), max_cycles=2)
+    assert Checkpoint(restored, path).restore()
+    assert restored.state_name == 'suspended'
+    assert restored.calendar.cycles(morning.date()) == 2
+    assert not restored.cycle_allowed()
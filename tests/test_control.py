@@ -0,0 +1,79 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+from app.services.clock import VirtualClock
+from app.services.control import ControlServer
+from app.services.countdown import Countdown
+
+
+@pytest.fixture
+def server(qt_app):
+    countdown = Countdown(VirtualClock())
+    countdown.set_interval(600)
+    server = ControlServer(countdown, name=f'eye-reminder-test-{os.getpid()}')
+    assert server.listen()
+    yield server
+    server.close()
+
+
+CLIENT = (
+    'import json, sys\n'
+    'from app.services.control import send_command\n'
+    'print(json.dumps(send_command(sys.argv[1], sys.argv[2], 5000, **json.loads(sys.argv[3]))))\n'
+)
+
+
+def request(server: ControlServer, command: str, **params) -> dict:
+    """ Клиент - отдельный процесс, как ``main.py --command``: он блокируется, пока цикл событий сервера отвечает """
+    client = subprocess.Popen(
+        [sys.executable, '-c', CLIENT, command, server.name, json.dumps(params)],
+        stdout=subprocess.PIPE, text=True, cwd=Path(__file__).resolve().parent.parent,
+    )
+    while client.poll() is None:
+        QCoreApplication.processEvents()
+    assert client.returncode == 0
+    return json.loads(client.stdout.read())
+
+
+def test_status_round_trip(server):
+    assert request(server, 'status') == {
+        'ok': True,
+        'status': {'state': 'stopped', 'remaining_seconds': 600, 'interval_seconds': 600},
+    }
+
+
+def test_start_and_interval(server):
+    assert request(server, 'interval', seconds=1200)['status']['interval_seconds'] == 1200
+    assert request(server, 'start')['status']['state'] == 'pending'
+
+
+def test_unknown_command(server):
+    response = request(server, 'launch')
+
+    assert response['ok'] is False
+    assert 'launch' in response['error']
+
+
+@pytest.mark.parametrize('seconds', [True, 0, -5, 1.5, '600', None])
+def test_bad_interval_is_rejected(server, seconds):
+    response = request(server, 'interval', seconds=seconds)
+
+    assert response['ok'] is False
+    assert server.countdown.interval.total_seconds == 600
+
+
+def test_handler_error_is_reported(server):
+    def fail(_):
+        raise RuntimeError('сбой')
+    server.add_handler('profile', fail)
+
+    response = request(server, 'profile')
+
+    assert response == {'ok': False, 'error': 'Внутренняя ошибка: сбой'}
+    assert request(server, 'status')['ok'] is True
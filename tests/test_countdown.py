@@ -0,0 +1,121 @@
+from datetime import timedelta
+
+from app.services.calendar import WorkCalendar
+from app.services.countdown import CountdownCore, TickMode
+
+
+def watch_times(countdown: CountdownCore, event: str) -> list[float]:
+    times = []
+    countdown.subscribe(event, lambda *_: times.append(countdown.clock.now()))
+    return times
+
+
+def names(countdown: CountdownCore) -> list[str]:
+    return [event for event, _ in countdown.events]
+
+
+def test_cycles_restart_after_refresh(create_countdown, monday):
+    countdown = create_countdown(10, monday)
+    expired = watch_times(countdown, 'expired')
+    restarted = watch_times(countdown, 'restarted')
+    countdown.on_start()
+    countdown.clock.advance(25)
+
+    assert expired == [10.0, 21.0]
+    assert restarted == [11.0, 22.0]
+    assert countdown.state_name == 'pending'
+    assert countdown.remaining_seconds == 7
+
+
+def test_updates_follow_tick_mode(create_countdown, monday):
+    countdown = create_countdown(150, monday)
+    updates = []
+    countdown.subscribe('updated', updates.append)
+
+    countdown.set_tick_mode(TickMode.MINUTE)
+    countdown.on_start()
+    countdown.clock.advance(150)
+    assert updates == [119, 59, 0]
+
+    # Следующий цикл будит только дедлайн
+    updates.clear()
+    countdown.set_tick_mode(TickMode.DEADLINE)
+    countdown.clock.advance(151)
+    assert updates == [0]
+
+
+def test_pause_keeps_remaining(create_countdown, monday):
+    countdown = create_countdown(10, monday)
+    countdown.on_start()
+    countdown.clock.advance(4)
+    countdown.on_pause()
+    countdown.clock.advance(100)
+
+    assert countdown.state_name == 'paused'
+    assert countdown.remaining_seconds == 6
+
+    countdown.on_start()
+    countdown.clock.advance(6)
+    assert names(countdown) == ['started', 'started', 'expired']
+
+
+def test_late_tick_does_not_move_deadline(create_countdown, monday):
+    countdown = create_countdown(60, monday)
+    expired = watch_times(countdown, 'expired')
+    countdown.set_tick_mode(TickMode.DEADLINE)
+    countdown.on_start()
+
+    # Система спала: тик срабатывает с опозданием и истекает один раз
+    countdown.clock.sleep(90)
+    countdown.clock.step()
+    assert expired == [90.0]
+
+    countdown.clock.step()
+    assert countdown.state_name == 'pending'
+    assert countdown.remaining_seconds == 60
+
+
+def test_stop_resets_interval(create_countdown, monday):
+    countdown = create_countdown(10, monday)
+    countdown.on_start()
+    countdown.clock.advance(4)
+    countdown.on_stop()
+
+    assert countdown.remaining_seconds == 10
+    assert countdown.clock.next_due() is None
+    assert names(countdown) == ['started', 'stopped']
+
+
+def test_cycle_limit_suspends_until_next_day(create_countdown, monday, work_hours):
+    countdown = create_countdown(600, monday.replace(hour=10), WorkCalendar(work_hours, max_cycles=2))
+    countdown.on_start()
+    countdown.clock.advance(24 * 3600)
+
+    assert names(countdown)[:5] == ['started', 'expired', 'restarted', 'expired', 'suspended']
+    assert countdown.events[5] == ('started', monday.replace(hour=9) + timedelta(days=1))
+
+
+def test_cycle_past_window_close_suspends_without_expiring(create_countdown, monday, work_hours):
+    countdown = create_countdown(50 * 60, monday.replace(hour=17, minute=30), WorkCalendar(work_hours))
+    countdown.on_start()
+    countdown.clock.advance(16 * 3600)
+
+    assert ('expired', monday.replace(hour=18, minute=20)) not in countdown.events
+    assert names(countdown) == ['started', 'suspended', 'started']
+    assert countdown.events[-1][1] == monday.replace(hour=9) + timedelta(days=1)
+
+
+def test_cycle_ending_at_window_close_expires(create_countdown, monday, work_hours):
+    countdown = create_countdown(20 * 60, monday.replace(hour=17, minute=40), WorkCalendar(work_hours))
+    countdown.on_start()
+    countdown.clock.advance(21 * 60)
+
+    assert names(countdown) == ['started', 'expired', 'suspended']
+
+
+def test_manual_start_outside_hours_expires(create_countdown, monday, work_hours):
+    countdown = create_countdown(20 * 60, monday.replace(hour=20), WorkCalendar(work_hours))
+    countdown.on_start()
+    countdown.clock.advance(21 * 60)
+
+    assert names(countdown) == ['started', 'expired', 'suspended']
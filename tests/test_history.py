@@ -0,0 +1,70 @@
+from datetime import timedelta
+
+import pytest
+
+from app.services.history import RECORD, Event, HistoryStore
+
+
+@pytest.fixture
+def moments(monday):
+    """ Понедельник и вторник в рабочее время, unix-секунды """
+    return [(monday + timedelta(days=day, hours=10 + hour)).timestamp() for day in (0, 1) for hour in range(3)]
+
+
+def fill(directory, moments) -> HistoryStore:
+    history = HistoryStore(directory, flush_delay=0)
+    for moment in moments:
+        history.record(Event.STARTED, moment)
+        history.record(Event.EXPIRED, moment + 600)
+    assert history.flush()
+    return history
+
+
+def test_rollups_survive_restart(tmp_path, monday, moments):
+    fill(tmp_path, moments)
+
+    history = HistoryStore(tmp_path)
+    assert history.daily(7, today=monday.date() + timedelta(days=1)) == {
+        '2026-10-19': {'started': 3, 'expired': 3},
+        '2026-10-20': {'started': 3, 'expired': 3},
+    }
+    assert history.weekly(1, today=monday.date()) == {'2026-W43': {'started': 6, 'expired': 6}}
+    assert history.breaks(7, today=monday.date() + timedelta(days=1)) == 6
+
+
+def test_torn_record_is_dropped_and_overwritten(tmp_path, monday, moments):
+    fill(tmp_path, moments)
+    # Авария посреди дозаписи: в журнале половина записи
+    with open(tmp_path / 'history.log', 'ab') as f:
+        f.write(RECORD.pack(moments[0], Event.STOPPED)[:5])
+
+    history = HistoryStore(tmp_path, flush_delay=0)
+    assert history.breaks(7, today=monday.date() + timedelta(days=1)) == 6
+
+    history.record(Event.EXPIRED, moments[-1] + 1200)
+    assert history.flush()
+    assert (tmp_path / 'history.log').stat().st_size == 13 * RECORD.size
+
+    # Агрегаты пересчитываются по журналу с нуля и сходятся с сохраненными
+    (tmp_path / 'history_rollups.json').unlink()
+    rebuilt = HistoryStore(tmp_path)
+    assert rebuilt.daily(1, today=monday.date() + timedelta(days=1)) == {'2026-10-20': {'started': 3, 'expired': 4}}
+
+
+def test_rollups_catch_up_with_log_tail(tmp_path, monday, moments):
+    fill(tmp_path, moments)
+    rollups = (tmp_path / 'history_rollups.json').read_bytes()
+    fill(tmp_path, moments[:1])
+    # Агрегаты не успели сохраниться после последней дозаписи
+    (tmp_path / 'history_rollups.json').write_bytes(rollups)
+
+    history = HistoryStore(tmp_path)
+    assert history.daily(1, today=monday.date()) == {'2026-10-19': {'started': 4, 'expired': 4}}
+
+
+def test_replaced_log_is_recounted(tmp_path, monday, moments):
+    fill(tmp_path, moments)
+    (tmp_path / 'history.log').write_bytes(RECORD.pack(moments[0], Event.PAUSED))
+
+    history = HistoryStore(tmp_path)
+    assert history.daily(7, today=monday.date() + timedelta(days=1)) == {'2026-10-19': {'paused': 1}}
@@ -0,0 +1,88 @@
+import sys
+import time
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+from app.services.hooks import Hook, HookRunner
+
+SLEEP = 'import time; time.sleep(30)'
+
+
+def python(code: str) -> list[str]:
+    return [sys.executable, '-c', code]
+
+
+@pytest.fixture
+def runner(qt_app):
+    runner = HookRunner()
+    runner.results = []
+    runner.finished.connect(lambda name, status, detail: runner.results.append((name, status, detail)))
+    yield runner
+    runner.shutdown()
+
+
+def wait_results(runner: HookRunner, count: int, timeout: float = 20.0) -> list[tuple[str, str, str]]:
+    """ ``finished`` приходит из потока пула через очередь событий """
+    deadline = time.monotonic() + timeout
+    while len(runner.results) < count and time.monotonic() < deadline:
+        QCoreApplication.processEvents()
+        time.sleep(0.01)
+    return sorted(runner.results)
+
+
+def wait_started(runner: HookRunner, count: int = 1, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    while len(runner._processes) < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(runner._processes) == count
+
+
+def test_command_statuses(runner):
+    runner.hooks = [
+        Hook('ok', 'command', python('pass')),
+        Hook('failed', 'command', python('import sys; sys.stderr.write("нет"); sys.exit(3)')),
+    ]
+    runner.run_all()
+
+    assert wait_results(runner, 2) == [('failed', 'failed', 'код 3: нет'), ('ok', 'ok', '')]
+
+
+def test_timeout_kills_command(runner):
+    runner.submit(Hook('slow', 'command', python(SLEEP), timeout=0.5))
+
+    assert wait_results(runner, 1) == [('slow', 'timeout', 'дольше 0.5 с')]
+    assert not runner._processes
+
+
+def test_cancel_kills_running_and_drops_pending(runner):
+    runner.max_workers = 1
+    runner.hooks = [Hook('running', 'command', python(SLEEP)), Hook('pending', 'command', python('pass'))]
+    runner.run_all()
+    wait_started(runner)
+
+    runner.cancel()
+
+    assert wait_results(runner, 2) == [
+        ('pending', 'cancelled', 'отсчет остановлен'),
+        ('running', 'cancelled', 'отсчет остановлен'),
+    ]
+
+
+def test_busy_hook_is_skipped(runner):
+    hook = Hook('lock', 'command', python(SLEEP))
+    runner.submit(hook)
+    wait_started(runner)
+    runner.submit(hook)
+
+    assert wait_results(runner, 1) == [('lock', 'skipped', 'предыдущий запуск еще выполняется')]
+
+    # После завершения запуска действие снова принимается
+    runner.cancel()
+    wait_results(runner, 2)
+    deadline = time.monotonic() + 20.0
+    while runner._futures and time.monotonic() < deadline:
+        time.sleep(0.01)
+    runner.results.clear()
+    runner.submit(Hook('lock', 'command', python('pass')))
+    assert wait_results(runner, 1) == [('lock', 'ok', '')]
@@ -0,0 +1,81 @@
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.config import APP_NAME
+from app.services.notifications import Template
+from app.services.notifications.backends import DBusBackend
+from app.services.notifications.queue import Notification
+
+VARIABLES = {'cycle': 3, 'elapsed': '1:05:00', 'interval': '0:20:00', 'time': '14:30'}
+
+
+def test_template_renders_variables():
+    template = Template('Перерыв №{cycle:>2}, работа {elapsed}')
+
+    assert template.fields == {'cycle', 'elapsed'}
+    assert template.render(VARIABLES) == 'Перерыв № 3, работа 1:05:00'
+
+
+@pytest.mark.parametrize('source', [
+    'Работа {elapsed:d}',
+    'Перерыв {cycle:>{width}}',
+    'Перерыв {cycle:q}',
+    'Перерыв {unknown}',
+    'Перерыв {cycle',
+])
+def test_invalid_template_falls_back_to_source(source):
+    assert Template(source).render(VARIABLES) == source
+
+
+def test_render_error_falls_back_to_source():
+    template = Template('Перерыв №{cycle:d}')
+
+    assert template.render({**VARIABLES, 'cycle': 'три'}) == template.source
+    assert template.render({}) == template.source
+
+
+@pytest.fixture
+def session_bus():
+    """ Отдельная шина с заглушкой сервиса уведомлений """
+    if shutil.which('dbus-daemon') is None or shutil.which('gdbus') is None:
+        pytest.skip('нужны dbus-daemon и gdbus')
+    pytest.importorskip('PySide6.QtDBus')
+
+    daemon = subprocess.Popen(
+        ['dbus-daemon', '--session', '--nofork', '--print-address'],
+        stdout=subprocess.PIPE, text=True,
+    )
+    address = daemon.stdout.readline().strip()
+    service = subprocess.Popen(
+        [sys.executable, str(Path(__file__).with_name('notification_service.py')), address],
+        stdout=subprocess.PIPE, text=True,
+    )
+    try:
+        if service.stdout.readline().strip() != 'ready':
+            pytest.skip('заглушка сервиса уведомлений не зарегистрирована')
+        yield address, service
+    finally:
+        service.terminate()
+        service.wait()
+        daemon.terminate()
+        daemon.wait()
+
+
+def test_dbus_backend_calls_notify(session_bus):
+    address, service = session_bus
+    backend = DBusBackend(address=address, timeout=10.0)
+
+    backend.deliver(Notification("Перерыв 'глаза'", 'Строка\nи \\ слеш', timeout_msec=4000))
+
+    assert json.loads(service.stdout.readline()) == {
+        'app_name': APP_NAME,
+        'replaces_id': 0,
+        'title': "Перерыв 'глаза'",
+        'text': 'Строка\nи \\ слеш',
+        'timeout': 4000,
+    }
@@ -0,0 +1,36 @@
+import os
+import stat
+import sys
+
+import pytest
+
+from app.persistence import atomic_write
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason='права POSIX')
+
+
+def mode(path) -> int:
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+@pytest.mark.parametrize('original', [0o644, 0o664, 0o600])
+def test_atomic_write_keeps_mode(tmp_path, original):
+    path = tmp_path / 'config.json'
+    path.write_bytes(b'{}')
+    os.chmod(path, original)
+
+    atomic_write(path, b'{"timer_seconds": 1200}')
+
+    assert path.read_bytes() == b'{"timer_seconds": 1200}'
+    assert mode(path) == original
+
+
+def test_atomic_write_new_file_follows_umask(tmp_path):
+    umask = os.umask(0o022)
+    os.umask(umask)
+    path = tmp_path / 'config.json'
+
+    atomic_write(path, b'{}')
+
+    assert mode(path) == 0o666 & ~umask
+    assert [entry.name for entry in tmp_path.iterdir()] == ['config.json']
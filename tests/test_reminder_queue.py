@@ -0,0 +1,70 @@
+import pytest
+
+from app.services.scheduler import Reminder, ReminderQueue
+
+
+def reminder(name: str, interval: int) -> Reminder:
+    return Reminder(name=name, interval=interval, title=name, text='')
+
+
+def test_peek_returns_nearest_deadline():
+    queue = ReminderQueue()
+    queue.add(reminder('eyes', 100), now=0)
+    queue.add(reminder('water', 300), now=0)
+
+    assert queue.peek().name == 'eyes'
+    assert queue.peek().deadline == 100
+
+
+def test_pop_due_reschedules_once_after_missed_periods():
+    queue = ReminderQueue()
+    queue.add(reminder('eyes', 100), now=0)
+
+    assert [r.name for r in queue.pop_due(350)] == ['eyes']
+    assert queue.peek().deadline == 400
+    assert queue.pop_due(399) == []
+
+
+def test_remove_and_add_again_ignores_stale_entries():
+    queue = ReminderQueue()
+    queue.add(reminder('eyes', 100), now=0)
+    queue.add(reminder('water', 300), now=0)
+    queue.remove('eyes')
+    queue.remove('water')
+
+    queue.add(reminder('eyes', 1000), now=50)
+    queue.add(reminder('water', 200), now=50)
+
+    assert queue.peek().name == 'water'
+    assert queue.peek().deadline == 250
+    assert [r.name for r in queue.pop_due(260)] == ['water']
+    assert queue.peek().name == 'water'
+    assert queue.peek().deadline == 450
+
+
+def test_replace_by_name_keeps_single_entry():
+    queue = ReminderQueue()
+    queue.add(reminder('eyes', 100), now=0)
+    queue.add(reminder('eyes', 500), now=0)
+
+    assert len(queue) == 1
+    assert queue.pop_due(100) == []
+    assert queue.peek().deadline == 500
+
+
+def test_reschedule_and_remove_many():
+    queue = ReminderQueue()
+    for index in range(100):
+        queue.add(reminder(f'r{index}', 10 + index), now=0)
+    for index in range(0, 100, 2):
+        queue.remove(f'r{index}')
+    queue.reschedule('r1', now=5, interval=1)
+
+    assert queue.peek().name == 'r1'
+    assert queue.peek().deadline == 6
+    assert len(queue) == 50
+
+
+def test_non_positive_interval_is_rejected():
+    with pytest.raises(ValueError):
+        ReminderQueue().add(reminder('eyes', 0), now=0)
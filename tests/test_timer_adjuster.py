@@ -0,0 +1,35 @@
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtTest import QTest
+
+from app.schemas import TimeInterval
+from app.ui.controls.timer_adjuster import TimerAdjuster
+
+
+@pytest.fixture
+def adjuster(qt_app):
+    adjuster = TimerAdjuster(TimeInterval(0, 20, 0))
+    emitted = []
+    adjuster.seconds_updated.connect(emitted.append)
+    adjuster.emitted = emitted
+    return adjuster
+
+
+def test_click_steps_once_and_commits(adjuster):
+    QTest.mouseClick(adjuster.minutes_adjuster.increment_btn, Qt.LeftButton)
+
+    assert adjuster.interval.minutes == 21
+    assert adjuster.emitted == [21 * 60]
+
+
+def test_release_after_hold_adds_no_step(adjuster):
+    button = adjuster.minutes_adjuster.increment_btn
+    QTest.mousePress(button, Qt.LeftButton)
+    for _ in range(20):
+        button.repeat()
+    held = adjuster.interval.minutes
+    QTest.mouseRelease(button, Qt.LeftButton)
+    QTest.qWait(50)
+
+    assert adjuster.interval.minutes == held
+    assert adjuster.emitted == [held * 60]
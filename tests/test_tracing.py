@@ -0,0 +1,22 @@
+from app.services.clock import VirtualClock
+from app.services.countdown import Countdown
+from app.tracing import TraceRecorder, read_trace
+
+
+def test_transitions_reach_disk_without_close(tmp_path):
+    path = tmp_path / 'countdown.trace'
+    countdown = Countdown(VirtualClock())
+    countdown.set_interval(5)
+    recorder = TraceRecorder(str(path))
+    recorder.watch_countdown(countdown)
+
+    countdown.on_start()
+    countdown.clock.advance(3)
+    countdown.on_pause()
+
+    # Файл не закрыт, как при аварийном завершении
+    header, records = read_trace(path)
+    assert header.state == 'stopped'
+    assert [record.kind for record in records] == ['started', 'updated', 'updated', 'updated', 'paused']
+    assert records[-1].time == 3.0
+    recorder.close()